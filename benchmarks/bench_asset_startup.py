@@ -0,0 +1,143 @@
+"""Benchmark app time-to-interactive with CDN vs. bundled (local/inline) front-end assets.
+
+Serves a small app (buttons, a select, a grid and a network graph) with Voila and
+loads it in headless Chromium, timing from navigation until every widget has
+rendered. Each mode is measured with a cold browser cache (new context per run).
+
+Requires voila and playwright (pip install voila playwright && playwright install chromium),
+and bundled assets for the local/inline modes (python -m nbappinator.assets download).
+
+Usage:
+    python benchmarks/bench_asset_startup.py
+    python benchmarks/bench_asset_startup.py --modes cdn inline --runs 5
+"""
+
+import argparse
+import functools
+import http.server
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import nbformat
+
+APP_SOURCE = """
+import networkx as nx
+import pandas as pd
+import nbappinator as nbapp
+
+nbapp.configure_assets({mode!r}, base_url={base_url!r})
+
+app = nbapp.App(["Main"])
+page = app.tab("Main")
+for i in range(20):
+    page.button(f"b{{i}}", on_click=lambda app: None, label=f"Button {{i}}")
+page.select("s", options=["a", "b", "c"], default="a", label="Select")
+page.dataframe("grid", pd.DataFrame({{"x": range(1000), "y": range(1000)}}))
+page.networkx(nx.karate_club_graph(), name="graph")
+app.display()
+"""
+
+READY_JS = """() =>
+    document.querySelectorAll('.v-btn').length >= 20 &&
+    document.querySelector('.ag-root') !== null &&
+    document.querySelector('svg circle, canvas') !== null
+"""
+
+
+class _CorsHandler(http.server.SimpleHTTPRequestHandler):
+    def end_headers(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve_assets(asset_dir: Path) -> str:
+    port = free_port()
+    handler = functools.partial(_CorsHandler, directory=str(asset_dir))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{port}/"
+
+
+def write_notebook(directory: Path, mode: str, base_url: str) -> Path:
+    nb = nbformat.v4.new_notebook()
+    nb.cells.append(nbformat.v4.new_code_cell(APP_SOURCE.format(mode=mode, base_url=base_url or None)))
+    path = directory / f"startup_{mode}.ipynb"
+    nbformat.write(nb, path)
+    return path
+
+
+def wait_for_port(port: int, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.2)
+    raise TimeoutError(f"Voila did not start on port {port}")
+
+
+def measure(browser, url: str, timeout_ms: int) -> float:
+    context = browser.new_context()  # Cold cache
+    try:
+        page = context.new_page()
+        start = time.perf_counter()
+        page.goto(url, wait_until="commit")
+        page.wait_for_function(READY_JS, timeout=timeout_ms, polling=50)
+        return time.perf_counter() - start
+    finally:
+        context.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=["cdn", "local", "inline"], choices=["cdn", "local", "inline"])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--asset-dir", default=None, help="Downloaded assets (default: nbappinator/static)")
+    parser.add_argument("--timeout", type=int, default=120_000, help="Per-run timeout in ms")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    from nbappinator.assets import DEFAULT_ASSET_DIR
+
+    asset_dir = Path(args.asset_dir) if args.asset_dir else DEFAULT_ASSET_DIR
+    base_url = serve_assets(asset_dir) if "local" in args.modes else ""
+
+    print(f"{'mode':<8} {'median s':>9} {'min s':>7} {'max s':>7}")
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        browser = p.chromium.launch()
+        for mode in args.modes:
+            notebook = write_notebook(Path(tmp), mode, base_url if mode == "local" else "")
+            port = free_port()
+            voila = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-m", "voila", str(notebook), "--no-browser", f"--port={port}"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_for_port(port)
+                times = [measure(browser, f"http://127.0.0.1:{port}/", args.timeout) for _ in range(args.runs)]
+            finally:
+                voila.terminate()
+                voila.wait()
+            print(f"{mode:<8} {statistics.median(times):>9.2f} {min(times):>7.2f} {max(times):>7.2f}")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
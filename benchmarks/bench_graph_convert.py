@@ -0,0 +1,76 @@
+"""Benchmark converting graphs to NetworkGraph data at 10^5-10^7 edges.
+
+Compares the previous per-node conversion (nx_graph.degree(node) and a dict per node and
+link) with graph_arrays on a networkx graph, without and with reading edge weights, and
+on an edge list DataFrame, and times create_graph_d3(edges_df, transport="binary") end
+to end. Building the networkx graph
+is excluded; graphs above --networkx-max edges are only converted from the DataFrame,
+since networkx needs several GB for 10^7 edges.
+
+Usage:
+    python benchmarks/bench_graph_convert.py
+    python benchmarks/bench_graph_convert.py --edges 100000 1000000 --networkx-max 100000
+"""
+
+import argparse
+import time
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from nbappinator import create_graph_d3
+from nbappinator.networkgraph import graph_arrays
+
+
+def per_node(nx_graph) -> tuple:
+    """The previous create_graph_d3 conversion."""
+    nodes = [{"id": str(node), "name": str(node), "degree": nx_graph.degree(node)} for node in nx_graph.nodes()]
+    links = [{"source": str(u), "target": str(v), **data} for u, v, data in nx_graph.edges(data=True)]
+    return nodes, links
+
+
+def make_edges(edges: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    nodes = max(edges // 10, 2)
+    return pd.DataFrame(
+        {
+            "source": rng.integers(0, nodes, edges),
+            "target": rng.integers(0, nodes, edges),
+            "weight": rng.random(edges),
+        }
+    )
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edges", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--networkx-max", type=int, default=1_000_000, help="Largest graph built with networkx")
+    args = parser.parse_args()
+
+    def fmt(seconds):
+        return f"{seconds:>10.2f}" if seconds is not None else f"{'-':>10}"
+
+    print(f"{'edges':>10} {'per-node s':>10} {'nx arrays':>10} {'+ weights':>10} {'df arrays':>10} {'df binary':>10}")
+    for edges in args.edges:
+        df = make_edges(edges)
+        old = nx_arrays = nx_weights = None
+        if edges <= args.networkx_max:
+            graph = nx.from_pandas_edgelist(df, edge_attr="weight", create_using=nx.MultiGraph)
+            old = timed(lambda graph=graph: per_node(graph))
+            nx_arrays = timed(lambda graph=graph: graph_arrays(graph, with_weights=False))
+            nx_weights = timed(lambda graph=graph: graph_arrays(graph))
+            del graph
+        df_arrays = timed(lambda df=df: graph_arrays(df))
+        df_binary = timed(lambda df=df: create_graph_d3(df, transport="binary"))
+        print(f"{edges:>10} {fmt(old)} {fmt(nx_arrays)} {fmt(nx_weights)} {fmt(df_arrays)} {fmt(df_binary)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark NetworkGraph frame rate per renderer for graphs of 1k/10k/100k edges.
+
+Serves a notebook with one graph (edges / 2 nodes, random edges) with Voila, waits until
+it has drawn, then counts animation frames while the force simulation runs, and while
+the pointer sweeps across the graph (hover hit-testing). Frame rate includes the d3
+simulation itself, which is the same for every renderer.
+
+Requires voila and playwright (pip install voila playwright && playwright install chromium).
+
+Usage:
+    python benchmarks/bench_graph_render.py
+    python benchmarks/bench_graph_render.py --edges 1000 10000 --renderers svg canvas --seconds 10
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import nbformat
+from bench_asset_startup import free_port, wait_for_port
+
+APP_SOURCE = """
+import networkx as nx
+import nbappinator as nbapp
+
+graph = nx.gnm_random_graph({edges} // 2, {edges}, seed=0)
+nbapp.create_graph_d3(graph, renderer="{renderer}", show_labels=False, width=1000, height=800)
+"""
+
+READY_JS = """() =>
+    document.querySelector('.nbapp-network-graph canvas, .nbapp-network-graph circle') !== null
+"""
+
+# Counts requestAnimationFrame callbacks over the window
+FPS_JS = """(ms) => new Promise(resolve => {
+    let frames = 0;
+    const start = performance.now();
+    function tick(now) {
+        frames++;
+        if (now - start < ms) requestAnimationFrame(tick);
+        else resolve(frames * 1000 / (now - start));
+    }
+    requestAnimationFrame(tick);
+})"""
+
+
+def measure(page, seconds: float, hover: bool) -> float:
+    fps = page.evaluate_handle(FPS_JS, seconds * 1000)
+    if hover:
+        box = page.locator(".nbapp-network-graph").bounding_box()
+        steps = int(seconds * 20)
+        for i in range(steps):
+            page.mouse.move(box["x"] + box["width"] * (i + 0.5) / steps, box["y"] + box["height"] / 2)
+            page.wait_for_timeout(50)
+    return fps.json_value()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edges", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--renderers", nargs="+", default=["svg", "canvas", "webgl"])
+    parser.add_argument("--seconds", type=float, default=5.0, help="Measurement window")
+    parser.add_argument("--timeout", type=int, default=600_000, help="Render timeout in ms")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    print(f"{'edges':>8} {'renderer':>9} {'fps':>6} {'hover fps':>10}")
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        browser = p.chromium.launch(args=["--use-gl=angle", "--use-angle=swiftshader"])
+        for edges in args.edges:
+            for renderer in args.renderers:
+                nb = nbformat.v4.new_notebook()
+                nb.cells.append(nbformat.v4.new_code_cell(APP_SOURCE.format(edges=edges, renderer=renderer)))
+                notebook = Path(tmp) / f"graph_{edges}_{renderer}.ipynb"
+                nbformat.write(nb, notebook)
+
+                port = free_port()
+                voila = subprocess.Popen(  # noqa: S603
+                    [sys.executable, "-m", "voila", str(notebook), "--no-browser", f"--port={port}"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                context = browser.new_context(viewport={"width": 1200, "height": 1000})
+                try:
+                    wait_for_port(port)
+                    page = context.new_page()
+                    page.goto(f"http://127.0.0.1:{port}/")
+                    page.wait_for_function(READY_JS, timeout=args.timeout, polling=100)
+                    fps = measure(page, args.seconds, hover=False)
+                    hover_fps = measure(page, args.seconds, hover=True)
+                finally:
+                    context.close()
+                    voila.terminate()
+                    voila.wait()
+                print(f"{edges:>8} {renderer:>9} {fps:>6.1f} {hover_fps:>10.1f}")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark peak memory used by create_grid on a large DataFrame.
+
+Two measurements:
+
+- Peak RSS of the default create_grid path (client row model, rows serialized for the
+  browser), each case in a fresh subprocess so earlier peaks don't mask later ones.
+  RSS growth over the process's peak after building the frame is reported, from
+  resource.getrusage (Unix only).
+- Peak tracemalloc allocation with row_model="server", where no rows are serialized,
+  isolating create_grid's own handling of the frame (column flattening, index
+  materialization). tracemalloc includes NumPy data buffers.
+
+A full input_df.copy() is shown for reference in both.
+
+Usage:
+    python benchmarks/bench_grid_memory.py
+    python benchmarks/bench_grid_memory.py --rows 10000000 --cols 20
+"""
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from nbappinator.aggrid_anywidget import RowModelType
+
+
+def make_frame(rows: int, cols: int) -> pd.DataFrame:
+    return pd.DataFrame(np.zeros((rows, cols)), columns=pd.MultiIndex.from_product([["x"], range(cols)]))
+
+
+def grid_cases(df: pd.DataFrame, row_model: "RowModelType") -> dict:
+    from nbappinator import create_grid
+
+    return {
+        "input_df.copy() (reference)": lambda: df.copy(),
+        "create_grid": lambda: create_grid(df, row_model=row_model),
+        "create_grid showindex=True": lambda: create_grid(df, row_model=row_model, showindex=True),
+    }
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1e6 if sys.platform == "darwin" else rss / 1e3  # Bytes on macOS, KB on Linux
+
+
+def run_rss_case(rows: int, cols: int, label: str) -> None:
+    """Child process: print peak RSS growth and seconds for one case."""
+    df = make_frame(rows, cols)
+    func = grid_cases(df, "client")[label]
+    gc.collect()
+    before = max_rss_mb()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(max_rss_mb() - before, elapsed)
+    del result
+
+
+def peak_mb(func) -> tuple:
+    gc.collect()
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    del result
+    return (peak - current) / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--rss-case", help=argparse.SUPPRESS)  # Internal: run one RSS case in this process
+    args = parser.parse_args()
+
+    if args.rss_case:
+        run_rss_case(args.rows, args.cols, args.rss_case)
+        return
+
+    df = make_frame(args.rows, args.cols)
+    frame_mb = df.memory_usage(index=True, deep=False).sum() / 1e6
+    print(f"frame: {args.rows} rows x {args.cols} cols, {frame_mb:.1f} MB")
+
+    print("\nPeak RSS growth, default row model (rows serialized)")
+    print(f"{'case':<30} {'peak MB':>9} {'seconds':>9}")
+    for label in grid_cases(df, "client"):
+        out = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, "--rows", str(args.rows), "--cols", str(args.cols), "--rss-case", label],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        mb, elapsed = map(float, out.stdout.split()[-2:])
+        print(f"{label:<30} {mb:>9.1f} {elapsed:>9.3f}")
+
+    print('\nPeak tracemalloc allocation, row_model="server" (no rows serialized)')
+    print(f"{'case':<30} {'peak MB':>9} {'seconds':>9}")
+    tracemalloc.start()
+    for label, func in grid_cases(df, "server").items():
+        mb, elapsed = peak_mb(func)
+        print(f"{label:<30} {mb:>9.1f} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
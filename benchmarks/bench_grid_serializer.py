@@ -0,0 +1,67 @@
+"""Benchmark the columnar grid serializer against to_dict + json.dumps(default=str).
+
+Times each serializer on single-dtype frames so the per-dtype cost is visible.
+
+Usage:
+    python benchmarks/bench_grid_serializer.py
+    python benchmarks/bench_grid_serializer.py --rows 1000000
+"""
+
+import argparse
+import decimal
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from nbappinator.aggrid_serialize import dataframe_to_json
+
+
+def records_json(df: pd.DataFrame) -> str:
+    """The previous create_grid serialization path."""
+    return json.dumps(df.to_dict(orient="records"), default=str)
+
+
+def make_frames(rows: int) -> dict:
+    rng = np.random.default_rng(0)
+    floats = rng.normal(size=rows)
+    floats[rng.random(rows) < 0.1] = np.nan
+    return {
+        "int64": pd.DataFrame({"c": rng.integers(0, 1_000_000, rows)}),
+        "float64 (10% NaN)": pd.DataFrame({"c": floats}),
+        "datetime64": pd.DataFrame(
+            {"c": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10**9, rows), unit="s")}
+        ),
+        "string": pd.DataFrame({"c": rng.choice([f"TCK{i}" for i in range(500)], rows).astype(object)}),
+        "category": pd.DataFrame({"c": pd.Categorical(rng.choice(["USD", "EUR", "JPY", "GBP"], rows))}),
+        "decimal": pd.DataFrame({"c": [decimal.Decimal(int(v)) / 100 for v in rng.integers(0, 10**6, rows)]}),
+    }
+
+
+def best_of(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'dtype':<20} {'records s':>10} {'columnar s':>11} {'speedup':>8} {'records MB':>11} {'columnar MB':>12}")
+    for label, df in make_frames(args.rows).items():
+        old = best_of(lambda df=df: records_json(df), args.repeat)
+        new = best_of(lambda df=df: dataframe_to_json(df), args.repeat)
+        old_mb = len(records_json(df)) / 1e6
+        new_mb = len(dataframe_to_json(df)) / 1e6
+        print(f"{label:<20} {old:>10.3f} {new:>11.3f} {old / new:>7.1f}x {old_mb:>11.1f} {new_mb:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark create_grid row data serialization: JSON vs Arrow IPC transport.
+
+Each measurement runs in a fresh subprocess so that peak RSS reflects a single
+create_grid call.
+
+Usage:
+    python benchmarks/bench_grid_transport.py
+    python benchmarks/bench_grid_transport.py --rows 10000 100000 500000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from nbappinator.aggrid_anywidget import TransportType
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "ticker": rng.choice([f"TCK{i}" for i in range(500)], rows),
+            "desk": rng.choice(["Rates", "Credit", "FX", "Equities"], rows),
+            "qty": rng.integers(-10_000, 10_000, rows),
+            "price": rng.random(rows) * 100,
+            "pnl": rng.normal(0, 1e5, rows),
+            "trade_date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        }
+    )
+
+
+def measure(transport: "TransportType", rows: int) -> dict:
+    from nbappinator import create_grid
+
+    df = make_frame(rows)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    grid = create_grid(df, transport=transport)
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    payload = len(grid.row_data_buffer) if transport == "arrow" else len(grid.row_data.encode())
+    return {
+        "transport": transport,
+        "rows": rows,
+        "seconds": elapsed,
+        "peak_rss_delta_mb": (rss_after - rss_before) / 1024,
+        "payload_mb": payload / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--single", nargs=2, metavar=("TRANSPORT", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(measure(cast("TransportType", args.single[0]), int(args.single[1]))))
+        return
+
+    print(f"{'transport':>9} {'rows':>9} {'seconds':>9} {'peak MB':>9} {'payload MB':>11}")
+    for rows in args.rows:
+        for transport in ("json", "arrow"):
+            out = subprocess.run(  # noqa: S603
+                [sys.executable, __file__, "--single", transport, str(rows)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{r['transport']:>9} {r['rows']:>9} {r['seconds']:>9.3f} "
+                f"{r['peak_rss_delta_mb']:>9.1f} {r['payload_mb']:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
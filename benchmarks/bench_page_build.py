@@ -0,0 +1,62 @@
+"""Benchmark building a large page: one-by-one additions vs. App.hold_sync().
+
+Adds N labels and N small grids to a tab and reports the build time and the number
+and size of children updates the container would sync to the front end (each
+update carries the full children list, so one-by-one building sends O(N^2) bytes).
+
+Usage:
+    python benchmarks/bench_page_build.py
+    python benchmarks/bench_page_build.py --widgets 100 1000 --no-grids
+"""
+
+import argparse
+import json
+import time
+
+import pandas as pd
+
+import nbappinator as nbapp
+
+
+def build(count: int, grids: bool, batched: bool) -> tuple:
+    app = nbapp.App(["Main"])
+    page = app.tab("Main")
+    updates = []
+    page._widget.observe(lambda change: updates.append(len(change["new"])), names=["children"])
+    df = pd.DataFrame({"x": range(10), "y": range(10)})
+
+    def add():
+        for i in range(count):
+            page.label(f"Label {i}")
+            if grids:
+                page.dataframe(f"grid{i}", df)
+
+    start = time.perf_counter()
+    if batched:
+        with app.hold_sync():
+            add()
+    else:
+        add()
+    elapsed = time.perf_counter() - start
+    # Serialized children state: one "IPY_MODEL_<32 hex>" reference per child
+    ref = json.dumps("IPY_MODEL_" + "0" * 32)
+    sync_bytes = sum(n * (len(ref) + 2) for n in updates)
+    return elapsed, len(updates), sync_bytes / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--widgets", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--no-grids", action="store_true", help="Labels only")
+    args = parser.parse_args()
+
+    print(f"{'widgets':>8} {'mode':<10} {'build s':>8} {'updates':>8} {'sync MB':>8}")
+    for count in args.widgets:
+        for batched in (False, True):
+            elapsed, updates, mb = build(count, not args.no_grids, batched)
+            mode = "hold_sync" if batched else "one-by-one"
+            print(f"{count:>8} {mode:<10} {elapsed:>8.2f} {updates:>8} {mb:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
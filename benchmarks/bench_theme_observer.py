@@ -0,0 +1,96 @@
+"""Benchmark idle browser work caused by theme change detection in apps with many widgets.
+
+Serves an app of N Vuetify controls with Voila, waits until it has rendered, then
+samples Chrome DevTools Performance metrics over an idle window: style recalculations,
+layouts and their durations, plus script time. Also reports the page-wide theme
+service counters (window.__NBAPP_THEME__.stats) when present.
+
+Run it on an older checkout for the "before" numbers: there, every widget polls
+detectTheme() on its own 500 ms timer.
+
+Requires voila and playwright (pip install voila playwright && playwright install chromium).
+
+Usage:
+    python benchmarks/bench_theme_observer.py
+    python benchmarks/bench_theme_observer.py --controls 100 500 --idle 20
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import nbformat
+from bench_asset_startup import free_port, wait_for_port
+from bench_vuetify_mount import APP_SOURCE, READY_JS
+
+METRICS = ["RecalcStyleCount", "RecalcStyleDuration", "LayoutCount", "LayoutDuration", "ScriptDuration"]
+
+
+def idle_metrics(page, cdp, seconds: float) -> dict:
+    def sample():
+        return {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}
+
+    before = sample()
+    page.wait_for_timeout(seconds * 1000)
+    after = sample()
+    return {name: after.get(name, 0) - before.get(name, 0) for name in METRICS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--controls", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--idle", type=float, default=10.0, help="Idle window in seconds")
+    parser.add_argument("--timeout", type=int, default=300_000, help="Render timeout in ms")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    print(
+        f"{'controls':>8} {'recalcs/s':>10} {'recalc ms/s':>12} {'layouts/s':>10} "
+        f"{'script ms/s':>12} {'theme checks':>13}"
+    )
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        browser = p.chromium.launch()
+        for controls in args.controls:
+            nb = nbformat.v4.new_notebook()
+            nb.cells.append(nbformat.v4.new_code_cell(APP_SOURCE.format(controls=max(controls, 4))))
+            notebook = Path(tmp) / f"theme_{controls}.ipynb"
+            nbformat.write(nb, notebook)
+
+            port = free_port()
+            voila = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-m", "voila", str(notebook), "--no-browser", f"--port={port}"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            context = browser.new_context()
+            try:
+                wait_for_port(port)
+                page = context.new_page()
+                page.goto(f"http://127.0.0.1:{port}/")
+                page.wait_for_function(READY_JS, arg=controls // 4 * 3, timeout=args.timeout, polling=100)
+                page.wait_for_timeout(2000)  # Let mount-time work settle
+                cdp = context.new_cdp_session(page)
+                cdp.send("Performance.enable")
+                checks_before = page.evaluate("() => window.__NBAPP_THEME__?.stats.checks ?? null")
+                delta = idle_metrics(page, cdp, args.idle)
+                checks_after = page.evaluate("() => window.__NBAPP_THEME__?.stats.checks ?? null")
+            finally:
+                context.close()
+                voila.terminate()
+                voila.wait()
+
+            checks = "n/a" if checks_before is None else f"{(checks_after - checks_before) / args.idle:.1f}/s"
+            print(
+                f"{controls:>8} {delta['RecalcStyleCount'] / args.idle:>10.1f} "
+                f"{delta['RecalcStyleDuration'] * 1000 / args.idle:>12.2f} "
+                f"{delta['LayoutCount'] / args.idle:>10.1f} "
+                f"{delta['ScriptDuration'] * 1000 / args.idle:>12.2f} {checks:>13}"
+            )
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark Vuetify control mount time and JS heap for apps with 10/100/500 controls.
+
+Serves an app of N controls (buttons, selects, text fields and labels in equal parts)
+with Voila and loads it in headless Chromium, timing from navigation until every
+control has rendered, then reading the JS heap size via the Chrome DevTools Protocol.
+Library loading is excluded by warming the browser cache with a first, untimed load.
+
+Requires voila and playwright (pip install voila playwright && playwright install chromium).
+
+Usage:
+    python benchmarks/bench_vuetify_mount.py
+    python benchmarks/bench_vuetify_mount.py --controls 10 100 500 1000 --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import nbformat
+from bench_asset_startup import free_port, wait_for_port
+
+APP_SOURCE = """
+import nbappinator as nbapp
+
+app = nbapp.App(["Main"])
+page = app.tab("Main")
+for i in range({controls} // 4):
+    page.button(f"b{{i}}", on_click=lambda app: None, label=f"Button {{i}}")
+    page.select(f"s{{i}}", options=["a", "b", "c"], default="a", label=f"Select {{i}}")
+    page.text(f"t{{i}}", label=f"Text {{i}}")
+    page.label(f"Label {{i}}")
+app.display()
+"""
+
+# Buttons + fields: every control has rendered its Vuetify component
+READY_JS = """(n) =>
+    document.querySelectorAll('.v-btn').length + document.querySelectorAll('.v-field').length >= n
+"""
+
+
+def measure(context, url: str, controls: int, timeout_ms: int) -> tuple:
+    page = context.new_page()
+    try:
+        start = time.perf_counter()
+        page.goto(url, wait_until="commit")
+        page.wait_for_function(READY_JS, arg=controls // 4 * 3, timeout=timeout_ms, polling=20)
+        elapsed = time.perf_counter() - start
+        cdp = context.new_cdp_session(page)
+        cdp.send("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}
+        return elapsed, metrics.get("JSHeapUsedSize", 0) / 1e6
+    finally:
+        page.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--controls", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--timeout", type=int, default=300_000, help="Per-run timeout in ms")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    print(f"{'controls':>8} {'median s':>9} {'min s':>7} {'heap MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        browser = p.chromium.launch()
+        for controls in args.controls:
+            nb = nbformat.v4.new_notebook()
+            nb.cells.append(nbformat.v4.new_code_cell(APP_SOURCE.format(controls=max(controls, 4))))
+            notebook = Path(tmp) / f"controls_{controls}.ipynb"
+            nbformat.write(nb, notebook)
+
+            port = free_port()
+            voila = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-m", "voila", str(notebook), "--no-browser", f"--port={port}"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            context = browser.new_context()
+            try:
+                wait_for_port(port)
+                url = f"http://127.0.0.1:{port}/"
+                measure(context, url, controls, args.timeout)  # Warm the library cache
+                results = [measure(context, url, controls, args.timeout) for _ in range(args.runs)]
+            finally:
+                context.close()
+                voila.terminate()
+                voila.wait()
+            times = [t for t, _ in results]
+            heap = statistics.median(h for _, h in results)
+            print(f"{controls:>8} {statistics.median(times):>9.2f} {min(times):>7.2f} {heap:>8.1f}")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
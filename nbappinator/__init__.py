@@ -12,9 +12,14 @@ from .aggrid_anywidget import (
     unregister_grid_renderer,
 )
 from .app import App, Page
+from .assets import configure_assets, download_assets
 from .browser_title import BrowserTitle
+from .callbacks import CancelToken
+from .graph_layout import compute_layout
 from .graphvizgraph import GraphvizGraph, LayoutEngine, create_graphviz, networkx_to_dot
+from .memo import memoize
 from .networkgraph import NetworkGraph, create_graph_d3
+from .vuetify3 import OutputHandler
 
 __all__ = [
     "__version__",
@@ -22,6 +27,9 @@ __all__ = [
     "App",
     "Page",
     "BrowserTitle",
+    "CancelToken",
+    "configure_assets",
+    "download_assets",
     "FORMAT_DEFAULT",
     "FORMAT_DECIMAL",
     "FORMAT_PERCENT",
@@ -31,8 +39,11 @@ __all__ = [
     "register_grid_renderer",
     "unregister_grid_renderer",
     "NetworkGraph",
+    "OutputHandler",
     "create_grid",
+    "memoize",
     "create_graph_d3",
+    "compute_layout",
     "GraphvizGraph",
     "LayoutEngine",
     "create_graphviz",
@@ -1,15 +1,39 @@
 """AG Grid implementation using anywidget (no ipyaggrid dependency)."""
 
 import json
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import logging
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, cast
 
-import anywidget
+import numpy as np
 import pandas as pd
 import traitlets
 
+from .aggrid_query import GridQueryEngine
+from .aggrid_serialize import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    CompressionType,
+    DictionaryEncode,
+    compress_payload,
+    dataframe_to_arrow_ipc,
+    dataframe_to_columns,
+    dataframe_to_json,
+)
+from .assets import ASSET_LOADER_JS, AssetWidget
+
 # Default AG Grid version
 DEFAULT_AGGRID_VERSION = "latest"
 
+# Default Apache Arrow JS version (only loaded when transport="arrow")
+DEFAULT_ARROW_VERSION = "latest"
+
+# Row data transports
+TransportType = Literal["json", "arrow"]
+
+# Row models: "client" sends all rows to the browser, "server" keeps them in the kernel
+RowModelType = Literal["client", "server"]
+
+logger = logging.getLogger(__name__)
+
 # Built-in format types
 FORMAT_DEFAULT = "default"
 FORMAT_DECIMAL = "decimal"
@@ -17,10 +41,17 @@ FORMAT_PERCENT = "percent"
 FORMAT_MAG_SI = "mag_si"
 
 
-class AGGridWidget(anywidget.AnyWidget):
+class AGGridWidget(AssetWidget):
     """AG Grid widget using anywidget and AG Grid Community via CDN."""
 
     row_data = traitlets.Unicode("[]").tag(sync=True)
+    row_data_buffer = traitlets.Bytes(b"").tag(sync=True)  # Arrow IPC stream, or the compressed payload
+    row_data_compression = traitlets.Unicode("").tag(sync=True)  # "gzip"/"deflate" when row_data_buffer is compressed
+    transport = traitlets.Unicode("json").tag(sync=True)  # "json" or "arrow"
+    row_model = traitlets.Unicode("client").tag(sync=True)  # "client" or "server" (rows fetched from kernel)
+    stream_chunk_size = traitlets.Int(0).tag(sync=True)  # > 0: row_data holds the first chunk, the rest is streamed
+    compression = traitlets.Unicode("")  # Compress row payloads serialized from df: "", "gzip" or "deflate"
+    compression_threshold = traitlets.Int(DEFAULT_COMPRESSION_THRESHOLD)  # Smallest payload (bytes) to compress
     column_defs = traitlets.Unicode("[]").tag(sync=True)
     grid_options = traitlets.Unicode("{}").tag(sync=True)
     pinned_top_rows = traitlets.Unicode("[]").tag(sync=True)
@@ -47,8 +78,13 @@ class AGGridWidget(anywidget.AnyWidget):
     # Selection
     select_mode = traitlets.Unicode("single").tag(sync=True)
 
+    # Row identity for delta updates (add_rows/update_rows/remove_rows)
+    row_id = traitlets.Unicode("").tag(sync=True)
+    async_transactions = traitlets.Bool(False).tag(sync=True)  # Batch deltas with applyTransactionAsync
+
     # AG Grid version
     aggrid_version = traitlets.Unicode(DEFAULT_AGGRID_VERSION).tag(sync=True)
+    arrow_version = traitlets.Unicode(DEFAULT_ARROW_VERSION).tag(sync=True)
 
     # Enterprise mode
     enterprise = traitlets.Bool(False).tag(sync=True)
@@ -58,7 +94,9 @@ class AGGridWidget(anywidget.AnyWidget):
     selected_rows = traitlets.Unicode("[]").tag(sync=True)
     clicked_cell = traitlets.Unicode("{}").tag(sync=True)
 
-    _esm = """
+    _esm = (
+        ASSET_LOADER_JS
+        + """
     function injectNotebookStyles(isDark) {
         const styleId = 'ag-grid-notebook-fix';
         if (document.getElementById(styleId)) return;  // Already injected
@@ -195,6 +233,207 @@ class AGGridWidget(anywidget.AnyWidget):
         });
     }
 
+    // Format epoch milliseconds like pandas' str(Timestamp): "2024-01-31 09:30:00[.123]"
+    function formatDateTime(ms) {
+        const iso = new Date(ms).toISOString();
+        const millis = iso.slice(20, 23);
+        return iso.slice(0, 10) + " " + iso.slice(11, 19) + (millis === "000" ? "" : "." + millis);
+    }
+
+    // Zip a column-oriented payload (aggrid_serialize.dataframe_to_columns) into row objects.
+    // Plain arrays of records are passed through unchanged.
+    function zipColumns(payload) {
+        if (Array.isArray(payload)) return payload;
+        const rows = new Array(payload.length);
+        for (let r = 0; r < payload.length; r++) rows[r] = {};
+        for (const col of payload.columns) {
+            let values = col.values;
+            if (col.dictionary) {
+                const dictionary = col.dictionary;
+                values = col.codes.map(code => code < 0 ? null : dictionary[code]);
+            }
+            if (col.type === "datetime") {
+                values = values.map(v => v == null ? null : formatDateTime(v));
+            }
+            const name = col.name;
+            for (let r = 0; r < rows.length; r++) rows[r][name] = values[r];
+        }
+        return rows;
+    }
+
+    function parseRows(text) {
+        return zipColumns(JSON.parse(text));
+    }
+
+    // Inflate a gzip/deflate payload with the browser's native DecompressionStream
+    async function decompress(dataView, format) {
+        const stream = new Blob([dataView]).stream().pipeThrough(new DecompressionStream(format));
+        return new Uint8Array(await new Response(stream).arrayBuffer());
+    }
+
+    // Decode an Arrow IPC stream (a DataView from anywidget's binary buffer channel) into row objects
+    async function decodeArrowRows(model, dataView) {
+        if (!dataView || dataView.byteLength === 0) return [];
+        const version = model.get("arrow_version") || "latest";
+        const arrow = await loadAsset(model, "apache-arrow", `https://cdn.jsdelivr.net/npm/apache-arrow@${version}/+esm`);
+        const bytes = new Uint8Array(dataView.buffer, dataView.byteOffset, dataView.byteLength);
+        const table = arrow.tableFromIPC(bytes);
+        const columns = table.schema.fields.map((field, i) => ({
+            name: field.name,
+            vector: table.getChildAt(i),
+            isTimestamp: arrow.DataType.isTimestamp(field.type),
+            isDate: arrow.DataType.isDate(field.type),  // Shown as the JSON transport shows dates: YYYY-MM-DD
+        }));
+
+        const numRows = table.numRows;
+        const rows = new Array(numRows);
+        for (let r = 0; r < numRows; r++) {
+            const row = {};
+            for (const col of columns) {
+                let v = col.vector.get(r);
+                if (typeof v === "bigint") v = Number(v);
+                if (v instanceof Date) v = v.getTime();  // Older Arrow JS versions return Dates
+                if (v != null && col.isTimestamp) v = formatDateTime(Number(v));
+                if (v != null && col.isDate) v = formatDateTime(Number(v)).slice(0, 10);
+                row[col.name] = v;
+            }
+            rows[r] = row;
+        }
+        return rows;
+    }
+
+    // Decode rows sent as JSON text or as a binary buffer (Arrow IPC and/or compressed)
+    async function decodeRows(model, transport, compression, text, buffer) {
+        if (compression) {
+            const bytes = await decompress(buffer, compression);
+            if (transport !== "arrow") return parseRows(new TextDecoder().decode(bytes));
+            buffer = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        }
+        if (transport === "arrow") {
+            return decodeArrowRows(model, buffer);
+        }
+        return parseRows(text);
+    }
+
+    // Read row data from the model using the configured transport
+    async function loadRowData(model) {
+        return decodeRows(
+            model,
+            model.get("transport"),
+            model.get("row_data_compression"),
+            model.get("row_data"),
+            model.get("row_data_buffer"),
+        );
+    }
+
+    // Infinite row model datasource for row_model="server": blocks are requested from the kernel
+    function createKernelDatasource(model) {
+        const viewId = Math.random().toString(36).slice(2);  // Responses are broadcast to every view
+        const pending = new Map();
+        let nextRequest = 0;
+
+        const onMessage = (msg) => {
+            if (!msg || msg.type !== "rows") return;
+            const params = pending.get(msg.request_id);
+            if (!params) return;
+            pending.delete(msg.request_id);
+            if (msg.error) {
+                console.error("AG Grid server row model error:", msg.error);
+                params.failCallback();
+            } else {
+                params.successCallback(parseRows(msg.payload), msg.row_count);
+            }
+        };
+        model.on("msg:custom", onMessage);
+
+        return {
+            getRows(params) {
+                const requestId = `${viewId}:${nextRequest++}`;
+                pending.set(requestId, params);
+                model.send({
+                    type: "get_rows",
+                    request_id: requestId,
+                    start_row: params.startRow,
+                    end_row: params.endRow,
+                    sort_model: params.sortModel || [],
+                    filter_model: params.filterModel || {},
+                });
+            },
+            // The view is destroyed: stop handling responses
+            dispose() {
+                model.off("msg:custom", onMessage);
+                pending.clear();
+            },
+        };
+    }
+
+    function setRowData(gridApi, rows) {
+        if (gridApi.setGridOption) {
+            gridApi.setGridOption("rowData", rows);
+        } else if (gridApi.setRowData) {
+            gridApi.setRowData(rows);
+        }
+    }
+
+    // Progressive loading for stream=True: after the first chunk renders, pull the remaining
+    // rows from the kernel one chunk at a time and append them. Chunks are requested by offset,
+    // so each stream is a generation: responses to an earlier generation are ignored.
+    function createRowStreamer(model, gridApi) {
+        const viewId = Math.random().toString(36).slice(2);  // Chunks are broadcast to every view
+        let generation = 0;
+        let active = false;
+        let replace = false;  // The next chunk replaces the grid's rows instead of appending
+
+        const requestId = () => `${viewId}:${generation}`;
+        const request = (offset) => model.send({ type: "get_chunk", request_id: requestId(), offset: offset });
+
+        const onMessage = async (msg, buffers) => {
+            if (!msg || msg.type !== "chunk" || msg.request_id !== requestId()) return;
+            const rows = await decodeRows(model, msg.transport, msg.compression, msg.payload, buffers && buffers[0]);
+            if (msg.request_id !== requestId()) return;  // Restarted while decoding
+            if (replace) {
+                replace = false;
+                setRowData(gridApi, rows);
+            } else if (rows.length > 0) {
+                gridApi.applyTransaction({ add: rows });
+            }
+            if (msg.done) {
+                active = false;
+            } else {
+                request(msg.next_offset);
+            }
+        };
+        model.on("msg:custom", onMessage);
+
+        return {
+            get active() {
+                return active;
+            },
+            // (Re)start streaming after the rows already loaded; supersedes any stream in flight
+            restart(offset) {
+                generation++;
+                active = true;
+                replace = false;
+                request(offset);
+            },
+            // Rows changed in the kernel mid-stream: offsets no longer match what this view has
+            // loaded (added rows would arrive twice, rows after a removal would be skipped), so
+            // stream again from the first row
+            reload() {
+                generation++;
+                active = true;
+                replace = true;
+                request(0);
+            },
+            // The view is destroyed: stop streaming, and drop chunks still being decoded
+            dispose() {
+                generation++;
+                active = false;
+                model.off("msg:custom", onMessage);
+            },
+        };
+    }
+
     export default {
         async render({ model, el }) {
             const version = model.get("aggrid_version") || "latest";
@@ -216,7 +455,7 @@ class AGGridWidget(anywidget.AnyWidget):
                 let createGrid, themeQuartz, colorSchemeDark, colorSchemeLight;
 
                 if (isEnterprise) {
-                    const ag = await import(`https://cdn.jsdelivr.net/npm/ag-grid-enterprise@${version}/+esm`);
+                    const ag = await loadAsset(model, "ag-grid-enterprise", `https://cdn.jsdelivr.net/npm/ag-grid-enterprise@${version}/+esm`);
                     createGrid = ag.createGrid;
                     themeQuartz = ag.themeQuartz;
                     colorSchemeDark = ag.colorSchemeDark;
@@ -229,7 +468,7 @@ class AGGridWidget(anywidget.AnyWidget):
                         ag.LicenseManager.setLicenseKey(licenseKey);
                     }
                 } else {
-                    const ag = await import(`https://cdn.jsdelivr.net/npm/ag-grid-community@${version}/+esm`);
+                    const ag = await loadAsset(model, "ag-grid-community", `https://cdn.jsdelivr.net/npm/ag-grid-community@${version}/+esm`);
                     createGrid = ag.createGrid;
                     themeQuartz = ag.themeQuartz;
                     colorSchemeDark = ag.colorSchemeDark;
@@ -265,11 +504,15 @@ class AGGridWidget(anywidget.AnyWidget):
                 const selectMode = model.get("select_mode");
                 const autoSizeColumns = model.get("auto_size_columns");
                 const sizeColumnsToFit = model.get("size_columns_to_fit");
+                const rowIdCol = model.get("row_id");
+                const isServer = model.get("row_model") === "server";
+                let datasource = null;
+                let destroyed = false;
 
-                const rowData = JSON.parse(model.get("row_data"));
+                const rowData = isServer ? null : await loadRowData(model);
                 const rawColumnDefs = JSON.parse(model.get("column_defs"));
                 const columnDefs = processColumnDefs(rawColumnDefs);
-                const pinnedTopRows = JSON.parse(model.get("pinned_top_rows"));
+                const pinnedTopRows = parseRows(model.get("pinned_top_rows"));
                 const extraOptions = JSON.parse(model.get("grid_options"));
 
                 // Clear loading message and create container
@@ -283,7 +526,7 @@ class AGGridWidget(anywidget.AnyWidget):
                 el.style.width = width;
 
                 const container = document.createElement("div");
-                if (!autoHeight) {
+                if (!autoHeight || isServer) {
                     container.style.height = `${height}px`;
                 }
                 container.style.width = "100%";
@@ -302,7 +545,7 @@ class AGGridWidget(anywidget.AnyWidget):
                 const gridOptions = {
                     theme: gridTheme,
                     themeStyleContainer: container,  // Inject CSS into container for Jupyter isolation
-                    domLayout: autoHeight ? 'autoHeight' : 'normal',
+                    domLayout: autoHeight && !isServer ? 'autoHeight' : 'normal',
                     rowData: rowData,
                     columnDefs: columnDefs,
                     defaultColDef: {
@@ -342,6 +585,23 @@ class AGGridWidget(anywidget.AnyWidget):
                     gridOptions.pinnedTopRowData = pinnedTopRows;
                 }
 
+                if (isServer) {
+                    // Filters are evaluated in the kernel; give numeric columns a number filter
+                    gridOptions.columnDefs = columnDefs.map(col =>
+                        col.type === "numericColumn" && (col.filter === undefined || col.filter === true)
+                            ? { ...col, filter: "agNumberColumnFilter" }
+                            : col
+                    );
+                    delete gridOptions.rowData;
+                    gridOptions.rowModelType = "infinite";
+                    datasource = gridOptions.datasource = createKernelDatasource(model);
+                }
+
+                // Stable row ids let transactions (and rowData updates) keep scroll, sort and selection
+                if (rowIdCol) {
+                    gridOptions.getRowId = (params) => String(params.data[rowIdCol]);
+                }
+
                 if (isTree) {
                     if (!isEnterprise) {
                         // Tree Data is an Enterprise feature - show warning
@@ -369,6 +629,11 @@ class AGGridWidget(anywidget.AnyWidget):
                 // Create grid
                 const gridApi = createGrid(container, gridOptions);
 
+                const streamer = !isServer && model.get("stream_chunk_size") > 0
+                    ? createRowStreamer(model, gridApi)
+                    : null;
+                if (streamer) streamer.restart(rowData.length);
+
                 // Size columns after data renders
                 setTimeout(() => {
                     if (gridApi) {
@@ -438,9 +703,10 @@ class AGGridWidget(anywidget.AnyWidget):
                     }
                 });
 
-                document.addEventListener("click", () => {
+                const hideContextMenu = () => {
                     contextMenu.style.display = "none";
-                });
+                };
+                document.addEventListener("click", hideContextMenu);
 
                 contextMenu.addEventListener("click", (e) => {
                     const action = e.target.dataset.action;
@@ -465,18 +731,59 @@ class AGGridWidget(anywidget.AnyWidget):
                     contextMenu.style.display = "none";
                 });
 
-                // Handle data updates
-                model.on("change:row_data", () => {
-                    const newData = JSON.parse(model.get("row_data"));
-                    if (gridApi.setGridOption) {
-                        gridApi.setGridOption("rowData", newData);
-                    } else if (gridApi.setRowData) {
-                        gridApi.setRowData(newData);
+                // Handle data updates. row_data and row_data_buffer can change in the same
+                // update (both events fire synchronously): reload once
+                let reloadQueued = false;
+                const onRowDataChange = () => {
+                    if (reloadQueued) return;
+                    reloadQueued = true;
+                    queueMicrotask(async () => {
+                        reloadQueued = false;
+                        const newData = await loadRowData(model);
+                        if (destroyed) return;
+                        setRowData(gridApi, newData);
+                        if (streamer) streamer.restart(newData.length);
+                    });
+                };
+                model.on("change:row_data", onRowDataChange);
+                model.on("change:row_data_buffer", onRowDataChange);
+
+                // Delta updates from AGGridWidget.add_rows/update_rows/remove_rows
+                const onTransaction = (msg) => {
+                    if (msg && msg.type === "refresh" && gridApi.refreshInfiniteCache) {
+                        gridApi.refreshInfiniteCache();
+                        return;
                     }
-                });
+                    if (!msg || msg.type !== "transaction") return;
+                    if (streamer && streamer.active) {
+                        // The rest of the stream would be out of step with the changed rows
+                        streamer.reload();
+                        return;
+                    }
+                    const transaction = {};
+                    for (const [kind, rows] of Object.entries(JSON.parse(msg.payload))) {
+                        transaction[kind] = zipColumns(rows);
+                    }
+                    if (model.get("async_transactions") && gridApi.applyTransactionAsync) {
+                        gridApi.applyTransactionAsync(transaction);
+                    } else {
+                        gridApi.applyTransaction(transaction);
+                    }
+                };
+                model.on("msg:custom", onTransaction);
 
-                // Cleanup on destroy
+                // Let Python resync row data if deltas were sent before this view existed
+                model.send({ type: "ready" });
+
+                // Cleanup on destroy: later messages and row data changes must not reach the destroyed grid
                 return () => {
+                    destroyed = true;
+                    model.off("change:row_data", onRowDataChange);
+                    model.off("change:row_data_buffer", onRowDataChange);
+                    model.off("msg:custom", onTransaction);
+                    if (streamer) streamer.dispose();
+                    if (datasource) datasource.dispose();
+                    document.removeEventListener("click", hideContextMenu);
                     if (gridApi && gridApi.destroy) {
                         gridApi.destroy();
                     }
@@ -492,6 +799,7 @@ class AGGridWidget(anywidget.AnyWidget):
         }
     };
     """
+    )
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -499,9 +807,14 @@ class AGGridWidget(anywidget.AnyWidget):
         self.current_selection: Optional[List[Dict]] = None
         self._df: Optional[pd.DataFrame] = None
         self._last_click: Optional[str] = None  # Dedupe clicks
+        self._num_pinned = 0  # Leading rows of df shown as pinned rows, not row data
+        self._row_data_stale = False  # Deltas applied since row_data was last serialized
+        self._query_engine: Optional[GridQueryEngine] = None  # Sort/filter cache for row_model="server"
+        self._dictionary_encode: DictionaryEncode = True  # Column dictionary encoding for row payloads
 
         self.observe(self._on_selection_change, names=["selected_rows"])
         self.observe(self._on_cell_click, names=["clicked_cell"])
+        self.on_msg(self._on_custom_msg)
 
     def _on_selection_change(self, change):
         try:
@@ -523,6 +836,172 @@ class AGGridWidget(anywidget.AnyWidget):
         except (json.JSONDecodeError, TypeError):
             pass
 
+    def _on_custom_msg(self, widget, content, buffers):
+        if not isinstance(content, dict):
+            return
+        msg_type = content.get("type")
+        if msg_type == "get_rows":
+            self._send_rows_block(content)
+        elif msg_type == "get_chunk":
+            self._send_chunk(content)
+        elif msg_type == "ready" and self._row_data_stale:
+            self._refresh_row_data()
+
+    def _get_query_engine(self) -> GridQueryEngine:
+        if self._query_engine is None:
+            self._query_engine = GridQueryEngine(self._client_rows() if self._df is not None else pd.DataFrame())
+        return self._query_engine
+
+    def _send_rows_block(self, request: Dict[str, Any]):
+        request_id = request.get("request_id")
+        try:
+            block, row_count = self._get_query_engine().get_rows(
+                int(request.get("start_row", 0)),
+                int(request.get("end_row", 0)),
+                request.get("sort_model"),
+                request.get("filter_model"),
+            )
+            payload = dataframe_to_json(block, self._dictionary_encode)
+            self.send({"type": "rows", "request_id": request_id, "payload": payload, "row_count": row_count})
+        except Exception as e:
+            logger.exception("Failed to serve grid rows")
+            self.send({"type": "rows", "request_id": request_id, "error": str(e)})
+
+    def _client_rows(self) -> pd.DataFrame:
+        """Rows of df sent to the browser as row data (excludes pinned rows)."""
+        assert self._df is not None
+        return self._df.iloc[self._num_pinned :]
+
+    def _send_chunk(self, request: Dict[str, Any]):
+        if self._df is None:
+            return
+        rows = self._client_rows()
+        offset = max(int(request.get("offset", 0)), 0)
+        chunk = rows.iloc[offset : offset + max(self.stream_chunk_size, 1)]
+        encoded = self._encode_rows(chunk)
+        content: Dict[str, Any] = {
+            "type": "chunk",
+            "request_id": request.get("request_id"),
+            "next_offset": offset + len(chunk),
+            "done": offset + len(chunk) >= len(rows),
+            "transport": self.transport,
+            "compression": encoded["row_data_compression"],
+        }
+        if encoded["row_data_buffer"]:
+            self.send(content, buffers=[encoded["row_data_buffer"]])
+        else:
+            content["payload"] = encoded["row_data"]
+            self.send(content)
+
+    def _encode_rows(self, rows: pd.DataFrame) -> Dict[str, Any]:
+        # The traits are plain strings: check them before narrowing to the Literal types
+        if self.transport not in ("json", "arrow"):
+            raise ValueError(f"Unknown transport '{self.transport}', expected 'json' or 'arrow'")
+        if self.compression not in ("", "gzip", "deflate"):
+            raise ValueError(f"Unknown compression '{self.compression}', expected 'gzip' or 'deflate'")
+        return _encode_row_data(
+            rows,
+            cast(TransportType, self.transport),
+            self._dictionary_encode,
+            compression=cast(Optional[CompressionType], self.compression or None),
+            compression_threshold=self.compression_threshold,
+        )
+
+    def _refresh_row_data(self):
+        """Re-serialize row data from df so newly rendered views include earlier deltas."""
+        if self._df is None or self.row_model == "server":
+            return
+        rows = self._client_rows()
+        if self.stream_chunk_size > 0:
+            # Views restart streaming after the first chunk when row data changes
+            rows = rows.iloc[: self.stream_chunk_size]
+        with self.hold_sync():
+            for name, value in self._encode_rows(rows).items():
+                setattr(self, name, value)
+        self._row_data_stale = False
+
+    def _require_row_id(self) -> str:
+        if not self.row_id:
+            raise ValueError("Delta updates require a row id column: create_grid(df, row_id='id')")
+        return self.row_id
+
+    def _send_transaction(self, kind: str, rows: pd.DataFrame):
+        self._query_engine = None
+        if self.row_model == "server":
+            # Rows live in the kernel; the browser just re-requests its cached blocks
+            self.send({"type": "refresh"})
+            return
+        payload = json.dumps({kind: dataframe_to_columns(rows, self._dictionary_encode)}, allow_nan=False)
+        self.send({"type": "transaction", "payload": payload})
+        self._row_data_stale = True
+
+    def add_rows(self, rows: Union[pd.DataFrame, List[Dict[str, Any]]]) -> None:
+        """
+        Append rows to the grid without resending existing row data.
+
+        Args:
+            rows: DataFrame or list of row dicts with the same columns as the grid
+        """
+        new = _as_frame(rows)
+        if self._df is not None:
+            self._df = pd.concat([self._df, new])
+        self._send_transaction("add", new)
+
+    def update_rows(self, rows: Union[pd.DataFrame, List[Dict[str, Any]]]) -> None:
+        """
+        Update existing rows in place, matched on the row_id column.
+
+        Only the columns present in rows are changed. Scroll position, sort and
+        selection are preserved in the browser.
+
+        Args:
+            rows: DataFrame or list of row dicts containing the row_id column
+
+        Raises:
+            KeyError: If a row id is not present in the grid
+        """
+        row_id = self._require_row_id()
+        changed = _as_frame(rows)
+        if self._df is not None:
+            positions = pd.Index(self._df[row_id]).get_indexer(changed[row_id])
+            if (positions < 0).any():
+                missing = changed[row_id][positions < 0].tolist()
+                raise KeyError(f"Row ids not found in grid: {missing}")
+            # Build every column before writing any, so a failure leaves df and the browser in step
+            updates = {
+                col: _updated_column(cast(pd.Series, self._df[col]), positions, cast(pd.Series, changed[col]))
+                for col in changed.columns
+                if col in self._df.columns
+            }
+            for col, updated in updates.items():
+                # Replace the column rather than writing in place: df may share data with the caller's frame
+                self._df[col] = updated
+            # AG Grid replaces row data objects on update, so send complete rows
+            changed = self._df.iloc[positions]
+        self._send_transaction("update", changed)
+
+    def remove_rows(self, rows: Union[pd.DataFrame, List[Any]]) -> None:
+        """
+        Remove rows from the grid, matched on the row_id column.
+
+        Args:
+            rows: DataFrame containing the row_id column, or a list of row ids
+
+        Raises:
+            ValueError: If a row is one of the pinned rows (num_toppinned_rows)
+        """
+        row_id = self._require_row_id()
+        if isinstance(rows, pd.DataFrame):
+            ids = rows[row_id].tolist()
+        else:
+            ids = list(rows)
+        if self._df is not None:
+            pinned = self._df[row_id].iloc[: self._num_pinned]
+            if pinned.isin(ids).any():
+                raise ValueError(f"Pinned rows can't be removed: {pinned[pinned.isin(ids)].tolist()}")
+            self._df = self._df.loc[~self._df[row_id].isin(ids)]
+        self._send_transaction("remove", pd.DataFrame({row_id: ids}))
+
     def _dispatch_message(self, msg: Dict):
         for handler, msg_type in self.message_handlers:
             if msg_type is None or msg.get("event_type") == msg_type:
@@ -545,6 +1024,27 @@ class AGGridWidget(anywidget.AnyWidget):
     @df.setter
     def df(self, value: pd.DataFrame):
         self._df = value
+        self._query_engine = None
+
+
+def _as_frame(rows: Union[pd.DataFrame, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """Normalize rows passed to the delta update methods into a DataFrame with str column names."""
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows)
+    if any(not isinstance(col, str) for col in df.columns):
+        df = df.rename(columns=str)
+    return df
+
+
+def _updated_column(column: pd.Series, positions: np.ndarray, values: pd.Series) -> pd.Series:
+    """A copy of column with values written at positions, upcast if they don't fit its dtype (e.g. floats into ints)."""
+    updated = column.copy()
+    try:
+        updated.iloc[positions] = values.to_numpy()
+    except (TypeError, ValueError):
+        common = pd.concat([column.iloc[:0], values.iloc[:0]]).dtype  # pandas' own rules for combining dtypes
+        updated = column.astype(common)
+        updated.iloc[positions] = values.astype(common).to_numpy()
+    return updated
 
 
 def get_column_defs(
@@ -607,6 +1107,56 @@ def apply_format(
     return col_def
 
 
+def _prepare_frame(input_df: pd.DataFrame, flatten_columns: bool, showindex: bool) -> pd.DataFrame:
+    """
+    Return the frame displayed by create_grid without copying column data.
+
+    A shallow copy gets the renamed columns and, when showindex is set, the index
+    levels inserted as leading columns (named like DataFrame.reset_index), so the
+    caller's frame is untouched while its column buffers are shared.
+    """
+    df = input_df.copy(deep=False)
+    if flatten_columns:
+        df.columns = [str(col) for col in df.columns]
+    if showindex:
+        index = df.index
+        for level in reversed(range(index.nlevels)):
+            name = index.names[level]
+            if name is None:
+                name = "index" if index.nlevels == 1 and "index" not in df.columns else f"level_{level}"
+            df.insert(0, name, index.get_level_values(level))
+        df.index = pd.RangeIndex(len(df))
+    return df
+
+
+def _encode_row_data(
+    df: pd.DataFrame,
+    transport: TransportType,
+    dictionary_encode: DictionaryEncode = True,
+    compression: Optional[CompressionType] = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+) -> Dict[str, Any]:
+    """Return the AGGridWidget trait values that carry df's rows for the given transport."""
+    if transport == "arrow":
+        text, payload = "[]", dataframe_to_arrow_ipc(df, dictionary_encode)
+    elif transport == "json":
+        text = dataframe_to_json(df, dictionary_encode)
+        payload = text.encode() if compression else b""
+    else:
+        raise ValueError(f"Unknown transport '{transport}', expected 'json' or 'arrow'")
+
+    if compression and len(payload) >= compression_threshold:
+        # Compressed payloads always travel on the binary buffer channel
+        return {
+            "row_data": "[]",
+            "row_data_buffer": compress_payload(payload, compression),
+            "row_data_compression": compression,
+        }
+    if transport == "json":
+        payload = b""
+    return {"row_data": text, "row_data_buffer": payload, "row_data_compression": ""}
+
+
 def create_grid(
     input_df: pd.DataFrame,
     is_tree: bool = False,
@@ -633,6 +1183,16 @@ def create_grid(
     font_size: int = 12,
     row_height: int = 28,
     header_height: int = 32,
+    transport: TransportType = "json",
+    arrow_version: str = DEFAULT_ARROW_VERSION,
+    row_id: Optional[str] = None,
+    async_transactions: bool = False,
+    row_model: RowModelType = "client",
+    stream: bool = False,
+    chunk_size: int = 5000,
+    dictionary_encode: DictionaryEncode = True,
+    compression: Optional[CompressionType] = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
 ) -> AGGridWidget:
     """
     Create an AG Grid widget using anywidget (no ipyaggrid dependency).
@@ -664,6 +1224,30 @@ def create_grid(
         font_size: Font size in pixels (default: 12)
         row_height: Row height in pixels (default: 28)
         header_height: Header height in pixels (default: 32)
+        transport: How row data is sent to the browser (default: "json")
+                   - json: Records serialized into the row_data string
+                   - arrow: Columnar Arrow IPC stream sent as a binary buffer (requires pyarrow)
+        arrow_version: Apache Arrow JS version to load from CDN when transport="arrow"
+        row_id: Column with unique row ids. Required for update_rows/remove_rows, and keeps
+                scroll, sort and selection when row data changes.
+        async_transactions: Apply delta updates with applyTransactionAsync, batching
+                            high-frequency updates in the browser
+        row_model: Where row data lives (default: "client")
+                   - client: All rows are sent to the browser
+                   - server: Rows stay in the kernel (widget.df); the browser requests only the
+                     blocks it displays via AG Grid's infinite row model
+        stream: Send only the first chunk (the first page when paginated) with the widget and
+                stream the remaining rows from the kernel in chunks once the grid has rendered
+        chunk_size: Rows per streamed chunk (default: 5000)
+        dictionary_encode: Send repetitive string columns as integer codes plus a lookup table
+                           (default: True, auto-detects low-cardinality columns). Pass False to
+                           disable, or a list of column names to encode exactly those columns.
+                           Categorical columns are always sent as codes.
+        compression: Compress row payloads ("gzip" or "deflate"); the browser inflates them with
+                     its native DecompressionStream. Useful when the kernel is remote and bandwidth
+                     matters more than the CPU spent compressing (default: None)
+        compression_threshold: Only compress payloads of at least this many bytes (default: 1 MB),
+                               so small grids and streamed chunks skip the CPU cost
 
     Returns:
         AGGridWidget instance
@@ -690,11 +1274,20 @@ def create_grid(
         else:
             grid_options = {}
 
-    df = input_df.copy()
-    if flatten_columns:
-        df.columns = [str(col) for col in df.columns]
-    if showindex:
-        df = df.reset_index()
+    df = _prepare_frame(input_df, flatten_columns=flatten_columns, showindex=showindex)
+
+    if row_id is not None and row_id not in df.columns:
+        raise ValueError(f"row_id '{row_id}' not found in DataFrame columns")
+    if row_model not in ("client", "server"):
+        raise ValueError(f"Unknown row_model '{row_model}', expected 'client' or 'server'")
+    if row_model == "server" and is_tree:
+        raise ValueError("Tree data is not supported with row_model='server'")
+    if row_model == "server" and stream:
+        raise ValueError("stream=True is not supported with row_model='server'")
+    if stream and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if compression not in (None, "gzip", "deflate"):
+        raise ValueError(f"Unknown compression '{compression}', expected 'gzip' or 'deflate'")
 
     # Generate column definitions if not provided
     if column_defs is None:
@@ -706,18 +1299,28 @@ def create_grid(
                 if col_def.get("field") in tree_cols:
                     col_def["hide"] = True
 
-    if num_toppinned_rows > 0:
-        pinned_data = df.iloc[:num_toppinned_rows].to_dict(orient="records")
-        row_data = df.iloc[num_toppinned_rows:].to_dict(orient="records")
+    pinned_data = df.iloc[: max(num_toppinned_rows, 0)]
+
+    stream_chunk_size = 0
+    if row_model == "server":
+        row_data: Dict[str, Any] = {}
     else:
-        pinned_data = []
-        row_data = df.to_dict(orient="records")
+        rows = df.iloc[max(num_toppinned_rows, 0) :]
+        if stream:
+            stream_chunk_size = chunk_size
+            first_chunk = chunk_size
+            if grid_options.get("pagination"):
+                first_chunk = min(chunk_size, grid_options.get("paginationPageSize", 100))
+            rows = rows.iloc[:first_chunk]
+        row_data = _encode_row_data(rows, transport, dictionary_encode, compression, compression_threshold)
 
     widget = AGGridWidget(
-        row_data=json.dumps(row_data, default=str),
+        **row_data,
+        transport=transport,
+        arrow_version=arrow_version,
         column_defs=json.dumps(column_defs),
         grid_options=json.dumps(grid_options),
-        pinned_top_rows=json.dumps(pinned_data, default=str),
+        pinned_top_rows=dataframe_to_json(pinned_data),
         height=height,
         width=width,
         auto_height=auto_height,
@@ -735,12 +1338,20 @@ def create_grid(
         font_size=font_size,
         row_height=row_height,
         header_height=header_height,
+        row_id=row_id or "",
+        async_transactions=async_transactions,
+        row_model=row_model,
+        stream_chunk_size=stream_chunk_size,
+        compression=compression or "",
+        compression_threshold=compression_threshold,
     )
 
     if action is not None:
         widget.on("cellClicked", action)
 
     widget.df = df
+    widget._num_pinned = max(num_toppinned_rows, 0)
+    widget._dictionary_encode = dictionary_encode
 
     return widget
 
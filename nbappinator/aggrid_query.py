@@ -0,0 +1,248 @@
+"""Kernel-side evaluation of AG Grid sort and filter models for row_model="server"."""
+
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+
+SortModel = List[Dict[str, Any]]
+FilterModel = Dict[str, Dict[str, Any]]
+
+
+def _model_key(model: Any) -> str:
+    return json.dumps(model or None, sort_keys=True, default=str)
+
+
+def sort_permutation(df: pd.DataFrame, sort_model: Optional[SortModel]) -> Optional[np.ndarray]:
+    """
+    Translate an AG Grid sortModel into a row position permutation.
+
+    Args:
+        df: Source DataFrame
+        sort_model: AG Grid sort model, e.g. [{"colId": "price", "sort": "desc"}]
+
+    Returns:
+        Positions of df's rows in sorted order, or None if nothing is sorted
+    """
+    specs = [s for s in sort_model or [] if s.get("colId") in df.columns and s.get("sort") in ("asc", "desc")]
+    if not specs:
+        return None
+    cols: List[str] = [s["colId"] for s in specs]
+    ascending: List[bool] = [s["sort"] == "asc" for s in specs]
+    keys = df.loc[:, cols].reset_index(drop=True)
+    ordered = keys.sort_values(cols, ascending=ascending, kind="stable", na_position="last")
+    return ordered.index.to_numpy()
+
+
+def _text_mask(series: pd.Series, condition: Dict[str, Any]) -> pd.Series:
+    op = condition.get("type", "contains")
+    values = series.astype("string").str.lower()
+    blank = values.isna() | (values == "")
+    if op == "blank":
+        return blank
+    if op == "notBlank":
+        return ~blank
+
+    needle = str(condition.get("filter") or "").lower()
+    if op == "equals":
+        mask = values == needle
+    elif op == "notEqual":
+        mask = values != needle
+    elif op == "contains":
+        mask = values.str.contains(needle, regex=False)
+    elif op == "notContains":
+        mask = ~values.str.contains(needle, regex=False)
+    elif op == "startsWith":
+        mask = values.str.startswith(needle)
+    elif op == "endsWith":
+        mask = values.str.endswith(needle)
+    else:
+        raise ValueError(f"Unsupported text filter type '{op}'")
+    # AG Grid keeps blank values for the negated operators
+    return mask.fillna(op in ("notEqual", "notContains")).astype(bool)
+
+
+def _range_mask(values: pd.Series, op: str, low: Any, high: Any) -> pd.Series:
+    if op == "equals":
+        mask = values == low
+    elif op == "notEqual":
+        mask = values != low
+    elif op == "lessThan":
+        mask = values < low
+    elif op == "lessThanOrEqual":
+        mask = values <= low
+    elif op == "greaterThan":
+        mask = values > low
+    elif op == "greaterThanOrEqual":
+        mask = values >= low
+    elif op == "inRange":
+        mask = (values > low) & (values < high)
+    else:
+        raise ValueError(f"Unsupported filter type '{op}'")
+    return mask.fillna(False).astype(bool)
+
+
+def _number_mask(series: pd.Series, condition: Dict[str, Any]) -> pd.Series:
+    op = condition.get("type", "equals")
+    values = cast(pd.Series, pd.to_numeric(series, errors="coerce"))
+    if op == "blank":
+        return values.isna()
+    if op == "notBlank":
+        return values.notna()
+    return _range_mask(values, op, condition.get("filter"), condition.get("filterTo"))
+
+
+def _day(value: Any) -> pd.Timestamp:
+    return cast(pd.Timestamp, pd.Timestamp(value)).normalize()
+
+
+def _date_mask(series: pd.Series, condition: Dict[str, Any]) -> pd.Series:
+    op = condition.get("type", "equals")
+    values = cast(pd.Series, pd.to_datetime(series, errors="coerce"))
+    if op == "blank":
+        return values.isna()
+    if op == "notBlank":
+        return values.notna()
+    if getattr(values.dt, "tz", None) is not None:
+        values = values.dt.tz_localize(None)
+    # AG Grid date filters compare calendar days
+    low = _day(condition["dateFrom"]) if condition.get("dateFrom") else None
+    high = _day(condition["dateTo"]) if condition.get("dateTo") else None
+    return _range_mask(values.dt.normalize(), op, low, high)
+
+
+def _set_mask(series: pd.Series, condition: Dict[str, Any]) -> pd.Series:
+    selected = condition.get("values") or []
+    keys = [str(v) for v in selected if v is not None]
+    mask = series.astype(str).isin(keys) & series.notna()
+    if None in selected:
+        mask |= series.isna()
+    return mask
+
+
+_CONDITION_MASKS = {
+    "text": _text_mask,
+    "number": _number_mask,
+    "date": _date_mask,
+    "set": _set_mask,
+}
+
+
+def column_filter_mask(series: pd.Series, column_model: Dict[str, Any]) -> np.ndarray:
+    """
+    Evaluate one column's AG Grid filter model as a boolean mask.
+
+    Supports text, number, date and set filters, combined conditions
+    (operator + conditions, or the older condition1/condition2 form) and multi filters.
+    """
+    filter_type = column_model.get("filterType", "text")
+
+    if filter_type == "multi":
+        masks = [column_filter_mask(series, m) for m in column_model.get("filterModels") or [] if m]
+        return np.logical_and.reduce(masks) if masks else np.ones(len(series), dtype=bool)
+
+    conditions = column_model.get("conditions")
+    if conditions is None and "condition1" in column_model:
+        conditions = [c for c in (column_model.get("condition1"), column_model.get("condition2")) if c]
+    if conditions is not None:
+        masks = [column_filter_mask(series, {"filterType": filter_type, **c}) for c in conditions]
+        if not masks:
+            return np.ones(len(series), dtype=bool)
+        combine = np.logical_or if column_model.get("operator", "AND").upper() == "OR" else np.logical_and
+        return combine.reduce(masks)
+
+    mask_fn = _CONDITION_MASKS.get(filter_type)
+    if mask_fn is None:
+        raise ValueError(f"Unsupported filterType '{filter_type}'")
+    return mask_fn(series, column_model).to_numpy(dtype=bool)
+
+
+class GridQueryEngine:
+    """
+    Answers AG Grid block requests from a DataFrame using vectorized pandas operations.
+
+    Sort permutations are cached per sort model and filter masks per column filter,
+    so scrolling through blocks of the same view only slices a cached position array.
+    Call invalidate() whenever the DataFrame changes.
+    """
+
+    def __init__(self, df: pd.DataFrame, max_cache_entries: int = 16):
+        self._df = df
+        self._max_cache_entries = max_cache_entries
+        self._sort_cache: "OrderedDict[str, Optional[np.ndarray]]" = OrderedDict()
+        self._mask_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._view_cache: "OrderedDict[str, Optional[np.ndarray]]" = OrderedDict()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    def invalidate(self, df: Optional[pd.DataFrame] = None) -> None:
+        """Drop cached results, optionally switching to a new DataFrame."""
+        if df is not None:
+            self._df = df
+        self._sort_cache.clear()
+        self._mask_cache.clear()
+        self._view_cache.clear()
+
+    def _cached(self, cache: OrderedDict, key: str, compute):
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = compute()
+        cache[key] = value
+        if len(cache) > self._max_cache_entries:
+            cache.popitem(last=False)
+        return value
+
+    def sort_permutation(self, sort_model: Optional[SortModel]) -> Optional[np.ndarray]:
+        return self._cached(self._sort_cache, _model_key(sort_model), lambda: sort_permutation(self._df, sort_model))
+
+    def filter_mask(self, filter_model: Optional[FilterModel]) -> Optional[np.ndarray]:
+        """Combined mask for all filtered columns, or None if nothing is filtered."""
+        mask = None
+        for col, column_model in (filter_model or {}).items():
+            if col not in self._df.columns or not column_model:
+                continue
+            col_mask = self._cached(
+                self._mask_cache,
+                _model_key([col, column_model]),
+                lambda col=col, column_model=column_model: column_filter_mask(
+                    cast(pd.Series, self._df[col]), column_model
+                ),
+            )
+            mask = col_mask if mask is None else mask & col_mask
+        return mask
+
+    def positions(
+        self,
+        sort_model: Optional[SortModel] = None,
+        filter_model: Optional[FilterModel] = None,
+    ) -> Optional[np.ndarray]:
+        """Row positions for the sorted, filtered view, or None for the unmodified frame."""
+
+        def compute():
+            order = self.sort_permutation(sort_model)
+            mask = self.filter_mask(filter_model)
+            if mask is None:
+                return order
+            if order is None:
+                return np.flatnonzero(mask)
+            return order[mask[order]]
+
+        return self._cached(self._view_cache, _model_key([sort_model, filter_model]), compute)
+
+    def get_rows(
+        self,
+        start_row: int,
+        end_row: int,
+        sort_model: Optional[SortModel] = None,
+        filter_model: Optional[FilterModel] = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """Return rows [start_row, end_row) of the sorted, filtered view and the view's row count."""
+        positions = self.positions(sort_model, filter_model)
+        if positions is None:
+            return self._df.iloc[start_row:end_row], len(self._df)
+        return self._df.iloc[positions[start_row:end_row]], len(positions)
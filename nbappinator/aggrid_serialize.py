@@ -0,0 +1,249 @@
+"""Serialization of DataFrames into AG Grid row data payloads."""
+
+import gzip
+import json
+import math
+import zlib
+from typing import Any, Collection, Dict, List, Literal, Union, cast
+
+import numpy as np
+import pandas as pd
+
+# String columns with at most this many distinct values per row are dictionary-encoded
+DEFAULT_MAX_UNIQUE_RATIO = 0.5
+
+# Rows sampled to cheaply rule out high-cardinality columns before factorizing
+_CARDINALITY_SAMPLE = 1000
+
+# True: auto-detect low-cardinality string columns, False: only categoricals, or explicit column names
+DictionaryEncode = Union[bool, Collection[str]]
+
+# Payload compressions the browser decodes natively with DecompressionStream
+CompressionType = Literal["gzip", "deflate"]
+
+# Payloads smaller than this many bytes are sent uncompressed
+DEFAULT_COMPRESSION_THRESHOLD = 1_000_000
+
+
+def _nulls_to_none(values: np.ndarray, mask: np.ndarray) -> List[Any]:
+    if not mask.any():
+        return values.tolist()
+    out = values.astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def _json_safe(value: Any) -> Any:
+    """value as json.dumps(default=str) sends it (lists and dicts stay JSON), with NaN/inf as null."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, dict):
+        return {k if isinstance(k, str) else str(k): _json_safe(v) for k, v in value.items()}
+    return str(value)
+
+
+def _is_string_column(series: pd.Series) -> bool:
+    return series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+
+
+def is_low_cardinality(series: pd.Series, max_unique_ratio: float = DEFAULT_MAX_UNIQUE_RATIO) -> bool:
+    """Whether a column repeats its values enough for dictionary encoding to pay off."""
+    n = len(series)
+    if n < 2:
+        return False
+    if n > 10 * _CARDINALITY_SAMPLE:
+        sample = series.iloc[:_CARDINALITY_SAMPLE]
+        if sample.nunique(dropna=True) > max_unique_ratio * len(sample):
+            return False
+    return series.nunique(dropna=True) <= max_unique_ratio * n
+
+
+def _dictionary_column(name: str, codes: np.ndarray, dictionary: Any) -> Dict[str, Any]:
+    entries = _encode_column(name, pd.Series(dictionary))
+    col: Dict[str, Any] = {"name": name, "codes": codes.tolist(), "dictionary": entries["values"]}  # -1 is null
+    if "type" in entries:
+        col["type"] = entries["type"]
+    return col
+
+
+def _encode_column(name: str, series: pd.Series, dictionary: bool = False) -> Dict[str, Any]:
+    """Convert one column in bulk into a JSON-safe column entry."""
+    col: Dict[str, Any] = {"name": name}
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _dictionary_column(name, series.cat.codes.to_numpy(), dtype.categories)
+
+    if dictionary and _is_string_column(series):
+        try:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        except TypeError:  # Unhashable values (lists, dicts): send the column as is
+            pass
+        else:
+            return _dictionary_column(name, codes, uniques)
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        # Wall time with its offset, as str(Timestamp) shows it; epoch ms would display in UTC
+        col["values"] = _nulls_to_none(series.astype(str).to_numpy(dtype=object), series.isna().to_numpy())
+        return col
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values = series.to_numpy(dtype="datetime64[ms]")
+        col["type"] = "datetime"  # epoch milliseconds, formatted in the browser
+        col["values"] = _nulls_to_none(values.astype(np.int64), np.isnat(values))
+        return col
+
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        if series.hasnans:  # Nullable Int64/boolean
+            col["values"] = _nulls_to_none(series.to_numpy(dtype=object), series.isna().to_numpy())
+        else:
+            col["values"] = series.to_numpy().tolist()
+        return col
+
+    if pd.api.types.is_float_dtype(dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        col["values"] = _nulls_to_none(values, ~np.isfinite(values))
+        return col
+
+    if pd.api.types.is_numeric_dtype(dtype):  # complex
+        col["values"] = _nulls_to_none(series.astype(str).to_numpy(dtype=object), series.isna().to_numpy())
+        return col
+
+    # Object, string and other extension dtypes
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+        return _encode_column(name, cast(pd.Series, pd.to_numeric(series, errors="coerce")))
+    if inferred == "boolean":
+        return _encode_column(name, series.astype("boolean"))
+
+    mask = series.isna().to_numpy()
+    if inferred in ("mixed", "mixed-integer", "unknown-array"):
+        # Lists, dicts and mixed scalars keep their JSON types, value by value
+        col["values"] = [None if null else _json_safe(v) for v, null in zip(series.tolist(), mask, strict=True)]
+        return col
+    if inferred in ("string", "empty"):
+        values = series.to_numpy(dtype=object)
+    else:
+        values = series.astype(str).to_numpy(dtype=object)  # mirrors json.dumps(default=str)
+    col["values"] = _nulls_to_none(values, mask)
+    return col
+
+
+def _use_dictionary(name: str, series: pd.Series, dictionary_encode: DictionaryEncode, max_unique_ratio: float) -> bool:
+    if isinstance(dictionary_encode, bool):
+        # Only columns of strings: object columns can hold unhashable lists and dicts
+        return (
+            dictionary_encode
+            and _is_string_column(series)
+            and pd.api.types.infer_dtype(series, skipna=True) == "string"
+            and is_low_cardinality(series, max_unique_ratio)
+        )
+    return name in dictionary_encode
+
+
+def dataframe_to_columns(
+    df: pd.DataFrame,
+    dictionary_encode: DictionaryEncode = True,
+    max_unique_ratio: float = DEFAULT_MAX_UNIQUE_RATIO,
+) -> Dict[str, Any]:
+    """
+    Convert a DataFrame into a column-oriented, JSON-safe payload.
+
+    Each column is converted once with vectorized dtype handling instead of a
+    per-value json.dumps(default=str) callback: naive datetimes become epoch milliseconds,
+    timezone-aware ones strings with their offset, categoricals and low-cardinality string
+    columns are sent as integer codes plus a dictionary, and NaN/NaT/inf become null.
+    Object columns of lists, dicts or mixed types keep each value's JSON type. The browser
+    zips the columns back into row objects.
+
+    Args:
+        df: Source DataFrame
+        dictionary_encode: True to dictionary-encode string columns with few distinct values,
+                           False to only encode categoricals, or the names of columns to encode
+        max_unique_ratio: Largest distinct/total value ratio considered low-cardinality
+
+    Returns:
+        {"length": n, "columns": [{"name": ..., "values": [...]}, ...]}
+    """
+    columns = []
+    for i, col in enumerate(df.columns):
+        name = str(col)
+        series = df.iloc[:, i]
+        columns.append(_encode_column(name, series, _use_dictionary(name, series, dictionary_encode, max_unique_ratio)))
+    return {"length": len(df), "columns": columns}
+
+
+def dataframe_to_json(df: pd.DataFrame, dictionary_encode: DictionaryEncode = True) -> str:
+    """Serialize a DataFrame to the column-oriented JSON row data payload."""
+    return json.dumps(dataframe_to_columns(df, dictionary_encode=dictionary_encode), allow_nan=False)
+
+
+def dataframe_to_arrow_ipc(df: pd.DataFrame, dictionary_encode: DictionaryEncode = True) -> bytes:
+    """
+    Serialize a DataFrame to an Arrow IPC stream for the binary transport.
+
+    Columns Arrow can't represent are stringified, mirroring json.dumps(default=str), as are
+    timezone-aware datetimes (keeping their offset, as in dataframe_to_columns). Other
+    timestamps are cast to millisecond precision so the browser can decode them without
+    BigInt arithmetic; dates stay dates, shown like the JSON transport's (YYYY-MM-DD).
+    Decimals are sent as float64. Low-cardinality string columns become Arrow dictionary
+    arrays (see dataframe_to_columns).
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("transport='arrow' requires pyarrow: pip install pyarrow") from e
+
+    arrays = []
+    names = []
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.astype(str).where(series.notna(), None)
+        try:
+            arr = pa.Array.from_pandas(series)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            arr = pa.Array.from_pandas(series.astype(str))
+
+        if pa.types.is_timestamp(arr.type):
+            arr = arr.cast(pa.timestamp("ms", tz=arr.type.tz), safe=False)
+        elif pa.types.is_decimal(arr.type):
+            arr = arr.cast(pa.float64())
+        elif not pa.types.is_dictionary(arr.type) and _use_dictionary(
+            str(col), series, dictionary_encode, DEFAULT_MAX_UNIQUE_RATIO
+        ):
+            arr = arr.dictionary_encode()
+
+        arrays.append(arr)
+        names.append(str(col))
+
+    table = pa.Table.from_arrays(arrays, names=names)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def compress_payload(data: bytes, compression: CompressionType, level: int = 6) -> bytes:
+    """
+    Compress a serialized row data payload for the browser's DecompressionStream.
+
+    Args:
+        data: Serialized payload (JSON text encoded as UTF-8, or an Arrow IPC stream)
+        compression: "gzip" or "deflate" (zlib format)
+        level: Compression level; the default trades a little ratio for much faster compression
+
+    Returns:
+        Compressed bytes
+    """
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if compression == "deflate":
+        return zlib.compress(data, level)
+    raise ValueError(f"Unknown compression '{compression}', expected 'gzip' or 'deflate'")
@@ -1,13 +1,17 @@
 import io
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import ipywidgets
 from IPython.display import display
 
 from . import aggrid_anywidget, graphvizgraph, networkgraph, plotly_charts, treew
 from .browser_title import BrowserTitle
+from .callbacks import CallbackRunner, CancelToken, ChangeCoalescer, Concurrency, call_as, current_run
 from .vuetify3 import (
     VuetifyButtonWidget,
     VuetifyDisplayWidget,
@@ -30,27 +34,55 @@ class Page:
 
     def clear(self) -> "Page":
         """Clear all widgets from this page."""
-        self._widget.children = []
+        held = self._app._held_children(self._widget)
+        if held is not None:
+            held.clear()
+        else:
+            self._widget.children = []
         return self
 
     def _add_widget(self, widget: ipywidgets.Widget, name: Optional[str] = None) -> "Page":
-        """Add a widget to this page."""
-        self._widget.children = (*self._widget.children, widget)
+        """Add a widget to this page; deferred until the end of App.hold_sync()."""
+        held = self._app._held_children(self._widget)
+        if held is not None:
+            held.append(widget)
+        else:
+            self._widget.children = (*self._widget.children, widget)
         if name:
             self._app._widgets[name] = widget
         return self
 
+    def add_many(self, widgets: Iterable[ipywidgets.Widget]) -> "Page":
+        """Add several ipywidgets to this page with a single children update."""
+        with self._app.hold_sync():
+            for w in widgets:
+                self._add_widget(w)
+        return self
+
     def _add_form_widget(
         self,
         name: str,
         widget_type: str,
         on_change: Optional[Callable] = None,
+        debounce_ms: int = 0,
+        throttle_ms: int = 0,
         **kwargs,
     ) -> "Page":
-        """Helper to create and add a VuetifyFormWidget."""
-        w = VuetifyFormWidget(widget_type=widget_type, **kwargs)
+        """Helper to create and add a VuetifyFormWidget.
+
+        debounce_ms: The front end sends the value once input has paused this long.
+        throttle_ms: The front end sends the value at most once per period, and on_change
+        runs at most once per period. With either, on_change runs for the latest value only
+        (see ChangeCoalescer).
+        """
+        if debounce_ms < 0 or throttle_ms < 0:
+            raise ValueError("debounce_ms and throttle_ms must be >= 0")
+        w = VuetifyFormWidget(widget_type=widget_type, debounce_ms=debounce_ms, throttle_ms=throttle_ms, **kwargs)
         if on_change:
-            w.observe(self._app._wrap_callback_observe(on_change, name), names=["value"])
+            callback = self._app._wrap_callback_observe(on_change, name)
+            if debounce_ms or throttle_ms:
+                callback = ChangeCoalescer(callback, throttle_ms=throttle_ms)
+            w.observe(callback, names=["value"])
         return self._add_widget(w, name)
 
     def select(
@@ -62,12 +94,16 @@ class Page:
         on_change: Optional[Callable] = None,
         multiple: bool = False,
         disabled: bool = False,
+        debounce_ms: int = 0,
+        throttle_ms: int = 0,
     ) -> "Page":
         """Add a dropdown select widget."""
         return self._add_form_widget(
             name,
             "select",
             on_change,
+            debounce_ms=debounce_ms,
+            throttle_ms=throttle_ms,
             label=label or name,
             items=options,
             value=default,
@@ -84,12 +120,16 @@ class Page:
         on_change: Optional[Callable] = None,
         multiple: bool = False,
         disabled: bool = False,
+        debounce_ms: int = 0,
+        throttle_ms: int = 0,
     ) -> "Page":
         """Add a combobox (select with text input)."""
         return self._add_form_widget(
             name,
             "combobox",
             on_change,
+            debounce_ms=debounce_ms,
+            throttle_ms=throttle_ms,
             label=label or name,
             items=options,
             value=default,
@@ -107,12 +147,16 @@ class Page:
         on_change: Optional[Callable] = None,
         step: int = 1,
         disabled: bool = False,
+        debounce_ms: int = 0,
+        throttle_ms: int = 0,
     ) -> "Page":
         """Add a slider widget."""
         return self._add_form_widget(
             name,
             "slider",
             on_change,
+            debounce_ms=debounce_ms,
+            throttle_ms=throttle_ms,
             label=label or name,
             min_value=float(min_val),
             max_value=float(max_val),
@@ -150,6 +194,8 @@ class Page:
         on_change: Optional[Callable] = None,
         multiline: bool = False,
         disabled: bool = False,
+        debounce_ms: int = 0,
+        throttle_ms: int = 0,
     ) -> "Page":
         """Add a text input (single line or multiline)."""
         widget_type = "textarea" if multiline else "text"
@@ -157,6 +203,8 @@ class Page:
             name,
             widget_type,
             on_change,
+            debounce_ms=debounce_ms,
+            throttle_ms=throttle_ms,
             label=label or name,
             value=default,
             disabled=disabled,
@@ -187,15 +235,28 @@ class Page:
         label: Optional[str] = None,
         status: bool = False,
         disabled: bool = False,
+        background: bool = False,
+        concurrency: Concurrency = "queue",
     ) -> "Page":
         """Add a button.
 
+        The button shows a loading state while its callback runs; with status=True the
+        status text also reads "Running...", then "Done" (unless the callback called
+        app.done), "Error: ..." or "Cancelled".
+
         Args:
             name: Widget name for reference
-            on_click: Callback function (receives app as only argument)
+            on_click: Callback function (receives app as only argument). An async def
+                callback runs as a task on the kernel's event loop, so other widgets stay
+                responsive and can cancel it.
             label: Button label (defaults to name)
             status: If True, adds a status display next to the button
             disabled: If True, button starts disabled
+            background: Run a sync callback in the app's thread pool instead of blocking
+                the kernel
+            concurrency: What a click does while an async or background run is in progress:
+                "queue" (run afterwards), "drop" (ignore it) or "cancel" (cancel the
+                current run and start over). Runs check app.cancelled to stop early.
         """
         btn = VuetifyButtonWidget(
             label=label or name,
@@ -205,7 +266,17 @@ class Page:
         )
 
         # Observe click count changes
-        btn.observe(self._app._wrap_callback_observe(on_click, name), names=["clicked"])
+        runner = CallbackRunner(
+            self._app,
+            name,
+            on_click,
+            button=btn,
+            background=background,
+            concurrency=concurrency,
+            executor=self._app._get_executor,
+        )
+        self._app._runners[name] = runner
+        btn.observe(runner, names=["clicked"])
 
         self._app._widgets[name] = btn
         if status:
@@ -235,9 +306,9 @@ class Page:
         w = VuetifyDisplayWidget(widget_type="separator")
         return self._add_widget(w)
 
-    def output(self, name: str, max_lines: Optional[int] = None) -> "Page":  # noqa: ARG002
-        """Add an output area for print statements."""
-        w = VuetifyOutputWidget()
+    def output(self, name: str, max_lines: Optional[int] = None) -> "Page":
+        """Add an output area for print statements, keeping the last max_lines lines (default 10,000)."""
+        w = VuetifyOutputWidget() if max_lines is None else VuetifyOutputWidget(max_lines=max_lines)
         return self._add_widget(w, name)
 
     # --- Data/Chart widgets ---
@@ -341,11 +412,17 @@ class Page:
         directed: bool = False,
         node_size: int = 8,
         size_by_degree: bool = False,
+        positions=None,
+        simulation: Optional[networkgraph.SimulationMode] = None,
+        renderer: networkgraph.RendererType = "svg",
+        transport: networkgraph.GraphTransportType = "json",
+        lod: bool = False,
+        lod_max_nodes: int = 500,
     ) -> "Page":
         """Add a NetworkX graph visualization.
 
         Args:
-            graph: NetworkX graph object
+            graph: NetworkX graph object, or an edge list DataFrame with source and target columns
             name: Optional widget name for reference
             width: Canvas width in pixels
             height: Canvas height in pixels
@@ -357,6 +434,12 @@ class Page:
             directed: Whether to show directional arrows on edges.
             node_size: Node radius in pixels.
             size_by_degree: Scale node size by degree.
+            positions: "auto" to compute the layout in the kernel, or {node: (x, y)}.
+            simulation: "full", "warm" or "off" (default: "off" with positions).
+            renderer: "svg", or "canvas"/"webgl" for graphs with many thousands of elements.
+            transport: "json", or "binary" to send nodes and links as typed arrays.
+            lod: Show communities as clusters that expand when clicked, for very large graphs.
+            lod_max_nodes: Clusters shown initially with lod=True (at most).
         """
         w = networkgraph.create_graph_d3(
             nx_graph=graph,
@@ -370,6 +453,12 @@ class Page:
             directed=directed,
             node_size=node_size,
             size_by_degree=size_by_degree,
+            positions=positions,
+            simulation=simulation,
+            renderer=renderer,
+            transport=transport,
+            lod=lod,
+            lod_max_nodes=lod_max_nodes,
         )
         return self._add_widget(w, name)
 
@@ -482,6 +571,7 @@ class App:
         header: Optional[str] = None,
         footer: Optional[str] = "Messages",
         title: Optional[str] = None,
+        evict_after: Optional[float] = None,
     ):
         """Create a new app.
 
@@ -490,8 +580,11 @@ class App:
             header: Optional collapsible header section name
             footer: Optional collapsible footer section name (default: "Messages")
             title: Optional browser title
+            evict_after: Seconds a tab with a builder may stay hidden before its content
+                is closed, checked on each tab change; it is rebuilt when shown again
         """
         self._tabs = tabs
+        self._evict_after = evict_after
         self._header_name = header
         self._footer_name = footer
         self._title = title
@@ -500,7 +593,16 @@ class App:
         self._containers: dict = {}
         self._status_widgets: dict = {}  # name -> VuetifyButtonWidget with status
         self._pages: dict[str, Page] = {}
-        self._current_caller: Optional[str] = None  # Track which button triggered callback
+        self._runners: Dict[str, CallbackRunner] = {}  # Button name -> callback runner
+        self._executor: Optional[ThreadPoolExecutor] = None  # For background=True buttons
+        self._hold_depth = 0
+        self._pending_children: Dict[int, Tuple[Any, List[ipywidgets.Widget]]] = {}  # id(container) -> children
+        self._displayed = False
+
+        # Lazy tabs: built on first selection
+        self._tab_builders: Dict[str, Callable] = {}
+        self._built_tabs: set = set()
+        self._tab_hidden_at: Dict[str, float] = {}
 
         # Build UI structure
         self._tab_widget: Optional[VuetifyTabsWidget] = None
@@ -562,6 +664,7 @@ class App:
                         c.remove_class("nbapp-expansion-content--hidden")
                     else:
                         c.add_class("nbapp-expansion-content--hidden")
+                self._on_tab_selected(change["old"], change["new"])
 
             tab_widget.observe(on_tab_change, names=["selected"])
 
@@ -597,11 +700,7 @@ class App:
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            self._current_caller = caller_name
-            try:
-                return func(self)
-            finally:
-                self._current_caller = None
+            return call_as(self, caller_name, func, self)
 
         return wrapper
 
@@ -610,14 +709,78 @@ class App:
 
         @wraps(func)
         def wrapper(change):
-            self._current_caller = caller_name
-            try:
-                return func(self)
-            finally:
-                self._current_caller = None
+            return call_as(self, caller_name, func, self)
 
         return wrapper
 
+    @property
+    def _current_caller(self) -> Optional[str]:
+        """Name of the widget whose callback is running in this thread/task."""
+        run = current_run()
+        return run.caller if run is not None and run.app is self else None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="nbapp-callback")
+        return self._executor
+
+    # --- Cancellation ---
+
+    @property
+    def cancel_token(self) -> Optional[CancelToken]:
+        """Cancellation token of the running callback, or None outside callbacks."""
+        run = current_run()
+        return run.token if run is not None and run.app is self else None
+
+    @property
+    def cancelled(self) -> bool:
+        """True if the running callback has been cancelled; long loops should check it and return."""
+        token = self.cancel_token
+        return token is not None and token.cancelled
+
+    def cancel(self, name: str):
+        """Cancel the running (and any queued) callbacks of a button."""
+        runner = self._runners.get(name)
+        if runner is None:
+            raise KeyError(f"No button named '{name}'")
+        runner.cancel()
+
+    # --- Batched page building ---
+
+    @contextmanager
+    def hold_sync(self) -> Iterator["App"]:
+        """Defer page additions and send each container's children once, on exit.
+
+        Appending to a page replaces its container's children tuple, which is
+        re-validated and re-synced to the front end: adding N widgets one by one
+        costs O(N^2) in total. Inside this block, additions to any page (including
+        rows and columns created within it) are collected and flushed per container.
+        Blocks may be nested; the outermost one flushes.
+
+        Example:
+            with app.hold_sync():
+                for i in range(1000):
+                    page.label(f"Item {i}")
+        """
+        self._hold_depth += 1
+        try:
+            yield self
+        finally:
+            self._hold_depth -= 1
+            if self._hold_depth == 0:
+                pending, self._pending_children = self._pending_children, {}
+                for container, children in pending.values():
+                    container.children = tuple(children)
+
+    def _held_children(self, container) -> Optional[List[ipywidgets.Widget]]:
+        """Pending children of container while holding sync, else None."""
+        if not self._hold_depth:
+            return None
+        key = id(container)
+        if key not in self._pending_children:
+            self._pending_children[key] = (container, list(container.children))
+        return self._pending_children[key][1]
+
     # --- Value access ---
 
     def __getitem__(self, name: str):
@@ -660,13 +823,71 @@ class App:
             return self._pages[self._header_name]
         raise ValueError("No header configured. Use header='Config' in App()")
 
-    def tab(self, name: Union[str, int]) -> Page:
-        """Access a tab by name or index."""
+    def tab(self, name: Union[str, int], builder: Optional[Callable] = None) -> Page:
+        """Access a tab by name or index.
+
+        Args:
+            name: Tab name or index
+            builder: Optional callable receiving the app, which fills the tab when it is
+                first shown instead of up front. Registering a builder again clears the
+                tab and rebuilds it on its next selection (immediately, if it is showing).
+        """
         if isinstance(name, int):
             name = self._tabs[name]
         if name not in self._pages:
             raise KeyError(f"No tab named '{name}'")
-        return self._pages[name]
+        page = self._pages[name]
+        if builder is not None:
+            self._tab_builders[name] = builder
+            if name in self._built_tabs:
+                self._evict_tab(name)
+            if self._displayed and self._selected_tab() == name:
+                self._build_tab(name)
+        return page
+
+    def _selected_tab(self) -> Optional[str]:
+        if not self._tab_widget:
+            return None
+        return self._tabs[self._tab_widget.selected]
+
+    def _build_tab(self, name: str):
+        """Run a tab's builder, if it hasn't run since the tab was last evicted."""
+        if name not in self._tab_builders or name in self._built_tabs:
+            return
+        with self.hold_sync():
+            self._tab_builders[name](self)
+        self._built_tabs.add(name)
+
+    def _evict_tab(self, name: str):
+        """Close a built tab's widgets so the browser can free them."""
+        page = self._pages[name]
+        closed: set = set()
+
+        def close(widget):
+            for child in getattr(widget, "children", ()):
+                close(child)
+            closed.add(id(widget))
+            widget.close()
+
+        for child in page._widget.children:
+            close(child)
+        page.clear()
+        for registry in (self._widgets, self._containers, self._status_widgets):
+            for key in [k for k, w in registry.items() if id(w) in closed]:
+                del registry[key]
+        for key in [k for k, r in self._runners.items() if id(r.button) in closed]:
+            self._runners.pop(key).cancel()
+        self._built_tabs.discard(name)
+
+    def _on_tab_selected(self, old: int, new: int):
+        now = time.monotonic()
+        self._tab_hidden_at[self._tabs[old]] = now
+        self._tab_hidden_at.pop(self._tabs[new], None)
+        if self._evict_after is not None:
+            for name, hidden_at in list(self._tab_hidden_at.items()):
+                if name in self._built_tabs and now - hidden_at >= self._evict_after:
+                    self._evict_tab(name)
+        self._build_tab(self._tabs[new])
 
     @property
     def footer(self) -> Page:
@@ -710,6 +931,11 @@ class App:
 
     def display(self):
         """Display the app."""
+        self._displayed = True
+        selected = self._selected_tab()
+        if selected:
+            self._build_tab(selected)
+
         if self._title:
             display(BrowserTitle(self._title))
 
@@ -0,0 +1,326 @@
+"""Third-party front-end libraries: CDN loading or pinned, bundled copies for offline use.
+
+Widgets load AG Grid, d3, Graphviz, Apache Arrow and Vue/Vuetify in the browser.
+By default these come from cdn.jsdelivr.net. For networks that block the CDN, the
+pinned bundles listed in ASSETS can be downloaded once and then either served over
+HTTP ("local") or sent by the kernel over the widget comm ("inline"). Either way,
+each library is loaded once per page and shared by all widgets.
+
+Usage:
+    python -m nbappinator.assets download            # into nbappinator/static
+    python -m nbappinator.assets download ./assets   # or any directory
+
+    >>> from nbappinator.assets import configure_assets
+    >>> configure_assets("inline")                   # kernel sends bundles from nbappinator/static
+    >>> configure_assets("local", base_url="/files/assets/")  # browser fetches from base_url
+"""
+
+import argparse
+import base64
+import logging
+import mimetypes
+import re
+import urllib.request
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional, Union
+
+import anywidget
+import traitlets
+
+logger = logging.getLogger(__name__)
+
+# Asset modes: "cdn" loads from jsdelivr, "local" from base_url, "inline" from the kernel
+AssetMode = Literal["cdn", "local", "inline"]
+
+CDN_URL = "https://cdn.jsdelivr.net/npm/"
+
+# Bundles are stored as <asset_dir>/<package>@<version>/<file>, mirroring the CDN layout
+DEFAULT_ASSET_DIR = Path(__file__).parent / "static"
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A pinned file from an npm package."""
+
+    package: str
+    version: str
+    file: str
+    global_name: Optional[str] = None  # UMD bundles: the window global they define
+
+    @property
+    def path(self) -> str:
+        return f"{self.package}@{self.version}/{self.file}"
+
+
+# Minified, self-contained builds: UMD bundles run as classic scripts, so no import map or
+# module resolution is needed. Vuetify's UMD build picks up window.Vue.
+ASSETS: Dict[str, Asset] = {
+    "vue": Asset("vue", "3.5.13", "dist/vue.global.prod.js", "Vue"),
+    "vuetify": Asset("vuetify", "3.7.6", "dist/vuetify.min.js", "Vuetify"),
+    "vuetify-css": Asset("vuetify", "3.7.6", "dist/vuetify.min.css"),
+    "mdi-css": Asset("@mdi/font", "7.4.47", "css/materialdesignicons.min.css"),
+    "mdi-font": Asset("@mdi/font", "7.4.47", "fonts/materialdesignicons-webfont.woff2"),
+    "d3": Asset("d3", "7.9.0", "dist/d3.min.js", "d3"),
+    "ag-grid-community": Asset("ag-grid-community", "35.1.0", "dist/ag-grid-community.min.js", "agGrid"),
+    "ag-grid-enterprise": Asset("ag-grid-enterprise", "35.1.0", "dist/ag-grid-enterprise.min.js", "agGrid"),
+    "apache-arrow": Asset("apache-arrow", "18.1.0", "Arrow.es2015.min.js", "Arrow"),
+    "graphviz": Asset("@hpcc-js/wasm-graphviz", "1.6.1", "dist/index.js"),
+}
+
+
+@dataclass
+class _AssetSettings:
+    mode: AssetMode = "cdn"
+    base_url: str = ""
+    asset_dir: Path = DEFAULT_ASSET_DIR
+
+
+_settings = _AssetSettings()
+
+
+def configure_assets(
+    mode: AssetMode = "cdn",
+    base_url: Optional[str] = None,
+    asset_dir: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Choose where widgets load their front-end libraries from.
+
+    Applies to widgets created afterwards, so call it before building the app.
+    Bundled modes always use the versions pinned in ASSETS; per-widget version
+    options (aggrid_version, d3_version, ...) only apply to the CDN.
+
+    Args:
+        mode: "cdn" (default), "local" or "inline"
+              - cdn: Load from cdn.jsdelivr.net
+              - local: The browser fetches bundles from base_url, e.g. a directory served
+                by the Jupyter server ("/files/assets/") or a web server
+              - inline: The kernel reads bundles from asset_dir and sends them over the
+                widget comm; needs no HTTP access at all
+        base_url: URL of the downloaded asset directory (required for mode="local")
+        asset_dir: Directory populated by download_assets (default: nbappinator/static)
+    """
+    if mode not in ("cdn", "local", "inline"):
+        raise ValueError(f"Unknown asset mode '{mode}', expected 'cdn', 'local' or 'inline'")
+    if mode == "local" and not base_url:
+        raise ValueError("mode='local' requires base_url")
+    _settings.mode = mode
+    _settings.base_url = base_url.rstrip("/") + "/" if base_url else ""
+    _settings.asset_dir = Path(asset_dir) if asset_dir is not None else DEFAULT_ASSET_DIR
+    _read_asset.cache_clear()
+
+
+def asset_config() -> Dict[str, Any]:
+    """The asset settings sent to each widget's front end."""
+    if _settings.mode == "cdn":
+        return {"mode": "cdn"}
+    return {
+        "mode": _settings.mode,
+        "base_url": _settings.base_url,
+        "assets": {
+            name: {"path": asset.path, "version": asset.version, "global": asset.global_name}
+            for name, asset in ASSETS.items()
+        },
+    }
+
+
+_CSS_URL = re.compile(r"""url\((['"]?)([^'")]+)\1\)""")
+
+
+def _inline_css_urls(css: str, css_path: Path) -> str:
+    """Replace relative url() references (fonts) that exist on disk with data URIs."""
+
+    def replace(match: re.Match) -> str:
+        ref = match.group(2)
+        if ref.startswith(("data:", "http:", "https:", "/")):
+            return match.group(0)
+        target = css_path.parent / re.split(r"[?#]", ref)[0]
+        if not target.is_file():
+            return match.group(0)
+        mime = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+        if target.suffix == ".woff2":
+            mime = "font/woff2"
+        encoded = base64.b64encode(target.read_bytes()).decode("ascii")
+        return f'url("data:{mime};base64,{encoded}")'
+
+    return _CSS_URL.sub(replace, css)
+
+
+@lru_cache(maxsize=None)
+def _read_asset(name: str) -> bytes:
+    asset = ASSETS[name]
+    path = _settings.asset_dir / asset.path
+    if not path.is_file():
+        raise FileNotFoundError(f"{path} not found, run: python -m nbappinator.assets download {_settings.asset_dir}")
+    if path.suffix == ".css":
+        return _inline_css_urls(path.read_text(encoding="utf-8"), path).encode("utf-8")
+    return path.read_bytes()
+
+
+def read_asset(name: str) -> bytes:
+    """
+    Contents of a bundled asset, as sent to the browser in inline mode.
+
+    Stylesheets have their fonts embedded as data URIs. Results are cached.
+
+    Raises:
+        KeyError: Unknown asset name
+        FileNotFoundError: The bundle hasn't been downloaded
+    """
+    if name not in ASSETS:
+        raise KeyError(f"Unknown asset '{name}'")
+    return _read_asset(name)
+
+
+def download_assets(dest: Optional[Union[str, Path]] = None, cdn_url: str = CDN_URL) -> Path:
+    """
+    Download the pinned bundles in ASSETS.
+
+    Run once on a machine with CDN access, then ship the directory with the
+    deployment (or the package, when dest is the default).
+
+    Args:
+        dest: Target directory (default: nbappinator/static)
+        cdn_url: npm CDN to download from
+
+    Returns:
+        The asset directory
+    """
+    dest = Path(dest) if dest is not None else DEFAULT_ASSET_DIR
+    for path in sorted({asset.path for asset in ASSETS.values()}):
+        target = dest / path
+        if target.is_file():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        logger.info("Downloading %s", path)
+        with urllib.request.urlopen(cdn_url + path) as response:  # noqa: S310
+            target.write_bytes(response.read())
+    return dest
+
+
+class AssetWidget(anywidget.AnyWidget):
+    """AnyWidget whose front end loads libraries through ASSET_LOADER_JS."""
+
+    _asset_config = traitlets.Dict().tag(sync=True)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.on_msg(self._on_asset_msg)
+
+    @traitlets.default("_asset_config")
+    def _default_asset_config(self):
+        return asset_config()
+
+    def _on_asset_msg(self, widget, content, buffers):
+        if not isinstance(content, dict) or content.get("type") != "get_asset":
+            return
+        reply = {"type": "asset", "request_id": content.get("request_id")}
+        try:
+            data = read_asset(content.get("name", ""))
+        except (KeyError, OSError) as e:
+            logger.warning("Failed to serve asset %s: %s", content.get("name"), e)
+            self.send({**reply, "error": str(e)})
+            return
+        self.send(reply, buffers=[data])
+
+
+# Shared JavaScript for loading libraries per the widget's _asset_config
+# Plain string (no f-string escaping): prepend to, or interpolate into, a widget's _esm
+ASSET_LOADER_JS = """
+// One load per library per page, shared by all widgets
+const NBAPP_ASSETS = window.__NBAPP_ASSETS__ = window.__NBAPP_ASSETS__ || { loads: {} };
+
+function assetConfig(model) {
+    return model.get("_asset_config") || { mode: "cdn" };
+}
+
+function loadOnce(key, load) {
+    if (!NBAPP_ASSETS.loads[key]) {
+        const promise = load();
+        promise.catch(() => { delete NBAPP_ASSETS.loads[key]; });  // Let the next widget retry
+        NBAPP_ASSETS.loads[key] = promise;
+    }
+    return NBAPP_ASSETS.loads[key];
+}
+
+// Source of a bundled asset: fetched from base_url, or sent by the kernel in inline mode
+async function fetchAssetSource(model, name) {
+    const config = assetConfig(model);
+    if (config.mode === "local") {
+        const response = await fetch(config.base_url + config.assets[name].path);
+        if (!response.ok) throw new Error(`Failed to load ${name} from ${config.base_url}: ${response.status}`);
+        return response.text();
+    }
+    return new Promise((resolve, reject) => {
+        const requestId = Math.random().toString(36).slice(2);
+        const onMsg = (msg, buffers) => {
+            if (!msg || msg.type !== "asset" || msg.request_id !== requestId) return;
+            model.off("msg:custom", onMsg);
+            if (msg.error) reject(new Error(msg.error));
+            else resolve(new TextDecoder().decode(buffers[0]));
+        };
+        model.on("msg:custom", onMsg);
+        model.send({ type: "get_asset", name: name, request_id: requestId });
+    });
+}
+
+// Load a library: the ES module at cdnUrl, or the pinned bundle in local/inline mode
+async function loadAsset(model, name, cdnUrl) {
+    const config = assetConfig(model);
+    const asset = config.assets && config.assets[name];
+    if (config.mode === "cdn" || !asset) {
+        return loadOnce(cdnUrl, () => import(cdnUrl));
+    }
+    return loadOnce(`${name}@${asset.version}`, async () => {
+        const source = await fetchAssetSource(model, name);
+        if (asset.global) {
+            // UMD bundle: run as a classic script with AMD/CommonJS hidden so it defines its global.
+            // A top-level `var Lib = ...` (e.g. Vue's IIFE build) stays local to the function: return it
+            const name = asset.global;
+            const run = new Function(
+                "define", "module", "exports", "require",
+                `${source}\n;return typeof ${name} !== "undefined" ? ${name} : window[${JSON.stringify(name)}];`
+            );
+            window[name] = run.call(window);
+            return window[name];
+        }
+        return import(URL.createObjectURL(new Blob([source], { type: "text/javascript" })));
+    });
+}
+
+// Add a stylesheet once: linked from the CDN/base_url, or inlined from the kernel
+function loadStyle(model, name, cdnUrl) {
+    const config = assetConfig(model);
+    const asset = config.assets && config.assets[name];
+    return loadOnce(`style:${name}`, async () => {
+        if (config.mode === "inline" && asset) {
+            const style = document.createElement("style");
+            style.textContent = await fetchAssetSource(model, name);
+            document.head.appendChild(style);
+            return;
+        }
+        const link = document.createElement("link");
+        link.rel = "stylesheet";
+        link.href = config.mode === "local" && asset ? config.base_url + asset.path : cdnUrl;
+        document.head.appendChild(link);
+    });
+}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m nbappinator.assets", description="Manage bundled front-end assets")
+    sub = parser.add_subparsers(dest="command", required=True)
+    download = sub.add_parser("download", help="Download the pinned bundles")
+    download.add_argument("dest", nargs="?", default=None, help="Target directory (default: nbappinator/static)")
+    args = parser.parse_args()
+
+    if args.command == "download":
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        print(download_assets(args.dest))
+
+
+if __name__ == "__main__":
+    main()
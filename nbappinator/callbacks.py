@@ -0,0 +1,255 @@
+"""Button callback execution: inline, as asyncio tasks, or on a thread pool.
+
+A callback normally runs inline on the kernel's message handler, blocking every other
+widget until it returns. `async def` callbacks are scheduled as tasks on the kernel's
+event loop instead, and sync callbacks can opt into a background thread. Either way,
+a per-button concurrency policy decides what a click does while a run is in progress:
+
+- "queue": run again after the current run finishes (one pending run per click)
+- "drop": ignore the click
+- "cancel": cancel the current run and start a new one
+
+Cancellation is cooperative for threads (check app.cancelled) and raises
+asyncio.CancelledError at the next await for async callbacks.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+
+if TYPE_CHECKING:
+    from .app import App
+
+logger = logging.getLogger(__name__)
+
+Concurrency = Literal["queue", "drop", "cancel"]
+
+RUNNING_TEXT = "Running..."
+
+
+class CancelToken:
+    """Signals a running callback that it should stop."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+        if self._task is not None:
+            self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise asyncio.CancelledError if cancellation was requested."""
+        if self.cancelled:
+            raise asyncio.CancelledError()
+
+
+@dataclass
+class CallbackRun:
+    """The callback invocation in progress in the current context."""
+
+    app: "App"
+    caller: str
+    token: CancelToken = field(default_factory=CancelToken)
+
+
+# Set while a callback runs; copied into its task or worker thread
+_current_run: contextvars.ContextVar[Optional[CallbackRun]] = contextvars.ContextVar("nbapp_run", default=None)
+
+
+def current_run() -> Optional[CallbackRun]:
+    return _current_run.get()
+
+
+def call_as(app: "App", caller: str, func: Callable, *args) -> Any:
+    """Call func with caller as the current callback (for app.status/app.done)."""
+    reset = _current_run.set(CallbackRun(app, caller))
+    try:
+        return func(*args)
+    finally:
+        _current_run.reset(reset)
+
+
+class CallbackRunner:
+    """Runs one button's callback according to its mode and concurrency policy."""
+
+    def __init__(
+        self,
+        app: "App",
+        name: str,
+        func: Callable,
+        button: Optional[Any] = None,
+        background: bool = False,
+        concurrency: Concurrency = "queue",
+        executor: Optional[Callable[[], Executor]] = None,
+    ):
+        if concurrency not in ("queue", "drop", "cancel"):
+            raise ValueError(f"Unknown concurrency '{concurrency}', expected 'queue', 'drop' or 'cancel'")
+        if background and executor is None:
+            raise ValueError("background=True requires an executor")
+        self.app = app
+        self.name = name
+        self.func = func
+        self.button = button
+        self.is_async = inspect.iscoroutinefunction(func)
+        self.background = background and not self.is_async
+        self.concurrency = concurrency
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._active: Optional[CallbackRun] = None
+        self._pending = 0
+        if button is not None:
+            # Keep the button clickable while running when clicks can queue or cancel
+            button.interruptible = (self.is_async or self.background) and concurrency != "drop"
+
+    @property
+    def running(self) -> bool:
+        return self._active is not None
+
+    def __call__(self, change=None) -> None:  # noqa: ARG002 - traitlets observe signature
+        with self._lock:
+            if self._active is not None:
+                if self.concurrency == "drop":
+                    return
+                if self.concurrency == "queue":
+                    self._pending += 1
+                    return
+                self._active.token.cancel()
+            run = CallbackRun(self.app, self.name)
+            self._active = run
+        self._start(run)
+
+    def cancel(self) -> None:
+        """Cancel the current run and any queued runs."""
+        with self._lock:
+            self._pending = 0
+            if self._active is not None:
+                self._active.token.cancel()
+
+    def _start(self, run: CallbackRun) -> None:
+        self._set_status(run, loading=True, text=RUNNING_TEXT, color="")
+        if self.is_async:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            coro = self._run_async(run)
+            if loop is None:
+                asyncio.run(coro)  # No kernel loop (scripts, tests): run to completion
+            else:
+                run.token._task = contextvars.copy_context().run(loop.create_task, coro)
+        elif self.background:
+            assert self._executor is not None
+            self._executor().submit(contextvars.copy_context().run, self._run_sync, run)
+        else:
+            self._run_sync(run)
+
+    def _run_sync(self, run: CallbackRun) -> None:
+        reset = _current_run.set(run)
+        try:
+            self.func(self.app)
+        except asyncio.CancelledError:
+            self._finish(run, "cancelled")
+        except Exception as e:
+            self._finish(run, "error", e)
+            if not self.background:
+                raise
+            logger.exception("Callback %s failed", self.name)
+        else:
+            self._finish(run, "done")
+        finally:
+            _current_run.reset(reset)
+
+    async def _run_async(self, run: CallbackRun) -> None:
+        reset = _current_run.set(run)
+        try:
+            await self.func(self.app)
+        except asyncio.CancelledError:
+            self._finish(run, "cancelled")
+        except Exception as e:
+            self._finish(run, "error", e)
+            logger.exception("Callback %s failed", self.name)
+        else:
+            self._finish(run, "done")
+        finally:
+            _current_run.reset(reset)
+
+    def _finish(self, run: CallbackRun, outcome: str, error: Optional[Exception] = None) -> None:
+        with self._lock:
+            if self._active is not run:
+                return  # Superseded (cancel policy): leave the newer run's status alone
+            if outcome == "error":
+                self._set_status(run, loading=False, text=f"Error: {error}", color="error")
+            elif outcome == "cancelled" or run.token.cancelled:
+                self._set_status(run, loading=False, text="Cancelled", color="warning")
+            else:
+                # Still loading: the callback didn't call app.done() itself
+                self._set_status(run, loading=False, text="Done" if self.button and self.button.loading else None)
+            self._active = None
+            if not self._pending:
+                return
+            self._pending -= 1
+            next_run = CallbackRun(self.app, self.name)
+            self._active = next_run
+        self._start(next_run)
+
+    def _set_status(self, run: CallbackRun, loading: bool, text: Optional[str] = None, color: Optional[str] = None):
+        btn = self.button
+        if btn is None:
+            return
+        with btn.hold_sync():
+            btn.loading = loading
+            if run.caller not in self.app._status_widgets:
+                return
+            if text is not None:
+                btn.status_text = text
+            if color is not None:
+                btn.status_color = color
+
+
+class ChangeCoalescer:
+    """Dispatches on_change callbacks latest-value-wins, at most once per throttle_ms.
+
+    Changes are handed to the kernel's event loop rather than run inline, so a burst of
+    value messages that queued up while the kernel was busy results in one callback for
+    the latest value. The front end has already applied debounce_ms before sending.
+    Without a running event loop (scripts, tests), callbacks run inline.
+    """
+
+    def __init__(self, func: Callable, throttle_ms: int = 0):
+        self.func = func
+        self.throttle = throttle_ms / 1000
+        self._last_run = float("-inf")
+        self._scheduled = False
+        self._change = None
+
+    def __call__(self, change=None) -> None:
+        self._change = change
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.func(change)
+            return
+        if self._scheduled:
+            return  # The scheduled run picks up this change
+        self._scheduled = True
+        delay = self._last_run + self.throttle - loop.time()
+        if delay > 0:
+            loop.call_later(delay, self._run_scheduled, loop)
+        else:
+            loop.call_soon(self._run_scheduled, loop)
+
+    def _run_scheduled(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._scheduled = False
+        self._last_run = loop.time()
+        self.func(self._change)
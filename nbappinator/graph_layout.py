@@ -0,0 +1,194 @@
+"""Kernel-side graph layouts for NetworkGraph, in NumPy only.
+
+The browser's d3.forceSimulation can take tens of seconds to settle on large graphs
+and re-runs on every render. compute_layout produces canvas coordinates up front:
+a spectral initialization (power iteration on the random-walk matrix) refined by
+Fruchterman-Reingold, with exact repulsion for small graphs and a grid
+(center-of-mass) approximation for large ones. The radial and hierarchical
+variants place nodes by degree like their d3 counterparts, keeping the angle or
+horizontal order found by the force layout.
+"""
+
+from itertools import chain
+from typing import Any, Dict, Literal, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+LayoutType = Literal["force", "radial", "hierarchical", "clustered"]
+
+# {node: (x, y)}, as returned by compute_layout or networkx layout functions (numpy arrays)
+PositionsType = Mapping[Any, Union[Tuple[float, float], np.ndarray]]
+
+# Above this many nodes, repulsion is computed against grid cells instead of every node
+EXACT_REPULSION_MAX_NODES = 1000
+
+# Rows of the (nodes x nodes or cells) repulsion matrix processed at once
+_CHUNK = 2048
+
+
+def _scatter_add(n: int, index: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Sum rows of values (m, 2) into n rows by index; np.add.at, but much faster."""
+    return np.stack([np.bincount(index, values[:, d], minlength=n) for d in range(2)], axis=1)
+
+
+def _spectral_init(n: int, src: np.ndarray, dst: np.ndarray, rng: np.random.Generator, iterations: int = 60):
+    """Two leading non-trivial eigenvectors of the lazy random walk, by power iteration."""
+    degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n) + 1.0  # +1: self loop
+    x = rng.standard_normal((n, 2))
+    for _ in range(iterations):
+        y = x + _scatter_add(n, src, x[dst]) + _scatter_add(n, dst, x[src])  # x: self loop
+        x = 0.5 * (x + y / degree[:, None])
+        # Remove the trivial (constant) component in the degree-weighted inner product
+        x -= (degree @ x) / degree.sum()
+        x, _ = np.linalg.qr(x * np.sqrt(degree)[:, None])
+        x /= np.sqrt(degree)[:, None]
+    x += rng.standard_normal((n, 2)) * 1e-3 * (np.abs(x).max() or 1.0)  # Split coincident nodes
+    return x
+
+
+def _pairwise_repulsion(points: np.ndarray, sources: np.ndarray, weights: np.ndarray, k: float, exclude_self: bool):
+    """sum_j k^2 * weight_j * (p_i - s_j) / |p_i - s_j|^2, evaluated as p_i * sum_j w_ij - W @ s."""
+    out = np.empty_like(points)
+    sq = (sources**2).sum(axis=1)
+    for start in range(0, len(points), _CHUNK):
+        block = points[start : start + _CHUNK]
+        dist2 = (block**2).sum(axis=1)[:, None] + sq[None, :] - 2 * block @ sources.T
+        w = k * k * weights / np.maximum(dist2, 1e-6 * k * k)
+        if exclude_self:
+            np.fill_diagonal(w[:, start:], 0.0)
+        out[start : start + _CHUNK] = block * w.sum(axis=1)[:, None] - w @ sources
+    return out
+
+
+def _repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """Fruchterman-Reingold repulsion k^2 / d from every other node, or approximated on a grid."""
+    n = len(pos)
+    if n <= EXACT_REPULSION_MAX_NODES:
+        return _pairwise_repulsion(pos, pos, np.ones(n), k, exclude_self=True)
+    # One cell per ~16 nodes, at most 32x32. Far field: between cell centers of mass, shared by
+    # the cell's nodes. Near field: from the center of mass of the rest of the node's own cell.
+    cells = int(np.clip(np.sqrt(n / 16), 8, 32))
+    lo, span = pos.min(axis=0), np.ptp(pos, axis=0) + 1e-9
+    ij = np.minimum((cells * (pos - lo) / span).astype(np.intp), cells - 1)
+    cell = ij[:, 0] * cells + ij[:, 1]
+    occupied, cell = np.unique(cell, return_inverse=True)
+    count = np.bincount(cell).astype(float)
+    sums = _scatter_add(len(occupied), cell, pos)
+    far = _pairwise_repulsion(sums / count[:, None], sums / count[:, None], count, k, exclude_self=True)
+    rest = (count[cell] - 1)[:, None]
+    rest_com = (sums[cell] - pos) / np.maximum(rest, 1)
+    delta = pos - rest_com
+    dist2 = np.maximum((delta**2).sum(axis=1, keepdims=True), 1e-6 * k * k)
+    return far[cell] + delta * (k * k * rest / dist2)
+
+
+def _fruchterman_reingold(
+    pos: np.ndarray, src: np.ndarray, dst: np.ndarray, iterations: int, attraction: float
+) -> np.ndarray:
+    n = len(pos)
+    pos = (pos - pos.mean(axis=0)) / (np.abs(pos).max() or 1.0)  # In [-1, 1]
+    k = 2.0 / np.sqrt(n)  # Ideal edge length for a 2x2 area
+    temperature = 0.1
+    for i in range(iterations):
+        disp = _repulsion(pos, k)
+        delta = pos[src] - pos[dst]
+        dist = np.sqrt((delta**2).sum(axis=1)) + 1e-9
+        pull = delta * (attraction * dist / k)[:, None]  # (dist^2 / k) along the unit vector
+        disp += _scatter_add(n, dst, pull) - _scatter_add(n, src, pull)
+        length = np.sqrt((disp**2).sum(axis=1)) + 1e-9
+        step = temperature * (1 - i / iterations)
+        pos = pos + disp * (np.minimum(length, step) / length)[:, None]
+    return pos
+
+
+def _fit(pos: np.ndarray, width: int, height: int, margin: float) -> np.ndarray:
+    lo, span = pos.min(axis=0), np.ptp(pos, axis=0)
+    span[span == 0] = 1.0
+    size = np.array([width - 2 * margin, height - 2 * margin], dtype=float)
+    scale = (size / span).min()  # Keep the aspect ratio
+    return (pos - lo) * scale + margin + (size - span * scale) / 2
+
+
+def layout_positions(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    layout: LayoutType = "force",
+    width: int = 800,
+    height: int = 600,
+    iterations: int = 50,
+    seed: Optional[int] = 0,
+) -> np.ndarray:
+    """
+    Canvas coordinates for nodes 0..n-1 connected by edges src[i] - dst[i].
+
+    Returns:
+        (n, 2) float array of x, y in pixels within width x height
+    """
+    if n == 0:
+        return np.zeros((0, 2))
+    if n == 1:
+        return np.array([[width / 2, height / 2]], dtype=float)
+    src, dst = np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp)
+    keep = src != dst  # Self loops carry no layout information
+    src, dst = src[keep], dst[keep]
+    rng = np.random.default_rng(seed)
+    degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+    attraction = 2.0 if layout == "clustered" else 1.0
+    pos = _fruchterman_reingold(_spectral_init(n, src, dst, rng), src, dst, iterations, attraction)
+    margin = 20.0
+
+    if layout == "radial":
+        # Concentric rings by degree (high degree at the center), angles from the force layout
+        center = np.median(pos, axis=0)
+        angle = np.arctan2(pos[:, 1] - center[1], pos[:, 0] - center[0])
+        ring = degree.max() - degree
+        radius = (ring / (ring.max() or 1)) * (min(width, height) / 2 - margin)
+        return np.stack([width / 2 + radius * np.cos(angle), height / 2 + radius * np.sin(angle)], axis=1)
+    if layout == "hierarchical":
+        # High degree at the top, horizontal order from the force layout
+        rank = 1 - degree / (degree.max() or 1)
+        x = _fit(pos, width, height, margin)[:, 0]
+        return np.stack([x, 50 + rank * (height - 100)], axis=1)
+    return _fit(pos, width, height, margin)
+
+
+def compute_layout(
+    nx_graph,
+    layout: LayoutType = "force",
+    width: int = 800,
+    height: int = 600,
+    iterations: int = 50,
+    seed: Optional[int] = 0,
+) -> Dict[Any, Tuple[float, float]]:
+    """
+    Compute NetworkGraph node positions in the kernel.
+
+    Args:
+        nx_graph: NetworkX graph
+        layout: "force", "radial", "hierarchical" or "clustered", as in create_graph_d3
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+        iterations: Fruchterman-Reingold iterations
+        seed: Random seed, for reproducible layouts
+
+    Returns:
+        {node: (x, y)} in canvas pixels, like networkx layout functions
+    """
+    nodes = list(nx_graph.nodes())
+    index = dict(zip(nodes, range(len(nodes)), strict=True))
+    m = nx_graph.number_of_edges()
+    ends = np.fromiter(map(index.__getitem__, chain.from_iterable(nx_graph.edges())), dtype=np.intp, count=2 * m)
+    pos = layout_positions(len(nodes), ends[0::2], ends[1::2], layout, width, height, iterations, seed)
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, pos, strict=True)}
+
+
+def fit_positions(
+    positions: PositionsType, width: int = 800, height: int = 600, margin: float = 20.0
+) -> Dict[Any, Tuple[float, float]]:
+    """Scale positions in any coordinate system (e.g. networkx layouts) to the canvas."""
+    nodes = list(positions)
+    if not nodes:
+        return {}
+    pos = _fit(np.array([positions[node] for node in nodes], dtype=float), width, height, margin)
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, pos, strict=True)}
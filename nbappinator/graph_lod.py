@@ -0,0 +1,298 @@
+"""Level-of-detail aggregation for NetworkGraph: communities shown as expandable supernodes.
+
+A large network drawn node by node is an unreadable hairball and the costliest thing to
+render. Instead, ClusterView detects communities in the kernel by modularity-driven
+label propagation (vectorized with NumPy), repeating on the resulting supergraph, much
+like Louvain's levels, until it has at most max_nodes clusters. The browser first
+receives this top level only. Expanding a cluster replaces it with its sub-clusters
+(or, at the bottom level, its nodes), computed from the edges incident to its members,
+so the browser's working set grows only with what the user opens rather than with the
+graph.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .networkgraph import GraphArrays
+
+# Levels of clusters built at most; each level typically shrinks the graph several times
+MAX_LEVELS = 8
+
+# Aggregated links kept per item: a cluster's link is drawn only if it is among the heaviest
+# links of one of its ends, so the overview shows structure rather than a clique of clusters
+MAX_CLUSTER_LINKS = 8
+
+
+def label_propagation(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    volumes: Optional[np.ndarray] = None,
+    resolution: float = 1.0,
+    iterations: int = 10,
+    seed: Optional[int] = 0,
+) -> np.ndarray:
+    """
+    Community labels 0..k-1 for nodes 0..n-1 by modularity-driven label propagation.
+
+    Each round, a random half of the nodes move to the neighboring label with the best
+    modularity gain: the edge weight to that label, less resolution * the node's volume *
+    the label's volume / the total volume. Plain label propagation (most frequent label)
+    floods scale-free graphs with one giant community; the volume penalty prevents that.
+    Updating half the nodes at a time avoids the oscillation of fully synchronous rounds.
+
+    Args:
+        n: Number of nodes
+        src, dst: Edge endpoints
+        weights: Edge weights (default: 1)
+        volumes: Node volumes (default: weighted degree); supernodes pass their members' total
+        resolution: Higher values give smaller communities
+        iterations: Maximum rounds
+        seed: Random seed
+    """
+    rng = np.random.default_rng(seed)
+    keep = src != dst
+    u = np.concatenate([src[keep], dst[keep]]).astype(np.int64)
+    v = np.concatenate([dst[keep], src[keep]])
+    w = np.ones(len(u)) if weights is None else np.concatenate([weights[keep], weights[keep]]).astype(float)
+    if volumes is None:
+        volumes = np.bincount(u, w, minlength=n)
+    volumes = volumes.astype(float)
+    penalty = resolution * volumes / (volumes.sum() or 1.0)
+    labels = np.arange(n)
+    for _ in range(iterations):
+        if len(u) == 0:
+            break
+        label_volume = np.bincount(labels, volumes, minlength=n)
+        # Edge weight per (node, neighbor label): sort the pairs and sum the runs
+        key = u * n + labels[v]
+        order = np.argsort(key)
+        key = key[order]
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        node, label = np.divmod(key[starts], n)
+        own = label == labels[node]
+        gain = np.add.reduceat(w[order], starts) - penalty[node] * (
+            label_volume[label] - np.where(own, volumes[node], 0.0)
+        )
+        # Staying put: the own label's gain, with no edge weight if no neighbor shares it
+        stay = -penalty * (label_volume[labels] - volumes)
+        stay[node[own]] = gain[own]
+        gain += rng.random(len(gain)) * 1e-9  # Random tie-break
+        # Best label per node: runs are sorted by node, so take the maximum of each node's runs
+        first = np.flatnonzero(np.r_[True, node[1:] != node[:-1]])
+        best_gain = np.maximum.reduceat(gain, first)
+        best = np.flatnonzero(gain == np.repeat(best_gain, np.diff(np.r_[first, len(gain)])))
+        best = best[np.r_[True, node[best][1:] != node[best][:-1]]]
+        node, label, gain = node[best], label[best], gain[best]
+        better = gain > stay[node] + 1e-9
+        if np.count_nonzero(better) <= n // 1000:
+            break
+        move = better & (rng.random(len(node)) < 0.5)
+        labels[node[move]] = label[move]
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def _aggregate(
+    a: np.ndarray, b: np.ndarray, directed: bool, weights: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Distinct (a, b) pairs without self pairs, with their summed weights (or counts)."""
+    keep = a != b
+    a, b = a[keep], b[keep]
+    if not directed:
+        a, b = np.minimum(a, b), np.maximum(a, b)
+    base = int(max(a.max(initial=0), b.max(initial=0))) + 1
+    pairs, inverse = np.unique(a.astype(np.int64) * base + b, return_inverse=True)
+    total = np.bincount(inverse, weights[keep] if weights is not None else None, minlength=len(pairs))
+    return pairs // base, pairs % base, total
+
+
+class ClusterView:
+    """
+    A cluster hierarchy over a graph and the part of it currently shown.
+
+    Every node is displayed through exactly one item: a cluster at some level, or the node
+    itself (level 0). Items are identified to the browser as "n<node>" or "c<level>:<cluster>".
+    Clusters of one node, and clusters equal to their only sub-cluster, are shown as the
+    lower item directly.
+
+    Links touching a cluster are capped: each is kept only if it is among the
+    max_cluster_links (default 8) heaviest links of either of its ends, out of the links
+    added with it (the overview's, or an expansion's). Links between two nodes are edges of
+    the graph and always kept.
+    """
+
+    def __init__(
+        self,
+        arrays: "GraphArrays",
+        max_nodes: int = 500,
+        directed: bool = False,
+        xy: Optional[np.ndarray] = None,
+        seed: Optional[int] = 0,
+        max_cluster_links: int = MAX_CLUSTER_LINKS,
+    ):
+        if max_nodes < 1:
+            raise ValueError("max_nodes must be positive")
+        if max_cluster_links < 1:
+            raise ValueError("max_cluster_links must be positive")
+        n = len(arrays.nodes)
+        self._n = max(n, 1)
+        self._names = arrays.names
+        self._degrees = arrays.degrees
+        self._src, self._dst = arrays.sources, arrays.targets
+        self._directed = directed
+        self._xy = xy
+        self._max_cluster_links = max_cluster_links
+
+        # node_cluster[level][node]: the node's cluster at each level (level 0: the node itself)
+        self._node_cluster: List[np.ndarray] = [np.arange(n)]
+        items, src, dst, weights = n, self._src, self._dst, None
+        volumes = self._degrees.astype(float)
+        while items > max_nodes and len(self._node_cluster) <= MAX_LEVELS:
+            labels = label_propagation(items, src, dst, weights, volumes, seed=seed)
+            k = int(labels.max(initial=-1)) + 1
+            if k > 0.8 * items:
+                # Little community structure left (e.g. isolated nodes): group into max_nodes buckets
+                labels = np.arange(items) * max_nodes // items
+                k = int(labels.max(initial=-1)) + 1
+            self._node_cluster.append(labels[self._node_cluster[-1]])
+            src, dst, weights = _aggregate(labels[src], labels[dst], directed, weights)
+            volumes = np.bincount(labels, volumes, minlength=k)
+            items = k
+
+        # Per level: cluster sizes, summed degrees, highest-degree member (its name), centroid
+        self._sizes, self._cluster_degrees, self._representatives, self._centroids = [], [], [], []
+        for level, clusters in enumerate(self._node_cluster):
+            count = int(clusters.max(initial=-1)) + 1
+            size = np.bincount(clusters, minlength=count)
+            self._sizes.append(size)
+            self._cluster_degrees.append(np.bincount(clusters, self._degrees, minlength=count).astype(np.int64))
+            by_degree = np.lexsort((self._degrees, clusters))
+            last = np.flatnonzero(np.r_[clusters[by_degree][1:] != clusters[by_degree][:-1], True])
+            self._representatives.append(by_degree[last] if n else by_degree)
+            if xy is not None and level > 0:
+                sums = np.stack([np.bincount(clusters, xy[:, d], minlength=count) for d in range(2)], axis=1)
+                self._centroids.append(sums / np.maximum(size, 1)[:, None])
+            else:
+                self._centroids.append(xy)
+
+        # Edge ids incident to each node (CSR over both ends), for expanding a cluster's members
+        m = len(self._src)
+        ends = np.concatenate([self._src, self._dst])
+        self._incident = np.concatenate([np.arange(m), np.arange(m)])[np.argsort(ends, kind="stable")]
+        self._indptr = np.r_[0, np.cumsum(np.bincount(ends, minlength=n))]
+
+        top = len(self._node_cluster) - 1
+        self._item_of_node = self._display_items(top, np.arange(n))
+        self._links: Dict[Tuple[int, int], int] = {}
+        self._add_links(np.arange(m))
+
+    @property
+    def levels(self) -> int:
+        """Levels of clusters above the nodes."""
+        return len(self._node_cluster) - 1
+
+    def _display_items(self, level: int, members: np.ndarray) -> np.ndarray:
+        """Item codes (level * n + cluster) showing members at level, skipping redundant clusters."""
+        levels = np.full(len(members), level)
+        for lower in range(level, 0, -1):
+            same = (levels == lower) & (
+                self._sizes[lower - 1][self._node_cluster[lower - 1][members]]
+                == self._sizes[lower][self._node_cluster[lower][members]]
+            )
+            levels[same] = lower - 1
+        clusters = np.empty(len(members), dtype=np.int64)
+        for lvl in np.unique(levels):
+            mask = levels == lvl
+            clusters[mask] = self._node_cluster[lvl][members[mask]]
+        return levels.astype(np.int64) * self._n + clusters
+
+    def _add_links(self, edges: np.ndarray) -> None:
+        a, b, count = _aggregate(
+            self._item_of_node[self._src[edges]], self._item_of_node[self._dst[edges]], self._directed
+        )
+        keep = (a < self._n) & (b < self._n)  # Both ends nodes (level 0): an edge of the graph
+        # Rank each link among all links touching an item, heaviest first, and keep each item's top ones
+        ends = np.r_[a, b]
+        link = np.r_[np.arange(len(a)), np.arange(len(a))]
+        order = np.lexsort((-np.r_[count, count], ends))
+        starts = np.flatnonzero(np.r_[True, ends[order][1:] != ends[order][:-1]])
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        keep[link[order[rank < self._max_cluster_links]]] = True
+        a, b, count = a[keep], b[keep], count[keep]
+        self._links.update(zip(zip(a.tolist(), b.tolist(), strict=True), count.astype(int).tolist(), strict=True))
+
+    def _item_id(self, code: int) -> str:
+        level, k = divmod(code, self._n)
+        return f"n{k}" if level == 0 else f"c{level}:{k}"
+
+    def _parse_id(self, item_id: str) -> Optional[int]:
+        try:
+            if item_id.startswith("c"):
+                level, k = map(int, item_id[1:].split(":"))
+                return level * self._n + k if 0 < level < len(self._node_cluster) and 0 <= k < self._n else None
+        except ValueError:
+            pass
+        return None
+
+    def _node_dict(self, code: int) -> Dict[str, Any]:
+        level, k = divmod(code, self._n)
+        if level == 0:
+            node: Dict[str, Any] = {"id": f"n{k}", "name": self._names[k], "degree": int(self._degrees[k])}
+        else:
+            size = int(self._sizes[level][k])
+            node = {
+                "id": f"c{level}:{k}",
+                "name": f"{self._names[self._representatives[level][k]]} +{size - 1}",
+                "degree": int(self._cluster_degrees[level][k]),
+                "size": size,
+                "cluster": True,
+            }
+        if self._centroids[level] is not None:
+            node["x"], node["y"] = self._centroids[level][k].tolist()
+        return node
+
+    def _link_dicts(self, pairs) -> List[Dict[str, Any]]:
+        return [
+            {"source": self._item_id(a), "target": self._item_id(b), "count": count}
+            for (a, b), count in ((pair, self._links[pair]) for pair in pairs)
+        ]
+
+    def nodes(self) -> List[Dict[str, Any]]:
+        """Node dicts of every item shown."""
+        return [self._node_dict(code) for code in np.unique(self._item_of_node).tolist()]
+
+    def links(self) -> List[Dict[str, Any]]:
+        """Link dicts between the items shown; "count" is the number of edges aggregated."""
+        return self._link_dicts(self._links)
+
+    def expand(self, item_id: str) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Replace a shown cluster by its sub-clusters or nodes.
+
+        Returns:
+            (nodes, links): the new items and every link touching them, or None if
+            item_id isn't a cluster currently shown
+        """
+        code = self._parse_id(item_id)
+        if code is None:
+            return None
+        members = np.flatnonzero(self._item_of_node == code)
+        if len(members) == 0:
+            return None
+        children = self._display_items(code // self._n - 1, members)
+        self._item_of_node[members] = children
+
+        # Links of the cluster are replaced by those of its children, from the members' edges
+        for pair in [pair for pair in self._links if code in pair]:
+            del self._links[pair]
+        starts, ends = self._indptr[members], self._indptr[members + 1]
+        counts = ends - starts
+        offsets = np.repeat(starts - np.r_[0, np.cumsum(counts)[:-1]], counts)
+        self._add_links(np.unique(self._incident[offsets + np.arange(counts.sum())]))
+
+        new_items = set(np.unique(children).tolist())
+        new_links = [pair for pair in self._links if pair[0] in new_items or pair[1] in new_items]
+        return [self._node_dict(child) for child in sorted(new_items)], self._link_dicts(new_links)
@@ -1,14 +1,15 @@
 from typing import Literal, Optional
 
-import anywidget
 import traitlets
 
+from .assets import ASSET_LOADER_JS, AssetWidget
+
 LayoutEngine = Literal["dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork"]
 
 DEFAULT_GRAPHVIZ_VERSION = "latest"
 
 
-class GraphvizGraph(anywidget.AnyWidget):
+class GraphvizGraph(AssetWidget):
     """Graphviz graph widget using WASM for rendering."""
 
     dot_source = traitlets.Unicode("digraph {}").tag(sync=True)
@@ -20,13 +21,15 @@ class GraphvizGraph(anywidget.AnyWidget):
     show_labels = traitlets.Bool(True).tag(sync=True)
     graphviz_version = traitlets.Unicode(DEFAULT_GRAPHVIZ_VERSION).tag(sync=True)
 
-    _esm = r"""
+    _esm = (
+        ASSET_LOADER_JS
+        + r"""
     async function render({ model, el }) {
         const gvVersion = model.get("graphviz_version") || "latest";
 
         // Dynamic imports - graphviz version configurable, d3 always latest (only used for zoom/pan)
-        const { Graphviz } = await import(`https://cdn.jsdelivr.net/npm/@hpcc-js/wasm-graphviz@${gvVersion}/dist/index.js`);
-        const d3 = await import(`https://cdn.jsdelivr.net/npm/d3@latest/+esm`);
+        const { Graphviz } = await loadAsset(model, "graphviz", `https://cdn.jsdelivr.net/npm/@hpcc-js/wasm-graphviz@${gvVersion}/dist/index.js`);
+        const d3 = await loadAsset(model, "d3", `https://cdn.jsdelivr.net/npm/d3@latest/+esm`);
 
         const dotSource = model.get("dot_source");
         const width = model.get("width");
@@ -273,6 +276,7 @@ class GraphvizGraph(anywidget.AnyWidget):
 
     export default { render }
     """
+    )
 
 
 def networkx_to_dot(
@@ -0,0 +1,184 @@
+"""Memoize expensive callback results keyed on widget values.
+
+Dashboards often recompute the same DataFrame or figure when a user flips back to a
+previously seen selection. The memoize decorator caches what a function returns,
+keyed by the current values of the named widgets (read with App.get) plus its
+arguments, with LRU, TTL and memory-budget eviction.
+
+Example:
+    @nbapp.memoize("source", "window", maxsize=16, ttl=600, max_bytes=500_000_000)
+    def load(app):
+        return expensive_query(app["source"], app["window"])
+
+    def draw(app):
+        app.tab("Data").clear().dataframe("rows", load(app))
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, NamedTuple, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_pandas_object
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    nbytes: int
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory held by a cached value, in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if hasattr(value, "to_plotly_json"):  # Plotly figures: the size of their data
+        return estimate_size(value.to_plotly_json())
+    return sys.getsizeof(value)
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a widget value or argument (lists, dicts, selected rows)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        # Keys may be of mixed, mutually unorderable types: order by type, then repr
+        items = sorted(value.items(), key=lambda item: (type(item[0]).__name__, repr(item[0])))
+        return tuple((k, _freeze(v)) for k, v in items)
+    try:
+        if isinstance(value, pd.DataFrame):
+            # pandas.util resolves its exports lazily, which type checkers can't follow
+            hashed = cast(pd.Series, hash_pandas_object(value, index=True))  # type: ignore[arg-type]
+            return (tuple(value.columns), hashed.to_numpy().tobytes())
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class _Cache:
+    """Thread-safe LRU store with optional TTL and byte budget."""
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float], max_bytes: Optional[int], sizeof: Callable):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries: OrderedDict = OrderedDict()  # key -> (value, expires, nbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key) -> Tuple[bool, Any]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key, value) -> None:
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, expires, nbytes)
+            self.nbytes += nbytes
+            while (self.maxsize is not None and len(self.entries) > self.maxsize) or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes
+            ):
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, key) -> None:
+        _, _, nbytes = self.entries.pop(key)
+        self.nbytes -= nbytes
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+
+def memoize(
+    *names: str,
+    maxsize: Optional[int] = 32,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    sizeof: Callable[[Any], int] = estimate_size,
+) -> Callable:
+    """
+    Cache a function's results keyed on the values of named widgets.
+
+    The decorated function receives the app as its first argument, like callbacks.
+    Its result is cached under the current values of the named widgets (app.get)
+    plus any further arguments, so returning to a previously seen combination
+    returns the cached DataFrame/figure instead of recomputing it. Cached results
+    are shared, not copied: don't mutate them.
+
+    Args:
+        names: Widgets whose values key the cache
+        maxsize: Maximum number of results, least recently used evicted first (None: unbounded)
+        ttl: Seconds a result stays valid (None: no expiry)
+        max_bytes: Memory budget for cached results, as measured by sizeof; results
+            larger than the budget aren't cached
+        sizeof: Size estimate in bytes of a result (default: estimate_size)
+
+    The wrapper has cache_info() and cache_clear(), like functools.lru_cache.
+    """
+    if len(names) == 1 and callable(names[0]):  # Bare @memoize: keyed on arguments only
+        return memoize(maxsize=maxsize, ttl=ttl, max_bytes=max_bytes, sizeof=sizeof)(names[0])
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError("maxsize must be positive or None")
+
+    def decorator(func: Callable) -> Callable:
+        cache = _Cache(maxsize, ttl, max_bytes, sizeof)
+
+        @wraps(func)
+        def wrapper(app, *args, **kwargs):
+            key = (
+                tuple(_freeze(app.get(name)) for name in names),
+                _freeze(args),
+                _freeze(kwargs),
+            )
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(app, *args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        def cache_info() -> CacheInfo:
+            with cache.lock:
+                return CacheInfo(cache.hits, cache.misses, maxsize, len(cache.entries), cache.nbytes)
+
+        wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -1,15 +1,40 @@
-from typing import Literal
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import chain, compress
+from operator import methodcaller
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Union, cast
 
-import anywidget
+import numpy as np
+import pandas as pd
 import traitlets
 
-LayoutType = Literal["force", "radial", "hierarchical", "clustered"]
+from .assets import ASSET_LOADER_JS, AssetWidget
+from .graph_layout import LayoutType, PositionsType, fit_positions, layout_positions
+from .graph_lod import ClusterView
+
+SimulationMode = Literal["full", "warm", "off"]
+RendererType = Literal["svg", "canvas", "webgl"]
+
+# Node/link transports: "json" lists of dicts, or "binary" typed arrays
+GraphTransportType = Literal["json", "binary"]
+
+logger = logging.getLogger(__name__)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
 
 # Default D3 version - use "latest" or pin to specific version like "7"
 DEFAULT_D3_VERSION = "latest"
 
 
-class NetworkGraph(anywidget.AnyWidget):
+class NetworkGraph(AssetWidget):
     """D3 force-directed graph widget for NetworkX graphs."""
 
     nodes = traitlets.List([]).tag(sync=True)
@@ -25,18 +50,147 @@ class NetworkGraph(anywidget.AnyWidget):
     node_size = traitlets.Int(8).tag(sync=True)
     size_by_degree = traitlets.Bool(False).tag(sync=True)
     d3_version = traitlets.Unicode(DEFAULT_D3_VERSION).tag(sync=True)
+    # "full": simulate from scratch (or from node x/y), "warm": settle briefly from node x/y,
+    # "off": draw node x/y as given
+    simulation = traitlets.Unicode("full").tag(sync=True)
+    # "svg": one element per node/link, "canvas"/"webgl": one drawing for 100k+ elements
+    renderer = traitlets.Unicode("svg").tag(sync=True)
+
+    # transport="binary": nodes and links as typed arrays instead of the nodes/links lists
+    transport = traitlets.Unicode("json").tag(sync=True)
+    node_names = traitlets.Bytes(b"").tag(sync=True)  # UTF-8 string table, NUL-separated; index = node index
+    node_degrees = traitlets.Bytes(b"").tag(sync=True)  # Int32 per node
+    node_positions = traitlets.Bytes(b"").tag(sync=True)  # Float32 x, y per node, or empty
+    link_sources = traitlets.Bytes(b"").tag(sync=True)  # Int32 node index per link
+    link_targets = traitlets.Bytes(b"").tag(sync=True)  # Int32 node index per link
+    link_weights = traitlets.Bytes(b"").tag(sync=True)  # Float32 per link (NaN: none), or empty
+
+    # lod=True: cluster expansions included in nodes/links, which are rebuilt when a view is rendered
+    lod_version = traitlets.Int(0).tag(sync=True)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._link_data: Optional[List[Dict[str, Any]]] = None  # Edge attributes by link index (binary)
+        self._link_attributes: Optional[List[str]] = None  # Attributes shown in tooltips (None: all)
+        self._lod: Optional[ClusterView] = None  # lod=True: the clusters shown, expanded on request
+        self._lod_positions: Dict[str, Tuple[float, float]] = {}  # lod=True: positions placed in the kernel
+        self._lod_expansions = 0  # lod=True: expansions sent to views, as deltas
+        self.on_msg(self._on_custom_msg)
+
+    def _on_custom_msg(self, widget, content, buffers):
+        if isinstance(content, dict) and content.get("type") == "get_link":
+            self._send_link_attributes(content)
+        elif isinstance(content, dict) and content.get("type") == "expand":
+            self._expand_cluster(content)
+        elif isinstance(content, dict) and content.get("type") == "ready":
+            self._sync_lod()
+
+    def _send_link_attributes(self, request: Dict[str, Any]):
+        index = request.get("index")
+        try:
+            i = int(index)  # type: ignore[arg-type]
+            data = self._link_data[i] if self._link_data is not None and 0 <= i < len(self._link_data) else {}
+            attributes = {
+                key: _json_value(value)
+                for key, value in data.items()
+                if (self._link_attributes is None or key in self._link_attributes)
+                and not (key == "weight" and self.link_weights)  # Already in link_weights
+            }
+            self.send({"type": "link", "index": index, "attributes": attributes})
+        except Exception:
+            logger.exception("Failed to serve link attributes")
+
+    def _expand_cluster(self, request: Dict[str, Any]):
+        if self._lod is None:
+            return
+        try:
+            expanded = self._lod.expand(str(request.get("id")))
+            if expanded is None:
+                return
+            nodes, links = expanded
+            # Children without positions of their own start on a ring around their cluster
+            parent = self._lod_positions.pop(str(request.get("id")), None)
+            if parent is not None:
+                ring = 10.0 + 4.0 * np.sqrt(len(nodes))
+                for i, node in enumerate(nodes):
+                    if "x" not in node:
+                        angle = 2 * np.pi * i / len(nodes)
+                        node["x"] = parent[0] + ring * float(np.cos(angle))
+                        node["y"] = parent[1] + ring * float(np.sin(angle))
+                        self._lod_positions[node["id"]] = (node["x"], node["y"])
+            # Only the delta is sent; nodes/links are rebuilt when a view needs them (_sync_lod)
+            self._lod_expansions += 1
+            message = {"type": "expand", "id": request.get("id"), "version": self._lod_expansions}
+            self.send({**message, "nodes": nodes, "links": links})
+        except Exception:
+            logger.exception("Failed to expand cluster")
+
+    def _sync_lod(self):
+        """Rebuild nodes/links after expansions, for a view rendered from the older lists."""
+        if self._lod is None or self.lod_version == self._lod_expansions:
+            return
+        try:
+            nodes = self._lod.nodes()
+            for node in nodes:
+                if node["id"] in self._lod_positions:
+                    node["x"], node["y"] = self._lod_positions[node["id"]]
+            with self.hold_sync():
+                self.nodes = nodes
+                self.links = self._lod.links()
+                self.lod_version = self._lod_expansions
+        except Exception:
+            logger.exception("Failed to rebuild clusters")
+
+    _esm = (
+        ASSET_LOADER_JS
+        + r"""
+    // View a binary buffer (a DataView from anywidget) as a typed array; copies only if misaligned
+    function typedArray(Type, view) {
+        if (!view || view.byteLength === 0) return null;
+        if (view.byteOffset % Type.BYTES_PER_ELEMENT === 0) {
+            return new Type(view.buffer, view.byteOffset, view.byteLength / Type.BYTES_PER_ELEMENT);
+        }
+        return new Type(view.buffer.slice(view.byteOffset, view.byteOffset + view.byteLength));
+    }
+
+    // Node and link objects from the nodes/links lists, or from the typed arrays of transport="binary"
+    function readGraph(model) {
+        if (model.get("transport") !== "binary") {
+            // Copies: d3 adds positions to them, and lod=True expands clusters in place
+            return [model.get("nodes").map(d => ({ ...d })), model.get("links").map(l => ({ ...l }))];
+        }
+        const degrees = typedArray(Int32Array, model.get("node_degrees")) || new Int32Array(0);
+        const names = degrees.length ? new TextDecoder().decode(model.get("node_names")).split("\0") : [];
+        const xy = typedArray(Float32Array, model.get("node_positions"));
+        const nodes = Array.from(degrees, (degree, i) => {
+            const node = { id: names[i], name: names[i], degree };
+            if (xy) {
+                node.x = xy[2 * i];
+                node.y = xy[2 * i + 1];
+            }
+            return node;
+        });
+        const sources = typedArray(Int32Array, model.get("link_sources")) || new Int32Array(0);
+        const targets = typedArray(Int32Array, model.get("link_targets"));
+        const weights = typedArray(Float32Array, model.get("link_weights"));
+        const links = Array.from(sources, (source, i) => {
+            const link = { index: i, source: nodes[source], target: nodes[targets[i]] };
+            if (weights && !Number.isNaN(weights[i])) link.weight = Number(weights[i].toPrecision(7));
+            return link;
+        });
+        return [nodes, links];
+    }
 
-    _esm = r"""
     async function render({ model, el }) {
         const d3Version = model.get("d3_version") || "latest";
-        const d3 = await import(`https://cdn.jsdelivr.net/npm/d3@${d3Version}/+esm`);
+        const d3 = await loadAsset(model, "d3", `https://cdn.jsdelivr.net/npm/d3@${d3Version}/+esm`);
 
         const origWidth = model.get("width");
         const origHeight = model.get("height");
         let width = origWidth;
         let height = origHeight;
-        const nodes = model.get("nodes");
-        const links = model.get("links");
+        const [nodes, links] = readGraph(model);
+        const binary = model.get("transport") === "binary";
         const layout = model.get("layout");
         const chargeStrength = model.get("charge_strength");
         const linkDistance = model.get("link_distance");
@@ -45,6 +199,8 @@ class NetworkGraph(anywidget.AnyWidget):
         const directed = model.get("directed");
         const nodeSize = model.get("node_size");
         const sizeByDegree = model.get("size_by_degree");
+        const simulationMode = model.get("simulation") || "full";
+        const renderer = model.get("renderer") || "svg";
 
         // Detect if we're in dark mode by checking computed background
         const isDark = window.getComputedStyle(document.body).backgroundColor
@@ -54,15 +210,116 @@ class NetworkGraph(anywidget.AnyWidget):
         const borderColor = isDark ? "#555" : "#ccc";
         const bgColor = isDark ? "#1e1e1e" : "#ffffff";
 
-        // Create container for SVG and fullscreen button
+        // lod=True clusters (d.size members) grow with the log of their size
+        const radius = d => {
+            if (d.size > 1) return nodeSize + 3 * Math.log2(d.size);
+            return sizeByDegree ? nodeSize + d.degree * 2 : nodeSize;
+        };
+        let maxDegree = d3.max(nodes, d => d.degree) || 0;  // Not Math.max(...): 100k+ arguments overflow the stack
+        const linkTitle = d => {
+            let text = (d.source.name ?? d.source) + " → " + (d.target.name ?? d.target);
+            if (d.count > 1) text += "\nEdges: " + d.count;
+            if (d.weight !== undefined && d.weight !== null) text += "\nWeight: " + d.weight;
+            if (d.type) text += "\nType: " + d.type;
+            for (const [key, value] of Object.entries(d.attributes || {})) text += `\n${key}: ${value}`;
+            return text;
+        };
+
+        // transport="binary" keeps edge attributes in the kernel; fetch a link's when it's hovered
+        const linkRequests = new Map();  // Link index -> { link, onLoaded }
+        function fetchLinkAttributes(link, onLoaded) {
+            if (!binary || link.attributes) return;
+            if (!linkRequests.has(link.index)) model.send({ type: "get_link", index: link.index });
+            linkRequests.set(link.index, { link, onLoaded });
+        }
+        const onMessage = (msg) => {
+            if (msg && msg.type === "expand") applyExpansion(msg);
+            if (!msg || msg.type !== "link" || !linkRequests.has(msg.index)) return;
+            const { link, onLoaded } = linkRequests.get(msg.index);
+            linkRequests.delete(msg.index);
+            link.attributes = msg.attributes;
+            onLoaded();
+        };
+        model.on("msg:custom", onMessage);
+        const nodeTitle = d => d.cluster
+            ? `${d.name}\n${d.size} nodes, click to expand`
+            : `${d.name} (degree: ${d.degree})`;
+
+        // lod=True: the kernel replaces a clicked cluster by its sub-clusters or nodes
+        const expanding = new Set();
+        function expandCluster(d) {
+            if (!d || !d.cluster || expanding.has(d.id)) return;
+            expanding.add(d.id);
+            model.send({ type: "expand", id: d.id });
+        }
+
+        function removeWhere(array, predicate) {
+            let j = 0;
+            for (const item of array) if (!predicate(item)) array[j++] = item;
+            array.length = j;
+        }
+
+        // Expansions applied here: deltas arrive in order, numbered from the nodes/links read at render
+        let lodVersion = model.get("lod_version");
+
+        function applyExpansion(msg) {
+            expanding.delete(msg.id);
+            if (msg.version !== lodVersion + 1) return;  // Rendered from older lists: reloadGraph catches up
+            lodVersion = msg.version;
+            const parent = nodes.find(d => d.id === msg.id);
+            if (!parent) return;
+            removeWhere(nodes, d => d === parent);
+            removeWhere(links, l => l.source === parent || l.target === parent);
+            const byId = new Map(nodes.map(d => [d.id, d]));
+            const ring = 10 + 4 * Math.sqrt(msg.nodes.length);
+            msg.nodes.forEach((item, i) => {
+                const d = { ...item };
+                if (d.x === undefined || simulationMode !== "off") {
+                    // Around the cluster's current position, which the simulation may have moved
+                    const angle = 2 * Math.PI * i / msg.nodes.length;
+                    d.x = parent.x + ring * Math.cos(angle);
+                    d.y = parent.y + ring * Math.sin(angle);
+                }
+                nodes.push(d);
+                byId.set(d.id, d);
+            });
+            for (const item of msg.links) {
+                const l = { ...item, source: byId.get(item.source), target: byId.get(item.target) };
+                if (l.source && l.target) links.push(l);
+            }
+            refreshGraph();
+        }
+
+        // The kernel rebuilt nodes/links for a newer view; views that applied every expansion are current
+        function reloadGraph() {
+            if (model.get("lod_version") <= lodVersion) return;
+            lodVersion = model.get("lod_version");
+            const [newNodes, newLinks] = readGraph(model);
+            nodes.length = 0;
+            for (const d of newNodes) nodes.push(d);
+            links.length = 0;
+            for (const l of newLinks) links.push(l);
+            refreshGraph();
+        }
+        model.on("change:lod_version", reloadGraph);
+
+        function refreshGraph() {
+            maxDegree = d3.max(nodes, d => d.degree) || 0;
+            simulation.nodes(nodes);
+            configureForces();
+            view.update();
+            if (simulationMode === "off") {
+                view.draw();
+            } else {
+                simulation.alpha(0.3).restart();
+            }
+        }
+
+        // Create container for the graph and fullscreen button
         const container = document.createElement("div");
+        container.className = "nbapp-network-graph";
         container.style.cssText = "position: relative; display: inline-block;";
 
-        const svg = d3.create("svg")
-            .attr("width", width)
-            .attr("height", height)
-            .attr("style", `border: 1px solid ${borderColor}; background: ${bgColor};`);
-
         // Create fullscreen toggle button
         const fsBtn = document.createElement("button");
         fsBtn.innerHTML = "⛶";
@@ -96,9 +353,16 @@ class NetworkGraph(anywidget.AnyWidget):
                 fsBtn.innerHTML = "⛶";
                 fsBtn.title = "Toggle fullscreen";
             }
-            svg.attr("width", width).attr("height", height);
-            configureForces();
-            simulation.alpha(0.3).restart();
+            if (simulationMode === "full") {
+                view.resize(width, height, null);
+                configureForces();
+                simulation.alpha(0.3).restart();
+            } else {
+                // Precomputed positions: scale the drawing instead of re-running the simulation
+                const k = Math.min(width / origWidth, height / origHeight);
+                const transform = { k, x: (width - origWidth * k) / 2, y: (height - origHeight * k) / 2 };
+                view.resize(width, height, isFullscreen ? transform : null);
+            }
         };
 
         // Handle Escape key to exit fullscreen
@@ -123,7 +387,6 @@ class NetworkGraph(anywidget.AnyWidget):
 
             if (layout === "radial") {
                 // Radial layout: nodes arranged by degree in concentric circles
-                const maxDegree = Math.max(...nodes.map(d => d.degree));
                 simulation
                     .force("link", d3.forceLink(links).id(d => d.id).distance(linkDistance * 0.6).strength(0.5))
                     .force("charge", d3.forceManyBody().strength(chargeStrength * 0.5))
@@ -135,7 +398,6 @@ class NetworkGraph(anywidget.AnyWidget):
                     .force("collision", d3.forceCollide().radius(15));
             } else if (layout === "hierarchical") {
                 // Hierarchical layout: high-degree nodes at top, flows down
-                const maxDegree = Math.max(...nodes.map(d => d.degree));
                 simulation
                     .force("link", d3.forceLink(links).id(d => d.id).distance(linkDistance * 0.75).strength(0.7))
                     .force("charge", d3.forceManyBody().strength(chargeStrength * 0.75))
@@ -163,111 +425,482 @@ class NetworkGraph(anywidget.AnyWidget):
         }
 
         configureForces();
-
-        // Add arrow marker definition for directed graphs
-        if (directed) {
-            svg.append("defs").append("marker")
-                .attr("id", "arrowhead")
-                .attr("viewBox", "0 -5 10 10")
-                .attr("refX", 20)
-                .attr("refY", 0)
-                .attr("markerWidth", 6)
-                .attr("markerHeight", 6)
-                .attr("orient", "auto")
-                .append("path")
-                .attr("d", "M0,-5L10,0L0,5")
-                .attr("fill", "#999");
+        if (simulationMode === "off") {
+            simulation.stop();
+        } else if (simulationMode === "warm") {
+            simulation.alpha(0.1);
         }
 
-        const link = svg.append("g")
-            .selectAll("line")
-            .data(links)
-            .join("line")
-            .attr("stroke", "#999")
-            .attr("stroke-opacity", 0.6)
-            .attr("stroke-width", 2)
-            .attr("marker-end", directed ? "url(#arrowhead)" : null);
-
-        // Add hover tooltip for edges
-        link.append("title")
-            .text(d => {
-                let text = (d.source.id || d.source) + " → " + (d.target.id || d.target);
-                if (d.weight !== undefined && d.weight !== null) text += "\nWeight: " + d.weight;
-                if (d.type) text += "\nType: " + d.type;
-                return text;
-            });
-
-        const node = svg.append("g")
-            .selectAll("circle")
-            .data(nodes)
-            .join("circle")
-            .attr("r", d => sizeByDegree ? nodeSize + d.degree * 2 : nodeSize)
-            .attr("fill", nodeColor)
-            .attr("stroke", "#fff")
-            .attr("stroke-width", 2)
-            .call(d3.drag()
-                .on("start", dragstarted)
-                .on("drag", dragged)
-                .on("end", dragended));
-
-        const label = svg.append("g")
-            .selectAll("text")
-            .data(nodes)
-            .join("text")
-            .text(d => d.name)
-            .attr("font-size", 10)
-            .attr("fill", textColor)
-            .attr("dx", 12)
-            .attr("dy", 4)
-            .attr("visibility", showLabels ? "visible" : "hidden");
-
-        node.append("title")
-            .text(d => `${d.name} (degree: ${d.degree})`);
-
-        simulation.on("tick", () => {
-            link
-                .attr("x1", d => d.source.x)
-                .attr("y1", d => d.source.y)
-                .attr("x2", d => d.target.x)
-                .attr("y2", d => d.target.y);
-
-            node
-                .attr("cx", d => d.x)
-                .attr("cy", d => d.y);
-
-            label
-                .attr("x", d => d.x)
-                .attr("y", d => d.y);
-        });
-
-        function dragstarted(event, d) {
+        function dragstarted(event) {
+            if (simulationMode === "off") return;
+            const d = event.subject;
             if (!event.active) simulation.alphaTarget(0.3).restart();
             d.fx = d.x;
             d.fy = d.y;
         }
 
-        function dragged(event, d) {
-            d.fx = event.x;
-            d.fy = event.y;
+        function dragged(event) {
+            const d = event.subject;
+            const [x, y] = view.position(event);
+            if (simulationMode === "off") {
+                d.x = x;
+                d.y = y;
+                view.draw();
+                return;
+            }
+            d.fx = x;
+            d.fy = y;
         }
 
-        function dragended(event, d) {
+        function dragended(event) {
+            if (simulationMode === "off") return;
+            const d = event.subject;
             if (!event.active) simulation.alphaTarget(0);
             d.fx = null;
             d.fy = null;
         }
 
-        container.appendChild(svg.node());
+        const drag = d3.drag()
+            .on("start", dragstarted)
+            .on("drag", dragged)
+            .on("end", dragended);
+
+        // SVG: one element per node, link and label; simplest, but slow past a few thousand elements
+        function createSvgView() {
+            const svg = d3.create("svg")
+                .attr("width", width)
+                .attr("height", height)
+                .attr("style", `border: 1px solid ${borderColor}; background: ${bgColor};`);
+
+            // Add arrow marker definition for directed graphs
+            if (directed) {
+                svg.append("defs").append("marker")
+                    .attr("id", "arrowhead")
+                    .attr("viewBox", "0 -5 10 10")
+                    .attr("refX", 20)
+                    .attr("refY", 0)
+                    .attr("markerWidth", 6)
+                    .attr("markerHeight", 6)
+                    .attr("orient", "auto")
+                    .append("path")
+                    .attr("d", "M0,-5L10,0L0,5")
+                    .attr("fill", "#999");
+            }
+
+            const root = svg.append("g");
+            const linkGroup = root.append("g");
+            const nodeGroup = root.append("g");
+            const labelGroup = root.append("g");
+            let link, node, label;
+
+            // (Re)bind elements to the links and nodes arrays, which change when a cluster expands
+            function join() {
+                link = linkGroup
+                    .selectAll("line")
+                    .data(links)
+                    .join(enter => enter.append("line")
+                        .attr("stroke", "#999")
+                        .attr("stroke-opacity", 0.6)
+                        .attr("stroke-width", 2)
+                        .attr("marker-end", directed ? "url(#arrowhead)" : null)
+                        .call(line => line.append("title"))  // Hover tooltip for edges
+                        .on("mouseenter", function (event, d) {
+                            fetchLinkAttributes(d, () => d3.select(this).select("title").text(linkTitle(d)));
+                        }));
+                link.select("title").text(linkTitle);
+
+                node = nodeGroup
+                    .selectAll("circle")
+                    .data(nodes)
+                    .join(enter => enter.append("circle")
+                        .attr("fill", nodeColor)
+                        .attr("stroke", "#fff")
+                        .attr("stroke-width", 2)
+                        .call(drag)
+                        .call(circle => circle.append("title"))
+                        .on("click", (event, d) => expandCluster(d)))
+                    .attr("r", radius)
+                    .style("cursor", d => d.cluster ? "pointer" : null);
+                node.select("title").text(nodeTitle);
+
+                label = labelGroup
+                    .selectAll("text")
+                    .data(nodes)
+                    .join(enter => enter.append("text")
+                        .attr("font-size", 10)
+                        .attr("fill", textColor)
+                        .attr("dx", 12)
+                        .attr("dy", 4)
+                        .attr("visibility", showLabels ? "visible" : "hidden"))
+                    .text(d => d.name);
+            }
+            join();
+
+            return {
+                element: svg.node(),
+                update: join,
+                draw() {
+                    link
+                        .attr("x1", d => d.source.x)
+                        .attr("y1", d => d.source.y)
+                        .attr("x2", d => d.target.x)
+                        .attr("y2", d => d.target.y);
+
+                    node
+                        .attr("cx", d => d.x)
+                        .attr("cy", d => d.y);
+
+                    label
+                        .attr("x", d => d.x)
+                        .attr("y", d => d.y);
+                },
+                resize(w, h, transform) {
+                    svg.attr("width", w).attr("height", h);
+                    const { k, x, y } = transform || {};
+                    root.attr("transform", transform ? `translate(${x},${y}) scale(${k})` : null);
+                },
+                position: event => [event.x, event.y],  // Already in root's coordinates
+            };
+        }
+
+        // Canvas/WebGL: the whole graph is drawn in one pass per frame; a quadtree over node
+        // positions, rebuilt lazily after they change, finds the node under the pointer
+        const MAX_CANVAS_LABELS = 2000;  // Text is the slowest thing to draw; skip it beyond this
+
+        // Arrowhead triangle matching the SVG marker: tip 12px before the target's center
+        function arrowPoints(l, out, i) {
+            const dx = l.target.x - l.source.x, dy = l.target.y - l.source.y;
+            const len = Math.hypot(dx, dy) || 1;
+            const ux = dx / len, uy = dy / len;
+            const tipX = l.target.x - ux * 12, tipY = l.target.y - uy * 12;
+            const baseX = tipX - ux * 12, baseY = tipY - uy * 12;
+            out[i] = tipX; out[i + 1] = tipY;
+            out[i + 2] = baseX - uy * 6; out[i + 3] = baseY + ux * 6;
+            out[i + 4] = baseX + uy * 6; out[i + 5] = baseY - ux * 6;
+        }
+
+        function createCanvasView(useWebgl) {
+            const dpr = window.devicePixelRatio || 1;
+            const wrapper = document.createElement("div");
+            wrapper.style.cssText = `position: relative; border: 1px solid ${borderColor}; background: ${bgColor};`;
+            const canvas = document.createElement("canvas");
+            canvas.style.display = "block";
+            wrapper.appendChild(canvas);
+
+            let gl = null;
+            if (useWebgl) {
+                gl = createGlDrawer(canvas);
+                if (!gl) console.warn("NetworkGraph: WebGL unavailable, falling back to canvas");
+            }
+            // Labels (and everything, without WebGL) go on a 2D canvas
+            let labelCanvas = canvas;
+            if (gl) {
+                labelCanvas = document.createElement("canvas");
+                labelCanvas.style.cssText = "position: absolute; top: 0; left: 0; pointer-events: none;";
+                wrapper.appendChild(labelCanvas);
+            }
+            const ctx = labelCanvas.getContext("2d");
+
+            const tooltip = document.createElement("div");
+            tooltip.style.cssText = `
+                position: absolute; display: none; pointer-events: none; white-space: pre;
+                padding: 2px 6px; font: 12px sans-serif; border-radius: 3px;
+                background: ${bgColor}; color: ${textColor}; border: 1px solid ${borderColor};
+            `;
+            wrapper.appendChild(tooltip);
+
+            let t = { k: 1, x: 0, y: 0 };
+            let tree = null;
+            let frame = null;
+            let maxRadius = d3.max(nodes, radius) || nodeSize;
+            let arrows = directed ? new Float32Array(links.length * 6) : null;
+
+            function draw2d() {
+                ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+                ctx.clearRect(0, 0, width, height);
+                ctx.setTransform(dpr * t.k, 0, 0, dpr * t.k, dpr * t.x, dpr * t.y);
+                if (!gl) {
+                    ctx.beginPath();
+                    for (const l of links) {
+                        ctx.moveTo(l.source.x, l.source.y);
+                        ctx.lineTo(l.target.x, l.target.y);
+                    }
+                    ctx.globalAlpha = 0.6;
+                    ctx.strokeStyle = "#999";
+                    ctx.lineWidth = 2;
+                    ctx.stroke();
+                    ctx.globalAlpha = 1;
+                    if (directed) {
+                        ctx.beginPath();
+                        for (let i = 0; i < links.length; i++) {
+                            arrowPoints(links[i], arrows, i * 6);
+                            ctx.moveTo(arrows[i * 6], arrows[i * 6 + 1]);
+                            ctx.lineTo(arrows[i * 6 + 2], arrows[i * 6 + 3]);
+                            ctx.lineTo(arrows[i * 6 + 4], arrows[i * 6 + 5]);
+                            ctx.closePath();
+                        }
+                        ctx.fillStyle = "#999";
+                        ctx.fill();
+                    }
+                    ctx.beginPath();
+                    for (const d of nodes) {
+                        const r = radius(d);
+                        ctx.moveTo(d.x + r, d.y);
+                        ctx.arc(d.x, d.y, r, 0, 2 * Math.PI);
+                    }
+                    ctx.fillStyle = nodeColor;
+                    ctx.fill();
+                    ctx.strokeStyle = "#fff";
+                    ctx.lineWidth = 2;
+                    ctx.stroke();
+                }
+                if (showLabels && nodes.length <= MAX_CANVAS_LABELS) {
+                    ctx.font = "10px sans-serif";
+                    ctx.fillStyle = textColor;
+                    for (const d of nodes) ctx.fillText(d.name, d.x + 12, d.y + 4);
+                }
+            }
+
+            function drawFrame() {
+                frame = null;
+                if (gl) gl.draw(t, dpr, arrows);
+                draw2d();
+            }
+
+            function toGraph([px, py]) {
+                return [(px - t.x) / t.k, (py - t.y) / t.k];
+            }
+
+            function findNode(px, py) {
+                const [x, y] = toGraph([px, py]);
+                tree = tree || d3.quadtree(nodes, d => d.x, d => d.y);
+                const d = tree.find(x, y, maxRadius + 2);
+                return d && Math.hypot(d.x - x, d.y - y) <= radius(d) + 2 ? d : undefined;
+            }
+
+            function findLink(px, py) {
+                const [x, y] = toGraph([px, py]);
+                const tolerance = 3 / t.k;
+                for (const l of links) {
+                    const ax = l.source.x, ay = l.source.y;
+                    const dx = l.target.x - ax, dy = l.target.y - ay;
+                    const len2 = dx * dx + dy * dy || 1;
+                    const s = Math.max(0, Math.min(1, ((x - ax) * dx + (y - ay) * dy) / len2));
+                    if (Math.hypot(ax + s * dx - x, ay + s * dy - y) <= tolerance) return l;
+                }
+                return undefined;
+            }
+
+            let hoverEvent = null;
+            let shownLink;
+            function hover() {
+                const [px, py] = d3.pointer(hoverEvent, canvas);
+                hoverEvent = null;
+                const d = findNode(px, py);
+                const l = d ? undefined : findLink(px, py);
+                canvas.style.cursor = d ? (d.cluster ? "pointer" : "grab") : "default";
+                if (!d && !l) {
+                    shownLink = undefined;
+                    tooltip.style.display = "none";
+                    return;
+                }
+                tooltip.textContent = d ? nodeTitle(d) : linkTitle(l);
+                shownLink = l;
+                if (l) fetchLinkAttributes(l, () => {
+                    if (shownLink === l) tooltip.textContent = linkTitle(l);
+                });
+                tooltip.style.left = `${px + 12}px`;
+                tooltip.style.top = `${py + 12}px`;
+                tooltip.style.display = "block";
+            }
+            canvas.addEventListener("pointermove", event => {
+                if (hoverEvent === null) requestAnimationFrame(hover);  // At most one hit test per frame
+                hoverEvent = event;
+            });
+            canvas.addEventListener("pointerleave", () => {
+                tooltip.style.display = "none";
+            });
+            canvas.addEventListener("click", event => expandCluster(findNode(...d3.pointer(event, canvas))));
+
+            d3.select(canvas).call(drag
+                .container(canvas)
+                .subject(event => findNode(event.x, event.y))
+                .on("start.tooltip", () => { tooltip.style.display = "none"; }));
+
+            const view = {
+                element: wrapper,
+                draw() {
+                    tree = null;  // Positions changed
+                    if (frame === null) frame = requestAnimationFrame(drawFrame);
+                },
+                update() {
+                    maxRadius = d3.max(nodes, radius) || nodeSize;
+                    if (directed) arrows = new Float32Array(links.length * 6);
+                    if (gl) gl.update();
+                    view.draw();
+                },
+                resize(w, h, transform) {
+                    for (const c of new Set([canvas, labelCanvas])) {
+                        c.width = Math.round(w * dpr);
+                        c.height = Math.round(h * dpr);
+                        c.style.width = `${w}px`;
+                        c.style.height = `${h}px`;
+                    }
+                    t = transform || { k: 1, x: 0, y: 0 };
+                    view.draw();
+                },
+                position: event => toGraph(d3.pointer(event, canvas)),
+            };
+            view.resize(width, height, null);
+            return view;
+        }
+
+        // Links as GL_LINES, arrowheads as triangles, nodes as round points with a white rim
+        function createGlDrawer(canvas) {
+            const gl = canvas.getContext("webgl", { antialias: true });
+            if (!gl) return null;
+
+            function program(vertexSource, fragmentSource) {
+                const prog = gl.createProgram();
+                for (const [type, source] of [[gl.VERTEX_SHADER, vertexSource], [gl.FRAGMENT_SHADER, fragmentSource]]) {
+                    const shader = gl.createShader(type);
+                    gl.shaderSource(shader, source);
+                    gl.compileShader(shader);
+                    gl.attachShader(prog, shader);
+                }
+                gl.linkProgram(prog);
+                const get = name => gl.getUniformLocation(prog, name);
+                return {
+                    prog,
+                    pos: gl.getAttribLocation(prog, "a_pos"),
+                    radius: gl.getAttribLocation(prog, "a_radius"),
+                    scale: get("u_scale"), offset: get("u_offset"), color: get("u_color"), pixel: get("u_pixel"),
+                };
+            }
+
+            const transformGlsl = `
+                attribute vec2 a_pos;
+                uniform vec2 u_scale;
+                uniform vec2 u_offset;
+            `;
+            const lines = program(
+                transformGlsl + "void main() { gl_Position = vec4(a_pos * u_scale + u_offset, 0.0, 1.0); }",
+                "precision mediump float; uniform vec4 u_color; void main() { gl_FragColor = u_color; }",
+            );
+            const points = program(
+                transformGlsl + `
+                attribute float a_radius;
+                uniform float u_pixel;
+                varying float v_radius;
+                void main() {
+                    gl_Position = vec4(a_pos * u_scale + u_offset, 0.0, 1.0);
+                    gl_PointSize = (a_radius + 1.0) * 2.0 * u_pixel;
+                    v_radius = a_radius;
+                }`,
+                `precision mediump float;
+                uniform vec4 u_color;
+                varying float v_radius;
+                void main() {
+                    float d = length(gl_PointCoord * 2.0 - 1.0) * (v_radius + 1.0);
+                    if (d > v_radius + 1.0) discard;
+                    gl_FragColor = d > v_radius - 1.0 ? vec4(1.0) : u_color;
+                }`,
+            );
+
+            const c = d3.rgb(nodeColor);
+            const fill = [c.r / 255, c.g / 255, c.b / 255, 1];
+            let linkPos, nodePos;
+            const posBuffer = gl.createBuffer();
+            const radiusBuffer = gl.createBuffer();
+
+            // Size the vertex arrays and upload radii for the current nodes and links
+            function update() {
+                linkPos = new Float32Array(links.length * 4);
+                nodePos = new Float32Array(nodes.length * 2);
+                gl.bindBuffer(gl.ARRAY_BUFFER, radiusBuffer);
+                gl.bufferData(gl.ARRAY_BUFFER, Float32Array.from(nodes, radius), gl.STATIC_DRAW);
+            }
+            update();
+            gl.enable(gl.BLEND);
+            gl.blendFunc(gl.SRC_ALPHA, gl.ONE_MINUS_SRC_ALPHA);
+
+            function use(p, t, color) {
+                gl.useProgram(p.prog);
+                gl.uniform2f(p.scale, 2 * t.k / width, -2 * t.k / height);
+                gl.uniform2f(p.offset, 2 * t.x / width - 1, 1 - 2 * t.y / height);
+                gl.uniform4fv(p.color, color);
+            }
+
+            function drawArray(p, data, mode, count) {
+                gl.bindBuffer(gl.ARRAY_BUFFER, posBuffer);
+                gl.bufferData(gl.ARRAY_BUFFER, data, gl.DYNAMIC_DRAW);
+                gl.enableVertexAttribArray(p.pos);
+                gl.vertexAttribPointer(p.pos, 2, gl.FLOAT, false, 0, 0);
+                gl.drawArrays(mode, 0, count);
+            }
+
+            return {
+                update,
+                draw(t, dpr, arrows) {
+                    gl.viewport(0, 0, canvas.width, canvas.height);
+                    gl.clearColor(0, 0, 0, 0);
+                    gl.clear(gl.COLOR_BUFFER_BIT);
+
+                    links.forEach((l, i) => {
+                        linkPos[i * 4] = l.source.x;
+                        linkPos[i * 4 + 1] = l.source.y;
+                        linkPos[i * 4 + 2] = l.target.x;
+                        linkPos[i * 4 + 3] = l.target.y;
+                    });
+                    use(lines, t, [0.6, 0.6, 0.6, 0.6]);
+                    gl.lineWidth(Math.min(2 * dpr, gl.getParameter(gl.ALIASED_LINE_WIDTH_RANGE)[1]));
+                    drawArray(lines, linkPos, gl.LINES, links.length * 2);
+                    if (arrows) {
+                        links.forEach((l, i) => arrowPoints(l, arrows, i * 6));
+                        use(lines, t, [0.6, 0.6, 0.6, 1]);
+                        drawArray(lines, arrows, gl.TRIANGLES, links.length * 3);
+                    }
+
+                    nodes.forEach((d, i) => {
+                        nodePos[i * 2] = d.x;
+                        nodePos[i * 2 + 1] = d.y;
+                    });
+                    use(points, t, fill);
+                    gl.uniform1f(points.pixel, dpr * t.k);
+                    gl.bindBuffer(gl.ARRAY_BUFFER, radiusBuffer);
+                    gl.enableVertexAttribArray(points.radius);
+                    gl.vertexAttribPointer(points.radius, 1, gl.FLOAT, false, 0, 0);
+                    drawArray(points, nodePos, gl.POINTS, nodes.length);
+                    gl.disableVertexAttribArray(points.radius);
+                },
+            };
+        }
+
+        const view = renderer === "svg" ? createSvgView() : createCanvasView(renderer === "webgl");
+
+        simulation.on("tick", view.draw);
+        if (simulationMode === "off") view.draw();  // Draw the precomputed positions once
+
+        container.appendChild(view.element);
         container.appendChild(fsBtn);
         el.appendChild(container);
+        // lod=True: have the kernel bring nodes/links up to date if clusters were expanded since
+        model.send({ type: "ready" });
+
+        return () => {
+            simulation.stop();
+            model.off("msg:custom", onMessage);
+            model.off("change:lod_version", reloadGraph);
+        };
     }
 
     export default { render }
     """
+    )
 
 
 def create_graph_d3(
-    nx_graph,
+    nx_graph: Union[Any, pd.DataFrame],
     width: int = 800,
     height: int = 600,
     layout: LayoutType = "force",
@@ -279,12 +912,23 @@ def create_graph_d3(
     node_size: int = 8,
     size_by_degree: bool = False,
     d3_version: str = DEFAULT_D3_VERSION,
+    positions: Union[None, Literal["auto"], PositionsType] = None,
+    simulation: Optional[SimulationMode] = None,
+    renderer: RendererType = "svg",
+    transport: GraphTransportType = "json",
+    link_attributes: Optional[Sequence[str]] = None,
+    source: str = "source",
+    target: str = "target",
+    weight: str = "weight",
+    lod: bool = False,
+    lod_max_nodes: int = 500,
 ) -> NetworkGraph:
     """
-    Create a D3 force-directed graph widget from a NetworkX graph.
+    Create a D3 force-directed graph widget from a NetworkX graph or an edge list.
 
     Args:
-        nx_graph: NetworkX graph object
+        nx_graph: NetworkX graph object, or a DataFrame with one row per edge (no networkx
+            graph is built; nodes are the values of the source and target columns)
         width: Canvas width in pixels
         height: Canvas height in pixels
         layout: Layout algorithm - "force" (default), "radial", "hierarchical", or "clustered"
@@ -301,31 +945,85 @@ def create_graph_d3(
         size_by_degree: Scale node size by degree (node_size + degree * 2). Default False.
         d3_version: D3.js version to load from CDN (default: "latest").
                    Examples: "latest", "7", "7.8.5"
+        positions: Node positions computed in the kernel instead of by the browser simulation
+            - "auto": compute_layout for the chosen layout (NumPy; seconds for 20k+ nodes)
+            - {node: (x, y)}: e.g. from a networkx layout function, scaled to the canvas;
+              must cover every node
+        simulation: "full", "warm" or "off" (default: "off" with positions, else "full")
+            - full: Run the d3 force simulation (from the given positions, if any)
+            - warm: Briefly settle the given positions with the simulation
+            - off: Draw the given positions as-is; fullscreen scales the drawing
+        renderer: "svg" (default), "canvas" or "webgl"
+            - svg: One element per node, link and label; fine up to a few thousand elements
+            - canvas: Draws the graph on a 2D canvas, with quadtree hit-testing for hover and drag;
+              labels are skipped above 2000 nodes
+            - webgl: Like canvas, with links and nodes drawn by the GPU (falls back to canvas)
+        transport: How nodes and links are sent to the browser (default: "json")
+            - json: Lists of dicts, with every edge attribute
+            - binary: Node ids as a string table and links as Int32 source/target indices plus
+              Float32 weights, sent as binary buffers; other edge attributes are fetched from
+              the kernel when a link's tooltip is shown
+        link_attributes: Edge attributes shown in link tooltips (default: all)
+        source: Edge list column with the source node of each edge (default: "source")
+        target: Edge list column with the target node of each edge (default: "target")
+        weight: Edge attribute (graph) or column (edge list) with numeric weights, if present
+        lod: Level of detail: show communities (found in the kernel) as supernodes sized by
+            member count, and expand a cluster into its sub-clusters or nodes when clicked.
+            Links carry the number of edges they aggregate instead of edge attributes; only
+            the 8 heaviest links of each cluster are drawn (ClusterView.max_cluster_links).
+        lod_max_nodes: Clusters shown initially with lod=True (at most; default 500)
 
     Returns:
         NetworkGraph widget
     """
-    nodes = [
-        {
-            "id": str(node),
-            "name": str(node),
-            "degree": nx_graph.degree(node),
-        }
-        for node in nx_graph.nodes()
-    ]
+    if renderer not in ("svg", "canvas", "webgl"):
+        raise ValueError(f"Unknown renderer '{renderer}', expected 'svg', 'canvas' or 'webgl'")
+    if transport not in ("json", "binary"):
+        raise ValueError(f"Unknown transport '{transport}', expected 'json' or 'binary'")
+    if simulation is None:
+        simulation = "full" if positions is None else "off"
+    if simulation not in ("full", "warm", "off"):
+        raise ValueError(f"Unknown simulation '{simulation}', expected 'full', 'warm' or 'off'")
+    if simulation != "full" and positions is None:
+        raise ValueError(f"simulation='{simulation}' requires positions")
+    if isinstance(positions, str) and positions != "auto":
+        raise ValueError(f"Unknown positions '{positions}', expected 'auto' or a mapping")
+    if lod and transport == "binary":
+        raise ValueError("lod=True sends clusters as nodes/links lists; use transport='json'")
 
-    links = [
-        {
-            "source": str(u),
-            "target": str(v),
-            **{k: val for k, val in data.items()},
-        }
-        for u, v, data in nx_graph.edges(data=True)
-    ]
+    arrays = graph_arrays(nx_graph, source, target, weight, with_weights=transport == "binary")
+    xy = None
+    if isinstance(positions, str) and not lod:
+        xy = layout_positions(len(arrays.nodes), arrays.sources, arrays.targets, layout, width, height)
+    elif positions is not None and not isinstance(positions, str):
+        fitted = fit_positions(positions, width, height)
+        missing = [node for node in arrays.nodes if node not in fitted]
+        if missing:
+            listed = ", ".join(map(repr, missing[:5])) + (", ..." if len(missing) > 5 else "")
+            raise ValueError(f"positions has no entry for {len(missing)} node(s): {listed}")
+        xy = np.array([fitted[node] for node in arrays.nodes], dtype=float).reshape(-1, 2)
 
-    return NetworkGraph(
-        nodes=nodes,
-        links=links,
+    view = None
+    if lod:
+        view = ClusterView(arrays, lod_max_nodes, directed, xy)
+        graph_data = {"nodes": view.nodes(), "links": view.links()}
+        if positions == "auto":
+            # Lay out the clusters shown, not the whole graph; expanded members start around their cluster
+            nodes = graph_data["nodes"]
+            index = {node["id"]: i for i, node in enumerate(nodes)}
+            src = np.array([index[link["source"]] for link in graph_data["links"]], dtype=np.intp)
+            dst = np.array([index[link["target"]] for link in graph_data["links"]], dtype=np.intp)
+            shown_xy = layout_positions(len(nodes), src, dst, layout, width, height).tolist()
+            for node, (x, y) in zip(nodes, shown_xy, strict=True):
+                node["x"], node["y"] = x, y
+    elif transport == "binary":
+        graph_data = _binary_graph(arrays, xy)
+    else:
+        graph_data = _json_graph(arrays, xy, link_attributes)
+
+    widget = NetworkGraph(
+        **graph_data,
+        transport=transport,
         width=width,
         height=height,
         layout=layout,
@@ -337,4 +1035,209 @@ def create_graph_d3(
         node_size=node_size,
         size_by_degree=size_by_degree,
         d3_version=d3_version,
+        simulation=simulation,
+        renderer=renderer,
     )
+    widget._link_data = arrays.link_data if transport == "binary" else None
+    widget._link_attributes = list(link_attributes) if link_attributes is not None else None
+    widget._lod = view
+    if view is not None:
+        widget._lod_positions = {node["id"]: (node["x"], node["y"]) for node in graph_data["nodes"] if "x" in node}
+    return widget
+
+
+@dataclass
+class GraphArrays:
+    """A graph as integer-indexed arrays: node i is nodes[i], link j joins sources[j] and targets[j]."""
+
+    nodes: List[Any]  # Node keys, as in the graph or edge list
+    names: List[str]  # str(node), sent as ids and labels
+    degrees: np.ndarray
+    sources: np.ndarray
+    targets: np.ndarray
+    weights: Optional[np.ndarray]  # NaN where a link has no weight; None if none have one
+    link_data: Sequence[Mapping[str, Any]]  # Edge attributes by link index, read on demand
+
+
+class _LazyEdgeData(Sequence):
+    """Edge attribute dicts of a networkx graph, listed on first access."""
+
+    def __init__(self, nx_graph):
+        self._graph = nx_graph
+        self._data: Optional[List[Mapping[str, Any]]] = None
+
+    def _list(self) -> List[Mapping[str, Any]]:
+        if self._data is None:
+            self._data = [data for _, _, data in self._graph.edges(data=True)]
+        return self._data
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+    def __getitem__(self, i):
+        return self._list()[i]
+
+    def __iter__(self):
+        return iter(self._list())
+
+
+class _FrameRows(Sequence):
+    """Rows of an edge list DataFrame as attribute dicts, without the source/target columns."""
+
+    def __init__(self, df: pd.DataFrame, exclude: Sequence[str]):
+        self._df = df
+        self._columns = [column for column in df.columns if column not in exclude]
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __getitem__(self, i):
+        return {str(column): self._df[column].array[i] for column in self._columns}  # Per column: keeps dtypes
+
+
+def graph_arrays(
+    graph: Union[Any, pd.DataFrame],
+    source: str = "source",
+    target: str = "target",
+    weight: str = "weight",
+    with_weights: bool = True,
+) -> GraphArrays:
+    """
+    Convert a networkx graph or an edge list DataFrame to GraphArrays in bulk.
+
+    Degrees are counted from the edge arrays with np.bincount rather than queried per node,
+    and an edge list is indexed with pd.factorize without building a networkx graph.
+    with_weights=False skips reading weights from a networkx graph's edge data.
+    """
+    if isinstance(graph, pd.DataFrame):
+        return _frame_arrays(graph, source, target, weight)
+    nodes = list(graph.nodes())
+    sources, targets, weights = _adjacency_arrays(graph, nodes, weight, with_weights)
+    return GraphArrays(
+        nodes=nodes,
+        names=[str(node) for node in nodes],
+        degrees=_degrees(len(nodes), sources, targets),
+        sources=sources,
+        targets=targets,
+        weights=weights,
+        link_data=_LazyEdgeData(graph),
+    )
+
+
+def _adjacency_arrays(
+    graph, nodes: List[Any], weight: str, with_weights: bool
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Edge arrays in graph.edges() order, read from the adjacency dicts in bulk.
+
+    Neighbor keys are collected with C-level iteration and resolved to indices by one
+    pd.Index.get_indexer call; undirected edges, listed from both ends, are dropped
+    before any edge data is read.
+    """
+    multi = graph.is_multigraph()
+    adjacency = [nbrs for _, nbrs in graph.adjacency()]
+    lengths = np.fromiter(map(len, adjacency), dtype=np.intp, count=len(adjacency))
+    neighbors = np.fromiter(chain.from_iterable(adjacency), dtype=object, count=int(lengths.sum()))
+    sources = np.repeat(np.arange(len(nodes), dtype=np.intp), lengths)
+    # As an Index, numeric keys are inferred to a numeric dtype and matched without Python hashing
+    targets = pd.Index(nodes, tupleize_cols=False).get_indexer(pd.Index(neighbors, tupleize_cols=False))
+    targets = targets.astype(np.intp, copy=False)
+    # graph.edges() yields an undirected edge from whichever end comes first
+    keep = None if graph.is_directed() else sources <= targets
+    if keep is not None:
+        sources, targets = sources[keep], targets[keep]
+
+    def edge_values():  # Edge data dicts ({key: data} for multigraphs) of the kept neighbors
+        values = chain.from_iterable(map(dict.values, adjacency))
+        return compress(values, keep.tolist()) if keep is not None else values
+
+    if multi:
+        multiplicity = np.fromiter(map(len, edge_values()), dtype=np.intp, count=len(sources))
+        sources, targets = np.repeat(sources, multiplicity), np.repeat(targets, multiplicity)
+    if not with_weights:
+        return sources, targets, None
+    data = chain.from_iterable(map(dict.values, edge_values())) if multi else edge_values()
+    values = np.fromiter(map(methodcaller("get", weight, np.nan), data), dtype=object, count=len(sources))
+    try:
+        weights = values.astype(float)
+    except (TypeError, ValueError):
+        return sources, targets, None  # Non-numeric weights: served with the other attributes
+    return sources, targets, weights if not np.isnan(weights).all() else None
+
+
+def _frame_arrays(df: pd.DataFrame, source: str, target: str, weight: str) -> GraphArrays:
+    for column in (source, target):
+        if column not in df.columns:
+            raise ValueError(f"Edge list has no '{column}' column")
+    m = len(df)
+    codes, uniques = pd.factorize(pd.concat([df[source], df[target]], ignore_index=True))
+    if (codes < 0).any():
+        raise ValueError(f"Edge list has missing values in '{source}' or '{target}'")
+    codes = codes.astype(np.intp, copy=False)
+    sources, targets = codes[:m], codes[m:]
+    weights = None
+    if weight in df.columns and weight not in (source, target):
+        try:
+            weights = df[weight].to_numpy(dtype=float, na_value=np.nan)
+        except (TypeError, ValueError):
+            pass
+    nodes = uniques.tolist()
+    return GraphArrays(
+        nodes=nodes,
+        names=uniques.astype(str).tolist(),
+        degrees=_degrees(len(nodes), sources, targets),
+        sources=sources,
+        targets=targets,
+        weights=weights,
+        link_data=_FrameRows(df, (source, target)),
+    )
+
+
+def _degrees(n: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Degree as networkx counts it: in + out, self loops twice."""
+    return np.bincount(sources, minlength=n) + np.bincount(targets, minlength=n)
+
+
+def _json_graph(arrays: GraphArrays, xy: Optional[np.ndarray], link_attributes: Optional[Sequence[str]]):
+    """nodes/links trait values: one dict per node and per link."""
+    names = arrays.names
+    nodes = [
+        {"id": name, "name": name, "degree": degree}
+        for name, degree in zip(names, arrays.degrees.tolist(), strict=True)
+    ]
+    if xy is not None:
+        for entry, (x, y) in zip(nodes, xy.tolist(), strict=True):
+            entry["x"], entry["y"] = x, y
+
+    link_data: Sequence[Mapping[str, Any]] = arrays.link_data
+    if isinstance(link_data, _FrameRows):
+        columns = link_data._columns
+        if link_attributes is not None:
+            columns = [column for column in columns if column in link_attributes]
+        if columns:
+            link_data = cast(List[Dict[str, Any]], link_data._df.loc[:, columns].to_dict(orient="records"))
+        else:
+            link_data = [{}] * len(link_data)
+    links = [
+        {
+            "source": names[u],
+            "target": names[v],
+            **{k: val for k, val in data.items() if link_attributes is None or k in link_attributes},
+        }
+        for u, v, data in zip(arrays.sources.tolist(), arrays.targets.tolist(), link_data, strict=True)
+    ]
+    return {"nodes": nodes, "links": links}
+
+
+def _binary_graph(arrays: GraphArrays, xy: Optional[np.ndarray]) -> Dict[str, Any]:
+    """Typed-array trait values; edge attributes stay in the kernel."""
+    if any("\0" in name for name in arrays.names):
+        raise ValueError("Node ids containing NUL characters can't be sent with transport='binary'")
+    return {
+        "node_names": "\0".join(arrays.names).encode(),
+        "node_degrees": arrays.degrees.astype("<i4").tobytes(),
+        "node_positions": xy.astype("<f4").tobytes() if xy is not None else b"",
+        "link_sources": arrays.sources.astype("<i4").tobytes(),
+        "link_targets": arrays.targets.astype("<i4").tobytes(),
+        "link_weights": arrays.weights.astype("<f4").tobytes() if arrays.weights is not None else b"",
+    }
@@ -3,15 +3,16 @@
 import logging
 from typing import List
 
-import anywidget
 import traitlets
 
+from .assets import ASSET_LOADER_JS, AssetWidget
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_D3_VERSION = "latest"
 
 
-class D3Tree(anywidget.AnyWidget):
+class D3Tree(AssetWidget):
     """D3 collapsible tree widget with file browser style."""
 
     tree_data = traitlets.Dict({}).tag(sync=True)
@@ -20,9 +21,11 @@ class D3Tree(anywidget.AnyWidget):
     delimiter = traitlets.Unicode("/").tag(sync=True)
     d3_version = traitlets.Unicode(DEFAULT_D3_VERSION).tag(sync=True)
 
-    _esm = r"""
+    _esm = (
+        ASSET_LOADER_JS
+        + r"""
     async function render({ model, el }) {
-        const d3 = await import(`https://cdn.jsdelivr.net/npm/d3@${model.get("d3_version") || "latest"}/+esm`);
+        const d3 = await loadAsset(model, "d3", `https://cdn.jsdelivr.net/npm/d3@${model.get("d3_version") || "latest"}/+esm`);
         const data = model.get("tree_data"), delim = model.get("delimiter"), h = model.get("height");
         if (!data?.name) { el.innerHTML = "<div style='padding:20px'>No tree data</div>"; return; }
 
@@ -82,6 +85,7 @@ class D3Tree(anywidget.AnyWidget):
     }
     export default { render }
     """
+    )
 
     def value(self) -> List[str]:
         """Return list of selected paths."""
@@ -5,7 +5,8 @@ from .display import VuetifyDisplayWidget
 from .expansion import VuetifyExpansionWidget
 from .form import VuetifyFormWidget
 from .layout import VuetifyLayoutWidget
-from .output import VuetifyOutputWidget
+from .output import OutputHandler, VuetifyOutputWidget
+from .runtime import VUETIFY_RUNTIME_JS, VuetifyRuntime, VuetifyWidget
 from .tabs import VuetifyTabsWidget
 
 __all__ = [
@@ -15,7 +16,10 @@ __all__ = [
     "VUETIFY3_CSS",
     "MDI_CSS",
     "VUETIFY_LOADER_JS",
+    "VUETIFY_RUNTIME_JS",
     # Widgets
+    "VuetifyRuntime",
+    "VuetifyWidget",
     "VuetifyFormWidget",
     "VuetifyButtonWidget",
     "VuetifyDisplayWidget",
@@ -24,4 +28,6 @@ __all__ = [
     "VuetifyTabsWidget",
     "VuetifyExpansionWidget",
     "ThemeDebugWidget",
+    # Logging
+    "OutputHandler",
 ]
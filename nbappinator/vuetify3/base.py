@@ -1,3 +1,5 @@
+from ..assets import ASSET_LOADER_JS
+
 # CDN URLs - all from jsdelivr with @latest
 # Using jsdelivr's ESM support (+esm suffix)
 # See: https://www.jsdelivr.com/esm
@@ -8,6 +10,8 @@ MDI_CSS = "https://cdn.jsdelivr.net/npm/@mdi/font@latest/css/materialdesignicons
 
 # Shared JavaScript for loading Vue 3 + Vuetify 3
 VUETIFY_LOADER_JS = f"""
+{ASSET_LOADER_JS}
+
 // Global cache to prevent duplicate loading
 const VUETIFY_CACHE = window.__VUETIFY3_CACHE__ = window.__VUETIFY3_CACHE__ || {{
     vue: null,
@@ -15,6 +19,7 @@ const VUETIFY_CACHE = window.__VUETIFY3_CACHE__ = window.__VUETIFY3_CACHE__ || {
     cssLoaded: false,
     importMapAdded: false,
     loading: null,
+    host: null,
 }};
 
 // Load CSS once
@@ -49,7 +54,7 @@ function addImportMap() {{
 }}
 
 // Load Vue 3 and Vuetify 3 (cached)
-async function loadVuetify() {{
+async function loadVuetify(model) {{
     if (VUETIFY_CACHE.loading) {{
         return VUETIFY_CACHE.loading;
     }}
@@ -62,6 +67,19 @@ async function loadVuetify() {{
     }}
 
     VUETIFY_CACHE.loading = (async () => {{
+        // Bundled assets (nbappinator.assets): UMD builds, so no import map is needed
+        if (assetConfig(model).mode !== 'cdn') {{
+            loadStyle(model, 'vuetify-css', '{VUETIFY3_CSS}');
+            loadStyle(model, 'mdi-css', '{MDI_CSS}');
+            VUETIFY_CACHE.cssLoaded = true;
+            VUETIFY_CACHE.vue = await loadAsset(model, 'vue', '{VUE3_CDN}');
+            VUETIFY_CACHE.vuetify = await loadAsset(model, 'vuetify', '{VUETIFY3_CDN}');
+            return {{
+                Vue: VUETIFY_CACHE.vue,
+                Vuetify: VUETIFY_CACHE.vuetify,
+            }};
+        }}
+
         // Load CSS
         if (!VUETIFY_CACHE.cssLoaded) {{
             loadCSS('{VUETIFY3_CSS}', 'vuetify3-css');
@@ -134,6 +152,11 @@ function fixWidgetBackground(el, isDark) {{
     const bgColor = isDark ? '#1e1e1e' : '#ffffff';
     const existingStyle = document.getElementById('vuetify3-bg-fix');
 
+    // Unchanged theme: keep the stylesheet rather than forcing a page-wide style recalc
+    if (existingStyle && existingStyle.dataset.dark === String(isDark)) {{
+        return;
+    }}
+
     // Remove old style if theme changed
     if (existingStyle) {{
         existingStyle.remove();
@@ -141,6 +164,7 @@ function fixWidgetBackground(el, isDark) {{
 
     const style = document.createElement('style');
     style.id = 'vuetify3-bg-fix';
+    style.dataset.dark = String(isDark);
     style.textContent = `
         :root {{
             --nbapp-spacing-xs: 4px;
@@ -262,21 +286,10 @@ function setVuetifyTheme(vuetify, isDark) {{
     vuetify.theme.global.name = themeName;
 }}
 
-// Initialize Vuetify with proper theme detection and background fix
-// Returns {{ vuetify, isDark, mountEl }}
-function initVuetify(el) {{
-    const isDark = detectTheme(el);
-    fixWidgetBackground(el, isDark);
-
-    // Create wrapper with theme class (no background - let notebook show through)
-    const mountEl = document.createElement('div');
-    mountEl.className = isDark ? 'v-theme--dark' : 'v-theme--light';
-    applyThemeTextColor(mountEl, isDark);
-    mountEl.style.padding = '4px';
-    el.appendChild(mountEl);
-
+// Create a Vuetify instance with the nbappinator theme colors and component defaults
+function createVuetifyInstance(isDark) {{
     const {{ createVuetify }} = window.__VUETIFY3_CACHE__.vuetify;
-    const vuetify = createVuetify({{
+    return createVuetify({{
         theme: {{
             defaultTheme: isDark ? 'dark' : 'light',
             themes: {{
@@ -310,27 +323,82 @@ function initVuetify(el) {{
             VSlider: {{ density: 'compact' }},
         }},
     }});
+}}
+
+// Create the themed wrapper element a widget's Vue content is mounted into
+function createMountEl(el, isDark) {{
+    fixWidgetBackground(el, isDark);
+
+    // Create wrapper with theme class (no background - let notebook show through)
+    const mountEl = document.createElement('div');
+    mountEl.className = isDark ? 'v-theme--dark' : 'v-theme--light';
+    applyThemeTextColor(mountEl, isDark);
+    mountEl.style.padding = '4px';
+    el.appendChild(mountEl);
+    return mountEl;
+}}
 
+// Initialize a standalone Vuetify instance with proper theme detection and background fix
+// Returns {{ vuetify, isDark, mountEl }}
+function initVuetify(el) {{
+    const isDark = detectTheme(el);
+    const mountEl = createMountEl(el, isDark);
+    const vuetify = createVuetifyInstance(isDark);
     return {{ vuetify, isDark, mountEl }};
 }}
 
-// Setup theme change watcher for a Vuetify instance
-function setupThemeWatcher(vuetify, el, mountEl) {{
+// Shared runtime: one Vuetify instance and one root Vue app host every widget on the page.
+// Each widget's component is rendered into its own element through a Teleport, so adding a
+// widget costs a component mount rather than a createApp + createVuetify.
+function getVuetifyHost(el) {{
+    if (VUETIFY_CACHE.host) return VUETIFY_CACHE.host;
+    const {{ createApp, h, markRaw, shallowReactive, Teleport }} = VUETIFY_CACHE.vue;
+
+    const entries = shallowReactive(new Map());
+    const vuetify = createVuetifyInstance(detectTheme(el));
+    const root = document.createElement('div');
+    root.id = 'nbapp-vuetify-host';
+    root.style.display = 'none';
+    document.body.appendChild(root);
+
+    const app = createApp({{
+        render: () => Array.from(entries.values(), (entry) =>
+            h(Teleport, {{ to: entry.target, key: entry.id }}, [h(entry.component)])),
+    }});
+    configureApp(app);
+    app.config.errorHandler = (err) => console.error('[nbappinator] widget error:', err);
+    app.use(vuetify);
+    app.mount(root);
+
+    VUETIFY_CACHE.host = {{ app, vuetify, entries, nextId: 0, markRaw }};
+    return VUETIFY_CACHE.host;
+}}
+
+// Mount a widget's Vue component (options object) into el using the shared host
+// Returns {{ vuetify, isDark, mountEl, unmount }}
+function mountVuetify(el, component) {{
     const isDark = detectTheme(el);
-    setVuetifyTheme(vuetify, isDark);
-    if (mountEl) {{
-        mountEl.className = isDark ? 'v-theme--dark' : 'v-theme--light';
-        applyThemeTextColor(mountEl, isDark);
-    }}
+    const mountEl = createMountEl(el, isDark);
+    const host = getVuetifyHost(el);
+    const id = host.nextId++;
+    host.entries.set(id, {{ id, target: mountEl, component: host.markRaw(component) }});
+    const unmount = () => host.entries.delete(id);
+    return {{ vuetify: host.vuetify, isDark, mountEl, unmount }};
+}}
 
-    onThemeChange((newIsDark) => {{
-        setVuetifyTheme(vuetify, newIsDark);
-        fixWidgetBackground(el, newIsDark);
+// Setup theme change watcher for a Vuetify instance
+// Returns an unsubscribe function; call it when the widget is torn down
+function setupThemeWatcher(vuetify, el, mountEl) {{
+    const apply = (isDark) => {{
+        setVuetifyTheme(vuetify, isDark);
         if (mountEl) {{
-            mountEl.className = newIsDark ? 'v-theme--dark' : 'v-theme--light';
-            applyThemeTextColor(mountEl, newIsDark);
+            mountEl.className = isDark ? 'v-theme--dark' : 'v-theme--light';
+            applyThemeTextColor(mountEl, isDark);
         }}
-    }}, el);
+    }};
+    const unsubscribe = onThemeChange(apply, el);
+    apply(getThemeService().isDark);
+    return unsubscribe;
 }}
 
 // Debug theme detection - call this to see what's being detected
@@ -452,44 +520,94 @@ function detectTheme(el) {{
     return false;
 }}
 
-// Watch for theme changes
-function onThemeChange(callback, el) {{
-    let lastTheme = detectTheme(el);
+// Page-wide theme service shared by every widget (window.__NBAPP_THEME__): one poll and one
+// set of observers detect changes once and notify subscribers, instead of a timer per widget.
+// service.stats counts theme checks (each reads computed styles) and detected changes.
+function getThemeService() {{
+    if (window.__NBAPP_THEME__) return window.__NBAPP_THEME__;
+
+    const service = {{
+        subscribers: new Map(),  // callback -> widget element
+        isDark: null,
+        stats: {{ checks: 0, changes: 0 }},
+        stop: null,
+    }};
 
-    function checkTheme() {{
-        const currentTheme = detectTheme(el);
-        if (currentTheme !== lastTheme) {{
-            lastTheme = currentTheme;
-            callback(currentTheme);
+    // Detect from a rendered widget so element backgrounds are taken into account
+    function referenceEl() {{
+        for (const el of service.subscribers.values()) {{
+            if (el && el.isConnected) return el;
         }}
+        return null;
     }}
 
-    // Poll for changes (catches CSS variable changes)
-    const interval = setInterval(checkTheme, 500);
+    service.check = () => {{
+        service.stats.checks++;
+        const isDark = detectTheme(referenceEl());
+        if (isDark === service.isDark) return;
+        service.isDark = isDark;
+        service.stats.changes++;
+        fixWidgetBackground(null, isDark);
+        for (const callback of Array.from(service.subscribers.keys())) {{
+            callback(isDark);
+        }}
+    }};
 
-    // Also observe attribute changes on body/html
-    const observer = new MutationObserver(checkTheme);
-    observer.observe(document.body, {{
-        attributes: true,
-        attributeFilter: ['class', 'data-vscode-theme-kind', 'data-jp-theme-name', 'data-jp-theme-light']
-    }});
-    observer.observe(document.documentElement, {{
-        attributes: true,
-        attributeFilter: ['class', 'data-vscode-theme-kind']
-    }});
+    function start() {{
+        // Poll for changes (catches CSS variable changes), skipped while the page is hidden
+        const interval = setInterval(() => {{
+            if (!document.hidden) service.check();
+        }}, 500);
+
+        // Also observe attribute changes on body/html
+        const observer = new MutationObserver(service.check);
+        observer.observe(document.body, {{
+            attributes: true,
+            attributeFilter: ['class', 'data-vscode-theme-kind', 'data-jp-theme-name', 'data-jp-theme-light']
+        }});
+        observer.observe(document.documentElement, {{
+            attributes: true,
+            attributeFilter: ['class', 'data-vscode-theme-kind']
+        }});
+
+        // Listen for system preference changes
+        const media = window.matchMedia ? window.matchMedia('(prefers-color-scheme: dark)') : null;
+        if (media) {{
+            media.addEventListener('change', service.check);
+        }}
 
-    // Listen for system preference changes
-    if (window.matchMedia) {{
-        window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', checkTheme);
+        return () => {{
+            clearInterval(interval);
+            observer.disconnect();
+            if (media) {{
+                media.removeEventListener('change', service.check);
+            }}
+        }};
     }}
 
-    return () => {{
-        clearInterval(interval);
-        observer.disconnect();
-        if (window.matchMedia) {{
-            window.matchMedia('(prefers-color-scheme: dark)').removeEventListener('change', checkTheme);
+    service.subscribe = (callback, el) => {{
+        service.subscribers.set(callback, el);
+        if (service.isDark === null) {{
+            service.stats.checks++;
+            service.isDark = detectTheme(el);
         }}
+        if (!service.stop) service.stop = start();
+        return () => {{
+            service.subscribers.delete(callback);
+            if (service.subscribers.size === 0 && service.stop) {{
+                service.stop();
+                service.stop = null;
+            }}
+        }};
     }};
+
+    window.__NBAPP_THEME__ = service;
+    return service;
+}}
+
+// Watch for theme changes; returns an unsubscribe function
+function onThemeChange(callback, el) {{
+    return getThemeService().subscribe(callback, el);
 }}
 
 // Configure Vue app to suppress benign Vuetify warnings about hoisted vnodes
@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyButtonWidget(anywidget.AnyWidget):
+class VuetifyButtonWidget(VuetifyWidget):
     """Button with optional status text and progress indicator."""
 
     label = traitlets.Unicode("Button").tag(sync=True)
@@ -15,23 +14,24 @@ class VuetifyButtonWidget(anywidget.AnyWidget):
     status_text = traitlets.Unicode("").tag(sync=True)
     status_color = traitlets.Unicode("").tag(sync=True)  # success, error, warning, info
     clicked = traitlets.Int(0).tag(sync=True)  # Increment to detect clicks
+    interruptible = traitlets.Bool(False).tag(sync=True)  # Stay clickable while loading
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref }} = Vue;
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref }} = Vue;
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
-
-        const app = createApp({{
+        const component = {{
             setup() {{
                 const label = ref(model.get('label'));
                 const disabled = ref(model.get('disabled'));
                 const color = ref(model.get('color'));
                 const variant = ref(model.get('variant'));
                 const loading = ref(model.get('loading'));
+                const interruptible = ref(model.get('interruptible'));
                 const statusText = ref(model.get('status_text'));
                 const statusColor = ref(model.get('status_color'));
 
@@ -40,6 +40,7 @@ class VuetifyButtonWidget(anywidget.AnyWidget):
                 model.on('change:color', () => color.value = model.get('color'));
                 model.on('change:variant', () => variant.value = model.get('variant'));
                 model.on('change:loading', () => loading.value = model.get('loading'));
+                model.on('change:interruptible', () => interruptible.value = model.get('interruptible'));
                 model.on('change:status_text', () => statusText.value = model.get('status_text'));
                 model.on('change:status_color', () => statusColor.value = model.get('status_color'));
 
@@ -48,19 +49,20 @@ class VuetifyButtonWidget(anywidget.AnyWidget):
                     model.save_changes();
                 }}
 
-                return {{ label, disabled, color, variant, loading, statusText, statusColor, onClick }};
+                return {{ label, disabled, color, variant, loading, interruptible, statusText, statusColor, onClick }};
             }},
             template: `
                 <div class="d-flex align-center flex-wrap ga-3">
                     <v-btn
                         :color="color"
                         :variant="variant"
-                        :disabled="disabled || loading"
-                        :loading="loading"
+                        :disabled="disabled || (loading && !interruptible)"
+                        :loading="loading && !interruptible"
                         @click="onClick"
                     >
                         {{{{ label }}}}
                     </v-btn>
+                    <v-progress-circular v-if="loading && interruptible" indeterminate size="18" width="2" />
                     <span
                         v-if="statusText"
                         :style="{{
@@ -75,14 +77,15 @@ class VuetifyButtonWidget(anywidget.AnyWidget):
                     </span>
                 </div>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class ThemeDebugWidget(anywidget.AnyWidget):
+class ThemeDebugWidget(VuetifyWidget):
     """Comprehensive debug widget that tests ALL widget types and theme detection.
 
     This widget creates test instances of every Vuetify component type and shows:
@@ -22,10 +21,11 @@ class ThemeDebugWidget(anywidget.AnyWidget):
     debug_info = traitlets.Unicode("Loading...").tag(sync=True)
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue, Vuetify }} = await loadVuetify();
+        const {{ loadVuetify, initVuetify, setupThemeWatcher, configureApp, detectTheme }} = await loadVuetifyRuntime(model);
+        const {{ Vue, Vuetify }} = await loadVuetify(model);
         const {{ createVuetify }} = Vuetify;
         const {{ createApp, ref }} = Vue;
 
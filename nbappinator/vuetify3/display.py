@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyDisplayWidget(anywidget.AnyWidget):
+class VuetifyDisplayWidget(VuetifyWidget):
     """Display widget for static content.
 
     Types: label, pre, html, separator, image, card
@@ -18,15 +17,14 @@ class VuetifyDisplayWidget(anywidget.AnyWidget):
     height = traitlets.Unicode("auto").tag(sync=True)
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref }} = Vue;
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref }} = Vue;
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
-
-        const app = createApp({{
+        const component = {{
             setup() {{
                 const widgetType = ref(model.get('widget_type'));
                 const content = ref(model.get('content'));
@@ -63,14 +61,15 @@ class VuetifyDisplayWidget(anywidget.AnyWidget):
                     <v-card-text v-html="content" />
                 </v-card>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyExpansionWidget(anywidget.AnyWidget):
+class VuetifyExpansionWidget(VuetifyWidget):
     """Expansion panel header that controls sibling content visibility.
 
     This is a header-only widget - the actual content is controlled externally
@@ -15,15 +14,14 @@ class VuetifyExpansionWidget(anywidget.AnyWidget):
     expanded = traitlets.Bool(True).tag(sync=True)
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref, watch, computed }} = Vue;
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref, watch, computed }} = Vue;
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
-
-        const app = createApp({{
+        const component = {{
             setup() {{
                 const title = ref(model.get('title'));
                 const expanded = ref(model.get('expanded'));
@@ -70,14 +68,15 @@ class VuetifyExpansionWidget(anywidget.AnyWidget):
                     <v-icon :icon="icon" size="small" />
                 </div>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
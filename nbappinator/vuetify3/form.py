@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyFormWidget(anywidget.AnyWidget):
+class VuetifyFormWidget(VuetifyWidget):
     """Consolidated form widget supporting multiple input types.
 
     Types: select, combobox, text, textarea, checkbox, radio, slider
@@ -19,18 +18,48 @@ class VuetifyFormWidget(anywidget.AnyWidget):
     min_value = traitlets.Float(0).tag(sync=True)  # For slider
     max_value = traitlets.Float(100).tag(sync=True)  # For slider
     step = traitlets.Float(1).tag(sync=True)  # For slider
+    debounce_ms = traitlets.Int(0).tag(sync=True)  # Send value after this quiet period
+    throttle_ms = traitlets.Int(0).tag(sync=True)  # Send value at most once per period
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref, shallowRef, watch, computed, h }} = Vue;
-
-        const {{ vuetify, mountEl }} = initVuetify(el);
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref, shallowRef, watch, computed, h }} = Vue;
+
+        // Debounced/throttled value sync; the latest value wins
+        let syncTimer = null;
+        let lastSync = 0;
+        let pendingValue;
+        const flushValue = () => {{
+            clearTimeout(syncTimer);
+            syncTimer = null;
+            lastSync = Date.now();
+            model.set('value', pendingValue);
+            model.save_changes();
+        }};
+        const flushPending = () => {{ if (syncTimer) flushValue(); }};
+        const syncValue = (newVal) => {{
+            pendingValue = newVal;
+            const debounceMs = model.get('debounce_ms') || 0;
+            const throttleMs = model.get('throttle_ms') || 0;
+            if (debounceMs > 0) {{
+                clearTimeout(syncTimer);
+                syncTimer = setTimeout(flushValue, debounceMs);
+                return;
+            }}
+            const wait = lastSync + throttleMs - Date.now();
+            if (throttleMs > 0 && wait > 0) {{
+                if (!syncTimer) syncTimer = setTimeout(flushValue, wait);
+                return;
+            }}
+            flushValue();
+        }};
 
         // Create Vue app
-        const app = createApp({{
+        const component = {{
             setup() {{
                 const widgetType = ref(model.get('widget_type'));
                 const label = ref(model.get('label'));
@@ -54,10 +83,7 @@ class VuetifyFormWidget(anywidget.AnyWidget):
                 model.on('change:step', () => step.value = model.get('step'));
 
                 // Sync value from JS to Python
-                watch(value, (newVal) => {{
-                    model.set('value', newVal);
-                    model.save_changes();
-                }});
+                watch(value, syncValue);
 
                 const selectDialogOpen = ref(false);
                 const comboDialogOpen = ref(false);
@@ -90,7 +116,7 @@ class VuetifyFormWidget(anywidget.AnyWidget):
                 return {{
                     widgetType, label, items, value, disabled, multiple,
                     minValue, maxValue, step, selectDialogOpen, comboDialogOpen,
-                    filteredComboItems, handleSelectClick
+                    filteredComboItems, handleSelectClick, flushPending
                 }};
             }},
             template: `
@@ -130,6 +156,7 @@ class VuetifyFormWidget(anywidget.AnyWidget):
                         :append-inner-icon="comboDialogOpen ? 'mdi-chevron-up' : 'mdi-chevron-down'"
                         @click:append-inner="comboDialogOpen = !comboDialogOpen"
                         @focus="comboDialogOpen = true"
+                        @blur="flushPending"
                     />
                     <v-list
                         v-if="comboDialogOpen"
@@ -159,6 +186,8 @@ class VuetifyFormWidget(anywidget.AnyWidget):
                     :disabled="disabled"
                     variant="outlined"
                     density="compact"
+                    @blur="flushPending"
+                    @keydown.enter="flushPending"
                 />
                 <v-textarea
                     v-else-if="widgetType === 'textarea'"
@@ -204,14 +233,16 @@ class VuetifyFormWidget(anywidget.AnyWidget):
                     />
                 </div>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            flushPending();
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
@@ -1,10 +1,9 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyLayoutWidget(anywidget.AnyWidget):
+class VuetifyLayoutWidget(VuetifyWidget):
     """Layout container widget.
 
     Types: container, row, column
@@ -17,15 +16,14 @@ class VuetifyLayoutWidget(anywidget.AnyWidget):
     align = traitlets.Unicode("start").tag(sync=True)  # For row: start, center, end, stretch
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref }} = Vue;
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref }} = Vue;
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
-
-        const app = createApp({{
+        const component = {{
             setup() {{
                 const widgetType = ref(model.get('widget_type'));
                 const fluid = ref(model.get('fluid'));
@@ -52,14 +50,15 @@ class VuetifyLayoutWidget(anywidget.AnyWidget):
                     <slot></slot>
                 </v-col>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
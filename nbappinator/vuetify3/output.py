@@ -1,104 +1,351 @@
-import io
+import contextvars
+import logging
 import sys
+import threading
+from collections import deque
+from typing import Optional, Tuple
 
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
+# Output widgets capturing in the current context (thread or asyncio task), innermost last
+_capture_stack: contextvars.ContextVar[Tuple["VuetifyOutputWidget", ...]] = contextvars.ContextVar(
+    "nbapp_capture", default=()
+)
+_install_lock = threading.Lock()
 
-class VuetifyOutputWidget(anywidget.AnyWidget):
+
+class _RoutedStdout:
+    """sys.stdout replacement: writes go to the current context's capturing widget, if any."""
+
+    def __init__(self, target):
+        self._target = target
+
+    def write(self, text: str) -> int:
+        stack = _capture_stack.get()
+        if stack:
+            return stack[-1].write(text)
+        return self._target.write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def _install_routed_stdout() -> None:
+    """Route sys.stdout through _RoutedStdout; a pass-through when nothing is capturing."""
+    with _install_lock:
+        if not isinstance(sys.stdout, _RoutedStdout):
+            sys.stdout = _RoutedStdout(sys.stdout)
+
+
+class _LogText(traitlets.Unicode):
+    """VuetifyOutputWidget.content: reads give the current log, refreshed lazily after appends."""
+
+    def get(self, obj: "VuetifyOutputWidget", cls=None):
+        obj._sync_content()
+        return super().get(obj, cls)
+
+    def set(self, obj: "VuetifyOutputWidget", value):
+        obj._sync_content()  # So assigning compares against the current log, not stale text
+        super().set(obj, value)
+
+
+class VuetifyOutputWidget(VuetifyWidget):
     """Output widget that displays captured text (stdout/stderr style).
 
     Supports context manager protocol for capturing stdout:
         with output_widget:
             print("This will be captured")
+
+    Capture is per context: only prints from the thread or asyncio task that entered
+    the block (and tasks/threads started with a copy of its context) are captured, so
+    concurrent callbacks don't garble each other's output. Captured text, write() and
+    log records from OutputHandler are batched and flushed every flush_interval seconds.
+
+    append() sends only the new text as a message; the kernel and the browser each keep
+    the last max_lines lines. Long logs are rendered virtualized (visible lines only).
+    content always reads as the current log; assigning it replaces the log.
     """
 
-    content = traitlets.Unicode("").tag(sync=True)
+    content = _LogText("").tag(sync=True)  # The current log; appends don't resync it
     max_height = traitlets.Unicode("300px").tag(sync=True)
+    max_lines = traitlets.Int(10_000).tag(sync=True)  # Lines kept; 0 for unbounded
+    flush_interval = traitlets.Float(0.1)  # Seconds between flushes of written text
 
     def __init__(self, *args, **kwargs):
+        # Before super().__init__: observers for content/max_lines kwargs fire there
+        self._lock = threading.RLock()
+        self._lines: deque = deque(maxlen=self.max_lines or None)  # Complete lines, with "\n"
+        self._partial = ""  # Text after the last newline
+        self._content_stale = False  # content's stored value is behind the log
         super().__init__(*args, **kwargs)
-        self._stdout_trap = io.StringIO()
-        self._original_stdout = None
+        self._pending: list = []  # Written, not yet flushed
+        self._flush_timer: Optional[threading.Timer] = None
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
-    async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref, watch, nextTick }} = Vue;
+    const LINE_HEIGHT = 18;  // px, fixed so long logs can be virtualized
+    const VIRTUALIZE_LINES = 500;
+    const OVERSCAN = 20;
+
+    function countNewlines(text) {{
+        let n = 0;
+        for (let i = text.indexOf("\\n"); i !== -1; i = text.indexOf("\\n", i + 1)) n++;
+        return n;
+    }}
+
+    function lastLines(text, maxLines) {{
+        let i = text.length;
+        for (let n = 0; n <= maxLines && i > 0; n++) i = text.lastIndexOf("\\n", i - 1);
+        return i > 0 ? text.slice(i + 1) : text;
+    }}
+
+    // Once per model: apply appended text to the model's content, so views rendered later
+    // (and saved widget state) show the whole log. Trimming to max_lines is amortized.
+    function initialize({{ model }}) {{
+        let lineCount = countNewlines(model.get('content'));
+        model.on('change:content', (m, value, options) => {{
+            if (!options || options.delta === undefined) lineCount = countNewlines(value);
+        }});
+        model.on('msg:custom', (msg) => {{
+            if (!msg || msg.type !== 'append') return;
+            let content = model.get('content') + msg.text;
+            lineCount += countNewlines(msg.text);
+            const maxLines = model.get('max_lines');
+            if (maxLines > 0 && lineCount > maxLines * 1.25 + 100) {{
+                content = lastLines(content, maxLines);
+                lineCount = maxLines;
+            }}
+            model.set('content', content, {{ delta: msg.text }});
+        }});
+    }}
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
+    async function render({{ model, el }}) {{
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref, computed, nextTick }} = Vue;
 
-        const app = createApp({{
+        const component = {{
             setup() {{
-                const content = ref(model.get('content'));
+                // Non-reactive line store (the last entry is the unterminated line);
+                // version bumps at most once per frame
+                let lines = model.get('content').split('\\n');
+                const version = ref(0);
                 const maxHeight = ref(model.get('max_height'));
-                const preRef = ref(null);
-
-                model.on('change:content', () => {{
-                    content.value = model.get('content');
-                    // Auto-scroll to bottom
-                    nextTick(() => {{
-                        if (preRef.value) {{
-                            preRef.value.scrollTop = preRef.value.scrollHeight;
+                const scrollRef = ref(null);
+                const scrollTop = ref(0);
+                const viewportHeight = ref(300);
+                let frame = null;
+                let stickToBottom = true;
+
+                const visibleCount = () => {{
+                    const maxLines = model.get('max_lines');
+                    return maxLines > 0 ? Math.min(lines.length, maxLines + 1) : lines.length;
+                }};
+
+                const refresh = () => {{
+                    if (frame) return;
+                    frame = requestAnimationFrame(() => {{
+                        frame = null;
+                        const maxLines = model.get('max_lines');
+                        if (maxLines > 0 && lines.length > maxLines * 1.25 + 100) {{
+                            lines = lines.slice(lines.length - maxLines - 1);
+                        }}
+                        version.value++;
+                        if (stickToBottom) {{
+                            nextTick(() => {{
+                                if (scrollRef.value) scrollRef.value.scrollTop = scrollRef.value.scrollHeight;
+                            }});
                         }}
                     }});
+                }};
+
+                model.on('change:content', (m, value, options) => {{
+                    if (options && options.delta !== undefined) {{
+                        const parts = options.delta.split('\\n');
+                        lines[lines.length - 1] += parts[0];
+                        for (let i = 1; i < parts.length; i++) lines.push(parts[i]);
+                    }} else {{
+                        lines = value.split('\\n');
+                    }}
+                    refresh();
                 }});
+                model.on('change:max_lines', refresh);
                 model.on('change:max_height', () => maxHeight.value = model.get('max_height'));
 
-                return {{ content, maxHeight, preRef }};
+                const virtual = computed(() => {{
+                    version.value;
+                    return visibleCount() > VIRTUALIZE_LINES;
+                }});
+                const totalHeight = computed(() => {{
+                    version.value;
+                    return visibleCount() * LINE_HEIGHT;
+                }});
+                const firstLine = computed(() => Math.max(0, Math.floor(scrollTop.value / LINE_HEIGHT) - OVERSCAN));
+                const text = computed(() => {{
+                    version.value;
+                    const offset = lines.length - visibleCount();
+                    if (!virtual.value) return lines.slice(offset).join('\\n');
+                    const count = Math.ceil(viewportHeight.value / LINE_HEIGHT) + 2 * OVERSCAN;
+                    return lines.slice(offset + firstLine.value, offset + firstLine.value + count).join('\\n');
+                }});
+
+                const onScroll = () => {{
+                    const el = scrollRef.value;
+                    scrollTop.value = el.scrollTop;
+                    viewportHeight.value = el.clientHeight || viewportHeight.value;
+                    stickToBottom = el.scrollTop + el.clientHeight >= el.scrollHeight - LINE_HEIGHT;
+                }};
+
+                return {{ text, virtual, totalHeight, firstLine, maxHeight, scrollRef, onScroll, LINE_HEIGHT }};
             }},
             template: `
-                <pre
-                    ref="preRef"
+                <div
+                    ref="scrollRef"
+                    @scroll.passive="onScroll"
                     :style="{{
                         maxHeight: maxHeight,
                         overflow: 'auto',
                         padding: 'var(--nbapp-spacing-md)',
-                        margin: '0',
                         fontFamily: 'var(--nbapp-font-mono)',
                         fontSize: '13px',
-                        whiteSpace: 'pre-wrap',
-                        wordBreak: 'break-word',
                     }}"
-                >{{{{ content }}}}</pre>
+                >
+                    <pre
+                        v-if="!virtual"
+                        :style="{{ margin: '0', font: 'inherit', whiteSpace: 'pre-wrap', wordBreak: 'break-word' }}"
+                    >{{{{ text }}}}</pre>
+                    <div v-else :style="{{ height: totalHeight + 'px', position: 'relative' }}">
+                        <pre
+                            :style="{{
+                                position: 'absolute',
+                                top: firstLine * LINE_HEIGHT + 'px',
+                                margin: '0',
+                                font: 'inherit',
+                                lineHeight: LINE_HEIGHT + 'px',
+                                whiteSpace: 'pre',
+                            }}"
+                        >{{{{ text }}}}</pre>
+                    </div>
+                </div>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
-    export default {{ render }}
+    export default {{ initialize, render }}
     """
 
+    @property
+    def text(self) -> str:
+        """The current output: the last max_lines lines."""
+        return "".join(self._lines) + self._partial
+
+    def _buffer(self, text: str) -> None:
+        *complete, self._partial = (self._partial + text).split("\n")
+        self._lines.extend(line + "\n" for line in complete)
+        self._content_stale = True
+
+    def _sync_content(self) -> None:
+        """Store the current log as content's value, without notifying (the front end has it)."""
+        with self._lock:
+            if self._content_stale:
+                self._content_stale = False
+                self._trait_values["content"] = self.text
+
+    @traitlets.observe("content")
+    def _on_content(self, change):
+        with self._lock:
+            self._lines.clear()
+            self._partial = ""
+            self._buffer(change["new"])
+
+    @traitlets.observe("max_lines")
+    def _on_max_lines(self, change):
+        with self._lock:
+            self._lines = deque(self._lines, maxlen=change["new"] or None)
+            self._content_stale = True
+
     def append(self, text: str) -> None:
-        """Append text to output."""
-        self.content += text
+        """Append text to output now, sending only the new text to the front end."""
+        if not text:
+            return
+        with self._lock:
+            self._buffer(text)
+            self.send({"type": "append", "text": text})
 
     def clear(self) -> None:
-        """Clear output."""
-        self.content = ""
+        """Clear output, including text not yet flushed."""
+        with self._lock:
+            self._pending.clear()
+            self.content = ""
+
+    def write(self, text: str) -> int:
+        """Write text, file-style (print(..., file=widget)); sent with the next flush."""
+        if not text:
+            return 0
+        with self._lock:
+            self._pending.append(text)
+            if self._flush_timer is None:
+                # A timer thread, so output streams even while the kernel's main thread is busy
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return len(text)
+
+    def flush(self) -> None:
+        """Send written text now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            text = "".join(self._pending)
+            self._pending.clear()
+            self.append(text)
 
     def __enter__(self):
-        """Start capturing stdout."""
-        self._stdout_trap = io.StringIO()
-        self._original_stdout = sys.stdout
-        sys.stdout = self._stdout_trap
+        """Start capturing stdout in the current context."""
+        _install_routed_stdout()
+        _capture_stack.set((*_capture_stack.get(), self))
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Stop capturing stdout and append captured content."""
-        sys.stdout = self._original_stdout
-        captured = self._stdout_trap.getvalue()
-        if captured:
-            self.append(captured)
-        self._stdout_trap = io.StringIO()
+        """Stop capturing stdout and flush captured content."""
+        stack = _capture_stack.get()
+        if stack and stack[-1] is self:
+            _capture_stack.set(stack[:-1])
+        self.flush()
         return False  # Don't suppress exceptions
+
+
+class OutputHandler(logging.Handler):
+    """logging handler writing records to a VuetifyOutputWidget (batched, thread-safe).
+
+    Example:
+        logging.getLogger("myapp").addHandler(OutputHandler(app.messages))
+    """
+
+    def __init__(self, widget: VuetifyOutputWidget, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.widget = widget
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.widget.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.widget.flush()
@@ -0,0 +1,78 @@
+"""Shared Vuetify runtime: VUETIFY_LOADER_JS sent once per page instead of once per widget.
+
+anywidget syncs _esm per widget instance, so interpolating the loader into every widget's
+_esm ships (and compiles) the same ~25 KB for each control. Instead, a single
+VuetifyRuntime model holds the loader as an ES module, every Vuetify widget references it
+through its _runtime trait, and the browser imports it once from a blob URL cached on window.
+Being an ordinary widget model, the runtime is also part of saved widget state, so static
+HTML exports keep working.
+"""
+
+import hashlib
+import re
+from typing import Optional
+
+import anywidget
+import traitlets
+from ipywidgets import widget_serialization
+
+from ..assets import AssetWidget
+from .base import VUETIFY_LOADER_JS
+
+# The loader as an ES module exporting every top-level function
+VUETIFY_RUNTIME_JS = (
+    VUETIFY_LOADER_JS
+    + "\nexport {\n"
+    + "".join(f"    {name},\n" for name in re.findall(r"^(?:async )?function (\w+)", VUETIFY_LOADER_JS, re.M))
+    + "};\n"
+)
+
+# Identifies this runtime version so a page never reuses a module from an older kernel
+VUETIFY_RUNTIME_KEY = "vuetify3@" + hashlib.sha1(VUETIFY_RUNTIME_JS.encode()).hexdigest()[:12]  # noqa: S324
+
+# Per-widget bootstrap: resolves the referenced runtime model and imports its module once per page
+# Plain string (no f-string escaping) for interpolation into a widget's _esm
+RUNTIME_BOOTSTRAP_JS = """
+async function loadVuetifyRuntime(model) {
+    const cache = window.__NBAPP_RUNTIME__ = window.__NBAPP_RUNTIME__ || {};
+    const ref = model.get("_runtime");
+    const runtime = typeof ref === "string" ? await model.widget_manager.get_model(ref.slice("IPY_MODEL_".length)) : ref;
+    const key = runtime.get("key");
+    if (!cache[key]) {
+        const url = URL.createObjectURL(new Blob([runtime.get("source")], { type: "text/javascript" }));
+        cache[key] = import(url);
+        cache[key].catch(() => { delete cache[key]; });
+    }
+    return cache[key];
+}
+"""
+
+
+class VuetifyRuntime(anywidget.AnyWidget):
+    """Holds the shared Vuetify loader module; referenced by widgets, never displayed."""
+
+    _esm = "export default {};"
+    key = traitlets.Unicode(VUETIFY_RUNTIME_KEY).tag(sync=True)
+    source = traitlets.Unicode(VUETIFY_RUNTIME_JS).tag(sync=True)
+
+
+_runtime: Optional[VuetifyRuntime] = None
+
+
+def get_runtime() -> VuetifyRuntime:
+    """The kernel's shared VuetifyRuntime, recreated if it has been closed."""
+    global _runtime
+    runtime = _runtime
+    if runtime is None or runtime.comm is None:
+        runtime = _runtime = VuetifyRuntime()
+    return runtime
+
+
+class VuetifyWidget(AssetWidget):
+    """Base class for Vuetify widgets; their _esm starts with RUNTIME_BOOTSTRAP_JS."""
+
+    _runtime = traitlets.Instance(VuetifyRuntime).tag(sync=True, **widget_serialization)
+
+    @traitlets.default("_runtime")
+    def _default_runtime(self):
+        return get_runtime()
@@ -1,25 +1,23 @@
-import anywidget
 import traitlets
 
-from .base import VUETIFY_LOADER_JS
+from .runtime import RUNTIME_BOOTSTRAP_JS, VuetifyWidget
 
 
-class VuetifyTabsWidget(anywidget.AnyWidget):
+class VuetifyTabsWidget(VuetifyWidget):
     """Tab bar widget using Vuetify 3 v-tabs."""
 
     tabs = traitlets.List([]).tag(sync=True)  # List of tab names
     selected = traitlets.Int(0).tag(sync=True)  # Selected tab index
 
     _esm = f"""
-    {VUETIFY_LOADER_JS}
+    {RUNTIME_BOOTSTRAP_JS}
 
     async function render({{ model, el }}) {{
-        const {{ Vue }} = await loadVuetify();
-        const {{ createApp, ref, watch }} = Vue;
+        const {{ loadVuetify, mountVuetify, setupThemeWatcher }} = await loadVuetifyRuntime(model);
+        const {{ Vue }} = await loadVuetify(model);
+        const {{ ref, watch }} = Vue;
 
-        const {{ vuetify, mountEl }} = initVuetify(el);
-
-        const app = createApp({{
+        const component = {{
             data() {{
                 return {{
                     tabs: model.get('tabs') || [],
@@ -51,14 +49,15 @@ class VuetifyTabsWidget(anywidget.AnyWidget):
                     </v-tab>
                 </v-tabs>
             `
-        }});
+        }};
 
-        configureApp(app);
-        app.use(vuetify);
-        app.mount(mountEl);
-        setupThemeWatcher(vuetify, el, mountEl);
+        const {{ vuetify, mountEl, unmount }} = mountVuetify(el, component);
+        const unwatchTheme = setupThemeWatcher(vuetify, el, mountEl);
 
-        return () => app.unmount();
+        return () => {{
+            unwatchTheme();
+            unmount();
+        }};
     }}
 
     export default {{ render }}
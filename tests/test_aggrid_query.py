@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nbappinator.aggrid_query import GridQueryEngine, column_filter_mask, sort_permutation
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "ticker": ["AAPL", "MSFT", "GOOG", None, "AMZN"],
+            "px": [178.5, 378.9, 141.8, np.nan, 178.2],
+            "desk": ["eq", "eq", "rates", "fx", "eq"],
+            "dt": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", None, "2024-01-05"]),
+        }
+    )
+
+
+def test_sort_permutation_multi_column(df):
+    order = sort_permutation(df, [{"colId": "desk", "sort": "asc"}, {"colId": "px", "sort": "desc"}])
+    assert order is not None
+    assert order.tolist() == [1, 0, 4, 3, 2]
+    assert sort_permutation(df, []) is None
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        ({"filterType": "text", "type": "contains", "filter": "a"}, [True, False, False, False, True]),
+        ({"filterType": "text", "type": "notContains", "filter": "a"}, [False, True, True, True, False]),
+        ({"filterType": "text", "type": "blank"}, [False, False, False, True, False]),
+        (
+            {"filterType": "number", "type": "inRange", "filter": 150, "filterTo": 200},
+            [True, False, False, False, True],
+        ),
+        ({"filterType": "number", "type": "greaterThanOrEqual", "filter": 178.5}, [True, True, False, False, False]),
+        (
+            {
+                "filterType": "number",
+                "operator": "OR",
+                "conditions": [{"type": "lessThan", "filter": 150}, {"type": "greaterThan", "filter": 300}],
+            },
+            [False, True, True, False, False],
+        ),
+        (
+            {"filterType": "date", "type": "greaterThan", "dateFrom": "2024-01-02 00:00:00"},
+            [False, False, True, False, True],
+        ),
+        ({"filterType": "set", "values": ["MSFT", None]}, [False, True, False, True, False]),
+    ],
+)
+def test_column_filter_mask(df, model, expected):
+    col = {"text": "ticker", "number": "px", "date": "dt", "set": "ticker"}[model["filterType"]]
+    assert column_filter_mask(df[col], model).tolist() == expected
+
+
+def test_engine_caches_views(df):
+    engine = GridQueryEngine(df)
+    sort_model = [{"colId": "px", "sort": "asc"}]
+    filter_model = {"desk": {"filterType": "text", "type": "equals", "filter": "EQ"}}
+
+    rows, count = engine.get_rows(0, 2, sort_model, filter_model)
+    assert count == 3
+    assert rows["ticker"].tolist() == ["AMZN", "AAPL"]
+    assert engine.positions(sort_model, filter_model) is engine.positions(sort_model, filter_model)
+
+    engine.invalidate(df.iloc[:2])
+    rows, count = engine.get_rows(0, 10, sort_model, filter_model)
+    assert count == 2
+    assert rows["ticker"].tolist() == ["AAPL", "MSFT"]
+
+
+def test_engine_unsupported_filter(df):
+    with pytest.raises(ValueError):
+        GridQueryEngine(df).get_rows(0, 10, None, {"px": {"filterType": "number", "type": "bogus", "filter": 1}})
@@ -0,0 +1,134 @@
+import decimal
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nbappinator.aggrid_serialize import dataframe_to_arrow_ipc, dataframe_to_columns, dataframe_to_json
+
+
+def _columns(df):
+    return {c["name"]: c for c in dataframe_to_columns(df)["columns"]}
+
+
+def test_columns_dtypes():
+    df = pd.DataFrame(
+        {
+            "i": [1, 2, 3],
+            "f": [1.5, np.nan, np.inf],
+            "n": pd.array([1, None, 3], dtype="Int64"),
+            "b": [True, False, True],
+            "s": ["a", None, "c"],
+            "ts": [pd.Timestamp("2024-01-01"), pd.NaT, pd.Timestamp("2024-01-01 00:00:01.5")],
+            "tz": pd.to_datetime(["2024-01-01 05:00"] * 3).tz_localize("US/Eastern"),
+            "cat": pd.Categorical(["x", "y", None]),
+            "dec": [decimal.Decimal("1.25"), None, decimal.Decimal("3")],
+            "obj": [1, "two", (3,)],
+        }
+    )
+    cols = _columns(df)
+    assert cols["i"]["values"] == [1, 2, 3]
+    assert cols["f"]["values"] == [1.5, None, None]
+    assert cols["n"]["values"] == [1, None, 3]
+    assert cols["b"]["values"] == [True, False, True]
+    assert cols["s"]["values"] == ["a", None, "c"]
+    assert cols["ts"] == {"name": "ts", "type": "datetime", "values": [1704067200000, None, 1704067201500]}
+    assert cols["tz"]["values"][0] == "2024-01-01 05:00:00-05:00"
+    assert cols["cat"]["dictionary"] == ["x", "y"]
+    assert cols["cat"]["codes"] == [0, 1, -1]
+    assert cols["dec"]["values"] == [1.25, None, 3.0]
+    assert cols["obj"]["values"] == [1, "two", [3]]
+
+
+def test_json_is_strict():
+    df = pd.DataFrame({"f": [np.nan, -np.inf], "ts": [pd.NaT, pd.Timestamp("2024-01-01")]})
+    payload = json.loads(dataframe_to_json(df), parse_constant=lambda c: (_ for _ in ()).throw(ValueError(c)))
+    assert payload["length"] == 2
+
+
+def test_columns_duplicate_and_empty():
+    df = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    assert [c["values"] for c in dataframe_to_columns(df)["columns"]] == [[1], [2]]
+    assert dataframe_to_columns(pd.DataFrame({"a": []})) == {"length": 0, "columns": [{"name": "a", "values": []}]}
+
+
+def test_dictionary_encoding():
+    df = pd.DataFrame(
+        {
+            "ccy": ["USD", "EUR", None, "USD"] * 5,
+            "id": [f"id{i}" for i in range(20)],
+        }
+    )
+    cols = _columns(df)
+    assert cols["ccy"]["dictionary"] == ["USD", "EUR"]
+    assert cols["ccy"]["codes"][:4] == [0, 1, -1, 0]
+    assert "dictionary" not in cols["id"]
+
+    assert (
+        "dictionary" not in {c["name"]: c for c in dataframe_to_columns(df, dictionary_encode=False)["columns"]}["ccy"]
+    )
+    forced = {c["name"]: c for c in dataframe_to_columns(df, dictionary_encode=["id"])["columns"]}
+    assert len(forced["id"]["dictionary"]) == 20
+    assert "dictionary" not in forced["ccy"]
+
+
+def test_dictionary_encoding_arrow():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"ccy": ["USD", "EUR"] * 10, "id": [str(i) for i in range(20)]})
+    table = pa.ipc.open_stream(dataframe_to_arrow_ipc(df)).read_all()
+    assert pa.types.is_dictionary(table.schema.field("ccy").type)
+    assert not pa.types.is_dictionary(table.schema.field("id").type)
+
+
+def _values(df, **kwargs):
+    return {c["name"]: c["values"] for c in dataframe_to_columns(df, **kwargs)["columns"]}
+
+
+def test_nested_values_stay_json():
+    df = pd.DataFrame(
+        {
+            "lst": [[1, 2], [np.int64(3), np.nan], None],
+            "dct": [{"k": 1}, {2: [pd.Timestamp("2024-01-01")]}, {}],
+        }
+    )
+    values = _values(df)
+    assert values["lst"] == [[1, 2], [3, None], None]
+    assert values["dct"] == [{"k": 1}, {"2": ["2024-01-01 00:00:00"]}, {}]
+    assert json.loads(dataframe_to_json(df))["columns"][1]["values"][0] == {"k": 1}
+
+
+def test_mixed_object_values_keep_types():
+    df = pd.DataFrame({"mix": [1, "a", 2.5, None, True]})
+    assert _values(df)["mix"] == [1, "a", 2.5, None, True]
+
+
+def test_tz_aware_datetimes_keep_offset():
+    ts = pd.Series(pd.to_datetime(["2024-01-02 09:30", None]).tz_localize("US/Eastern"))
+    df = pd.DataFrame({"ts": ts})
+    # As the previous json.dumps(default=str) serialization showed them
+    assert _values(df)["ts"] == [str(ts[0]), None] == ["2024-01-02 09:30:00-05:00", None]
+
+
+def test_tz_aware_datetimes_keep_offset_arrow():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"ts": pd.to_datetime(["2024-01-02 09:30", None]).tz_localize("US/Eastern")})
+    table = pa.ipc.open_stream(dataframe_to_arrow_ipc(df)).read_all()
+    assert table.column("ts").to_pylist() == ["2024-01-02 09:30:00-05:00", None]
+
+
+def test_dictionary_encoding_skips_unhashable():
+    df = pd.DataFrame({"lst": [[1], [1], [2], None] * 5, "dct": [{"k": 1}, {"k": 1}, {}, None] * 5})
+    values = _values(df)
+    assert values["lst"][:4] == [[1], [1], [2], None]
+    assert values["dct"][:4] == [{"k": 1}, {"k": 1}, {}, None]
+    assert _values(df, dictionary_encode=["lst", "dct"]) == values
+
+
+def test_create_grid_unhashable_columns():
+    from nbappinator import create_grid
+
+    df = pd.DataFrame({"id": [1, 2], "tags": [["a", "b"], []], "meta": [{"k": 1}, {"k": 2}]})
+    grid = create_grid(df)
+    payload = json.loads(grid.row_data)
+    assert {c["name"]: c["values"] for c in payload["columns"]}["tags"] == [["a", "b"], []]
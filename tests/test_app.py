@@ -0,0 +1,238 @@
+import asyncio
+import threading
+import time
+
+import ipywidgets
+import pytest
+
+import nbappinator
+
+
+def _count_children_updates(container, counter):
+    container.observe(lambda change: counter.append(len(change["new"])), names=["children"])
+
+
+def test_hold_sync_flushes_once():
+    app = nbappinator.App(["Main"])
+    page = app.tab("Main")
+    updates = []
+    _count_children_updates(page._widget, updates)
+
+    with app.hold_sync():
+        for i in range(50):
+            page.label(f"Label {i}", name=f"l{i}")
+        assert page._widget.children == ()
+        assert "l0" in app._widgets  # Names register immediately
+
+    assert updates == [50]
+    assert len(page._widget.children) == 50
+
+
+def test_hold_sync_nested_rows_and_clear():
+    app = nbappinator.App(["Main"])
+    page = app.tab("Main")
+    page.label("old")
+    updates = []
+    _count_children_updates(page._widget, updates)
+
+    with app.hold_sync():
+        page.clear()
+        with app.hold_sync():
+            row = page.row()
+            row.label("a").label("b")
+        assert updates == []
+
+    assert updates == [1]
+    assert len(page._widget.children[0].children) == 2
+
+
+def test_add_many():
+    app = nbappinator.App(["Main"])
+    page = app.tab("Main").label("first")
+    updates = []
+    _count_children_updates(page._widget, updates)
+
+    page.add_many(ipywidgets.HTML(value=str(i)) for i in range(10))
+
+    assert updates == [11]
+
+
+def test_lazy_tab_builder():
+    app = nbappinator.App(["First", "Second"])
+    calls = []
+
+    def build_second(app):
+        calls.append("second")
+        app.tab("Second").label("built", name="second_label")
+
+    app.tab("First", builder=lambda app: app.tab("First").label("first"))
+    app.tab("Second", builder=build_second)
+    assert app.tab("First")._widget.children == ()
+
+    app.display()
+    assert len(app.tab("First")._widget.children) == 1
+    assert calls == []
+
+    tabs = app._tab_widget
+    assert tabs is not None
+    tabs.selected = 1
+    tabs.selected = 0
+    tabs.selected = 1
+    assert calls == ["second"]
+    assert "second_label" in app._widgets
+
+
+def test_lazy_tab_eviction():
+    app = nbappinator.App(["First", "Second"], evict_after=0)
+    calls = []
+
+    def build_second(app):
+        calls.append(1)
+        app.tab("Second").row(name="r").label("x", name="x")
+
+    app.tab("Second", builder=build_second)
+    app.display()
+    tabs = app._tab_widget
+    assert tabs is not None
+    tabs.selected = 1
+    label = app._widgets["x"]
+
+    tabs.selected = 0
+    assert app.tab("Second")._widget.children == ()
+    assert label.comm is None
+    assert "x" not in app._widgets and "r" not in app._containers
+
+    tabs.selected = 1
+    assert calls == [1, 1]
+    assert app._widgets["x"] is not label
+
+
+def _button(app, name):
+    btn = app._runners[name].button
+    assert btn is not None
+    return btn
+
+
+def _click(app, name):
+    btn = _button(app, name)
+    btn.clicked += 1
+    return btn
+
+
+def _wait_idle(app, name):
+    deadline = time.monotonic() + 5
+    while app._runners[name].running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_button_status_managed():
+    app = nbappinator.App(["Main"])
+    page = app.tab("Main")
+    page.button("run", on_click=lambda app: app.status("Working"), status=True)
+    page.button("custom", on_click=lambda app: app.done("Loaded 5 rows"), status=True)
+
+    assert _click(app, "run").status_text == "Done"
+    assert _click(app, "custom").status_text == "Loaded 5 rows"
+    assert not _button(app, "run").loading
+
+
+def test_button_error_status():
+    app = nbappinator.App(["Main"])
+
+    def fail(app):
+        raise ValueError("bad input")
+
+    app.tab("Main").button("run", on_click=fail, status=True)
+    with pytest.raises(ValueError):
+        _click(app, "run")
+    btn = _button(app, "run")
+    assert (btn.status_text, btn.status_color, btn.loading) == ("Error: bad input", "error", False)
+
+
+@pytest.mark.parametrize(("concurrency", "runs"), [("drop", 1), ("queue", 3)])
+def test_background_button_concurrency(concurrency, runs):
+    app = nbappinator.App(["Main"])
+    release = threading.Event()
+    calls = []
+
+    def work(app):
+        calls.append(app._current_caller)
+        release.wait(5)
+
+    app.tab("Main").button("run", on_click=work, status=True, background=True, concurrency=concurrency)
+    btn = _click(app, "run")
+    _click(app, "run")
+    _click(app, "run")
+    assert btn.loading and btn.status_text == "Running..."
+    assert btn.interruptible == (concurrency != "drop")
+
+    release.set()
+    _wait_idle(app, "run")
+    assert calls == ["run"] * runs
+    assert (btn.loading, btn.status_text) == (False, "Done")
+
+
+def test_async_button_cancel_previous():
+    app = nbappinator.App(["Main"])
+    started, finished = [], []
+
+    async def work(app):
+        started.append(app.cancel_token)
+        await asyncio.sleep(0.05)
+        finished.append(app._current_caller)
+
+    app.tab("Main").button("run", on_click=work, status=True, concurrency="cancel")
+
+    async def scenario():
+        btn = _click(app, "run")
+        await asyncio.sleep(0)
+        _click(app, "run")
+        await asyncio.sleep(0.2)
+        return btn
+
+    btn = asyncio.run(scenario())
+    assert started[0].cancelled and not started[1].cancelled
+    assert finished == ["run"]
+    assert (btn.loading, btn.status_text) == (False, "Done")
+
+
+def test_cancel_background_button():
+    app = nbappinator.App(["Main"])
+    stopped = threading.Event()
+
+    def work(app):
+        while not app.cancelled:
+            time.sleep(0.01)
+        stopped.set()
+
+    app.tab("Main").button("run", on_click=work, status=True, background=True)
+    btn = _click(app, "run")
+    app.cancel("run")
+    assert stopped.wait(5)
+    _wait_idle(app, "run")
+    assert (btn.status_text, btn.loading) == ("Cancelled", False)
+
+
+def test_form_widget_throttle():
+    app = nbappinator.App(["Main"])
+    calls = []
+    app.tab("Main").slider("s", 0, 100, on_change=lambda app: calls.append(app["s"]), throttle_ms=50)
+    app.tab("Main").text("t", debounce_ms=300)
+    slider = app._widgets["s"]
+    assert (slider.throttle_ms, app._widgets["t"].debounce_ms) == (50, 300)
+
+    async def drag():
+        for v in range(1, 21):
+            slider.value = v
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.15)
+
+    asyncio.run(drag())
+    assert calls[-1] == 20
+    assert len(calls) <= 3
+
+
+def test_form_widget_rejects_negative_delay():
+    app = nbappinator.App(["Main"])
+    with pytest.raises(ValueError):
+        app.tab("Main").text("t", debounce_ms=-1)
@@ -0,0 +1,106 @@
+import base64
+import json
+import shutil
+import subprocess
+
+import pandas as pd
+import pytest
+
+from nbappinator import assets, create_grid
+from nbappinator.assets import ASSET_LOADER_JS, ASSETS, asset_config, configure_assets, read_asset
+
+# Runs ASSET_LOADER_JS's loadAsset in node: "local" mode, fetch() serving SOURCES
+_LOADER_PRELUDE = """
+globalThis.window = globalThis;
+globalThis.fetch = async (url) => ({ ok: true, text: async () => SOURCES[url] });
+"""
+_LOADER_RUN = """
+const model = { get: () => CONFIG };
+(async () => {
+    const vue = await loadAsset(model, "vue", "");
+    const vuetify = await loadAsset(model, "vuetify", "");
+    console.log(JSON.stringify({ vue: vue.version, windowVue: window.Vue === vue, vuetify: vuetify.vue }));
+})();
+"""
+
+
+@pytest.fixture
+def asset_dir(tmp_path):
+    css = tmp_path / ASSETS["mdi-css"].path
+    css.parent.mkdir(parents=True)
+    css.write_text('@font-face{src:url("../fonts/materialdesignicons-webfont.woff2?v=7") format("woff2"),url(x.ttf)}')
+    font = tmp_path / ASSETS["mdi-font"].path
+    font.parent.mkdir(parents=True)
+    font.write_bytes(b"font")
+    d3 = tmp_path / ASSETS["d3"].path
+    d3.parent.mkdir(parents=True)
+    d3.write_text("window.d3 = {};")
+    yield tmp_path
+    configure_assets()
+
+
+def test_configure_assets_validation():
+    with pytest.raises(ValueError):
+        configure_assets("offline")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        configure_assets("local")
+    assert asset_config() == {"mode": "cdn"}
+
+
+def test_local_config(asset_dir):
+    configure_assets("local", base_url="/files/assets")
+    config = create_grid(pd.DataFrame({"a": [1]}))._asset_config
+    assert config["mode"] == "local"
+    assert config["base_url"] == "/files/assets/"
+    assert config["assets"]["d3"] == {"path": ASSETS["d3"].path, "version": ASSETS["d3"].version, "global": "d3"}
+
+
+def test_read_asset_inlines_fonts(asset_dir):
+    configure_assets("inline", asset_dir=asset_dir)
+    css = read_asset("mdi-css").decode()
+    assert f'url("data:font/woff2;base64,{base64.b64encode(b"font").decode()}")' in css
+    assert "url(x.ttf)" in css  # Missing files are left alone
+    assert read_asset("d3") == b"window.d3 = {};"
+    with pytest.raises(KeyError):
+        read_asset("jquery")
+
+
+def test_widget_serves_assets(asset_dir, monkeypatch):
+    configure_assets("inline", asset_dir=asset_dir)
+    widget = assets.AssetWidget()
+    sent = []
+    monkeypatch.setattr(widget, "send", lambda content, buffers=None: sent.append((content, buffers)))
+
+    widget._on_asset_msg(widget, {"type": "get_asset", "name": "d3", "request_id": "r1"}, [])
+    assert sent[-1] == ({"type": "asset", "request_id": "r1"}, [b"window.d3 = {};"])
+
+    widget._on_asset_msg(widget, {"type": "get_asset", "name": "vue", "request_id": "r2"}, [])
+    assert sent[-1][0]["request_id"] == "r2"
+    assert "download" in sent[-1][0]["error"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_loader_sets_bundle_globals(tmp_path):
+    # Vue's global build is `var Vue = (function(exports){...})({})`; Vuetify's UMD reads globalThis.Vue
+    sources = {
+        "vue.js": 'var Vue = (function (exports) { exports.version = "3"; return exports; })({});',
+        "vuetify.js": "(function (global, factory) { global.Vuetify = factory(global.Vue); })"
+        "(this, function (Vue) { return { vue: Vue && Vue.version }; });",
+    }
+    config = {
+        "mode": "local",
+        "base_url": "",
+        "assets": {
+            "vue": {"path": "vue.js", "version": "1", "global": "Vue"},
+            "vuetify": {"path": "vuetify.js", "version": "1", "global": "Vuetify"},
+        },
+    }
+    script = tmp_path / "loader.js"
+    script.write_text(
+        f"const SOURCES = {json.dumps(sources)};\nconst CONFIG = {json.dumps(config)};\n"
+        + _LOADER_PRELUDE
+        + ASSET_LOADER_JS
+        + _LOADER_RUN
+    )
+    out = subprocess.run(["node", str(script)], capture_output=True, text=True, check=True)  # noqa: S603, S607
+    assert json.loads(out.stdout) == {"vue": "3", "windowVue": True, "vuetify": "3"}
@@ -0,0 +1,54 @@
+import networkx as nx
+import pytest
+
+from nbappinator import compute_layout, create_graph_d3
+
+
+@pytest.mark.parametrize("layout", ["force", "radial", "hierarchical", "clustered"])
+def test_compute_layout_in_canvas(layout):
+    graph = nx.barabasi_albert_graph(300, 2, seed=1)
+    pos = compute_layout(graph, layout, width=400, height=300)
+    assert set(pos) == set(graph.nodes())
+    for x, y in pos.values():
+        assert 0 <= x <= 400
+        assert 0 <= y <= 300
+
+
+def test_compute_layout_deterministic_and_grid():
+    graph = nx.barabasi_albert_graph(1500, 2, seed=1)  # Above the exact repulsion threshold
+    assert compute_layout(graph, seed=3) == compute_layout(graph, seed=3)
+
+
+def test_compute_layout_small_graphs():
+    assert compute_layout(nx.Graph()) == {}
+    graph = nx.Graph()
+    graph.add_node("a")
+    assert compute_layout(graph, width=100, height=50) == {"a": (50.0, 25.0)}
+
+
+def test_create_graph_positions():
+    graph = nx.path_graph(5)
+    widget = create_graph_d3(graph, positions="auto")
+    assert widget.simulation == "off"
+    assert all(0 <= node["x"] <= 800 and 0 <= node["y"] <= 600 for node in widget.nodes)
+
+    widget = create_graph_d3(graph, positions=nx.circular_layout(graph), simulation="warm", width=200, height=200)
+    assert widget.simulation == "warm"
+    assert all(0 <= node["x"] <= 200 for node in widget.nodes)
+
+    assert create_graph_d3(graph).simulation == "full"
+    assert "x" not in create_graph_d3(graph).nodes[0]
+
+
+def test_create_graph_positions_invalid():
+    graph = nx.path_graph(3)
+    with pytest.raises(ValueError):
+        create_graph_d3(graph, simulation="off")
+    with pytest.raises(ValueError):
+        create_graph_d3(graph, positions="spring")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        create_graph_d3(graph, positions="auto", simulation="paused")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match=r"2 node\(s\): 1, 2"):
+        create_graph_d3(graph, positions={0: (0.0, 0.0)})
+    with pytest.raises(ValueError, match=r"20 node\(s\): 'n0', 'n1', 'n2', 'n3', 'n4', \.\.\."):
+        create_graph_d3(nx.path_graph([f"n{i}" for i in range(20)]), positions={})
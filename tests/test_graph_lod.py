@@ -0,0 +1,159 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from nbappinator import create_graph_d3
+from nbappinator.graph_lod import ClusterView, label_propagation
+from nbappinator.networkgraph import graph_arrays
+
+
+def _expand_all(view):
+    while True:
+        clusters = [node["id"] for node in view.nodes() if node.get("cluster")]
+        if not clusters:
+            return
+        for item_id in clusters:
+            view.expand(item_id)
+
+
+def test_label_propagation_cliques():
+    graph = nx.disjoint_union(nx.complete_graph(10), nx.complete_graph(10))
+    graph.add_edge(0, 10)
+    arrays = graph_arrays(graph)
+    labels = label_propagation(len(arrays.nodes), arrays.sources, arrays.targets)
+    assert len(set(labels[:10])) == 1
+    assert len(set(labels[10:])) == 1
+    assert labels[0] != labels[10]
+
+
+def test_cluster_view_levels_and_expand():
+    graph = nx.planted_partition_graph(20, 50, 0.3, 0.002, seed=1)
+    view = ClusterView(graph_arrays(graph), max_nodes=10)
+    assert view.levels >= 2
+    nodes = view.nodes()
+    assert len(nodes) <= 10
+    assert sum(node.get("size", 1) for node in nodes) == graph.number_of_nodes()
+    assert sum(link["count"] for link in view.links()) <= graph.number_of_edges()
+
+    cluster = max(nodes, key=lambda node: node["size"])
+    new_nodes, new_links = view.expand(cluster["id"])
+    assert sum(node.get("size", 1) for node in new_nodes) == cluster["size"]
+    ids = {node["id"] for node in view.nodes()}
+    assert cluster["id"] not in ids
+    assert {node["id"] for node in new_nodes} <= ids
+    assert all(link["source"] in ids and link["target"] in ids for link in new_links)
+    assert view.expand(cluster["id"]) is None  # No longer shown
+    assert view.expand("n0") is None
+    assert view.expand("bogus") is None
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_cluster_view_full_expansion(directed):
+    graph = nx.gnm_random_graph(400, 1200, seed=2, directed=directed)
+    view = ClusterView(graph_arrays(graph), max_nodes=20, directed=directed)
+    _expand_all(view)
+    assert sorted(node["id"] for node in view.nodes()) == sorted(f"n{i}" for i in range(400))
+    links = view.links()
+    assert sum(link["count"] for link in links) == graph.number_of_edges()
+    edges = {(f"n{u}", f"n{v}") for u, v in graph.edges()}
+    if not directed:
+        edges |= {(v, u) for u, v in edges}
+    assert {(link["source"], link["target"]) for link in links} <= edges
+
+
+def test_cluster_view_link_cap():
+    graph = nx.planted_partition_graph(40, 20, 0.5, 0.05, seed=4)
+    arrays = graph_arrays(graph)
+    full = ClusterView(arrays, max_nodes=40, max_cluster_links=1000)
+    capped = ClusterView(arrays, max_nodes=40, max_cluster_links=3)
+    assert len(capped.nodes()) == len(full.nodes())
+    weights = {(link["source"], link["target"]): link["count"] for link in full.links()}
+    links = capped.links()
+    assert len(links) <= 3 * len(capped.nodes()) < len(weights)
+    # Each item keeps its heaviest link
+    kept = {(link["source"], link["target"]) for link in links}
+    for node in capped.nodes():
+        heaviest = max(count for pair, count in weights.items() if node["id"] in pair)
+        assert heaviest == max(weights[pair] for pair in kept if node["id"] in pair)
+    with pytest.raises(ValueError):
+        ClusterView(arrays, max_cluster_links=0)
+
+    # Every link kept is among the 3 heaviest of one of its ends
+    def heavier(item, count):
+        return sum(1 for pair, other in weights.items() if item in pair and other > count)
+
+    assert all(
+        min(heavier(link["source"], link["count"]), heavier(link["target"], link["count"])) < 3 for link in links
+    )
+    with pytest.raises(ValueError):
+        ClusterView(arrays, max_cluster_links=0)
+
+
+def test_cluster_view_small_and_isolated():
+    graph = nx.path_graph(5)
+    view = ClusterView(graph_arrays(graph), max_nodes=10)
+    assert view.levels == 0
+    assert [node["name"] for node in view.nodes()] == ["0", "1", "2", "3", "4"]
+
+    graph = nx.empty_graph(100)  # No communities: grouped into buckets
+    view = ClusterView(graph_arrays(graph), max_nodes=10)
+    assert len(view.nodes()) <= 10
+    _expand_all(view)
+    assert len(view.nodes()) == 100
+
+
+def test_cluster_view_positions():
+    graph = nx.planted_partition_graph(5, 20, 0.5, 0.01, seed=3)
+    xy = np.random.default_rng(0).random((100, 2)) * 100
+    view = ClusterView(graph_arrays(graph), max_nodes=5, xy=xy)
+    for node in view.nodes():
+        assert 0 <= node["x"] <= 100 and 0 <= node["y"] <= 100
+
+
+def test_create_graph_lod(monkeypatch):
+    graph = nx.planted_partition_graph(20, 30, 0.3, 0.002, seed=1)
+    widget = create_graph_d3(graph, lod=True, lod_max_nodes=10, positions="auto")
+    assert len(widget.nodes) <= 10
+    assert all(0 <= node["x"] <= 800 and 0 <= node["y"] <= 600 for node in widget.nodes)
+    sent = []
+    monkeypatch.setattr(widget, "send", lambda content, buffers=None: sent.append(content))
+
+    changes = []
+    widget.observe(changes.append, names=["nodes", "links", "lod_version"])
+
+    top = widget.nodes
+    cluster = max(top, key=lambda node: node.get("size", 1))
+    widget._on_custom_msg(widget, {"type": "expand", "id": cluster["id"]}, [])
+    assert sent[0]["type"] == "expand" and sent[0]["id"] == cluster["id"] and sent[0]["version"] == 1
+    assert all("x" in node for node in sent[0]["nodes"])  # Placed around the cluster
+    assert changes == [] and widget.nodes is top  # Only the delta is sent
+
+    widget._on_custom_msg(widget, {"type": "expand", "id": cluster["id"]}, [])  # Already expanded
+    assert len(sent) == 1
+
+    widget._on_custom_msg(widget, {"type": "ready"}, [])  # A view rendered from the older lists
+    assert widget.lod_version == 1
+    ids = {node["id"] for node in widget.nodes}
+    assert cluster["id"] not in ids
+    assert {node["id"] for node in sent[0]["nodes"]} <= ids
+    shown = {node["id"]: node for node in widget.nodes}
+    assert all((shown[node["id"]]["x"], shown[node["id"]]["y"]) == (node["x"], node["y"]) for node in sent[0]["nodes"])
+    assert all("x" in node for node in widget.nodes)
+    assert {link["source"] for link in widget.links} <= ids
+
+    changes.clear()
+    widget._on_custom_msg(widget, {"type": "ready"}, [])  # Already current
+    assert changes == []
+
+
+def test_create_graph_lod_edge_list():
+    df = pd.DataFrame({"source": np.arange(1000) % 50, "target": (np.arange(1000) * 7 + 1) % 50})
+    widget = create_graph_d3(df, lod=True, lod_max_nodes=5)
+    assert widget.simulation == "full"
+    assert len(widget.nodes) <= 5
+
+
+def test_create_graph_lod_invalid():
+    with pytest.raises(ValueError, match="lod"):
+        create_graph_d3(nx.path_graph(3), lod=True, transport="binary")
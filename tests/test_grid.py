@@ -0,0 +1,384 @@
+import datetime
+import json
+import shutil
+import subprocess
+
+import pandas as pd
+import pytest
+
+from nbappinator import create_grid
+from nbappinator.aggrid_anywidget import AGGridWidget
+from nbappinator.aggrid_serialize import dataframe_to_arrow_ipc, dataframe_to_json
+
+# Decodes the same rows in node with the grid's own front end code: the JSON payload with
+# zipColumns, and the Arrow table with decodeArrowRows over a stand-in for Arrow JS, which
+# returns temporal values as epoch milliseconds like Arrow JS does
+_DECODE_HARNESS = """
+const arrow = {
+    DataType: { isTimestamp: (type) => type === "timestamp", isDate: (type) => type === "date" },
+    tableFromIPC: () => ({
+        schema: { fields: TABLE.fields },
+        numRows: TABLE.numRows,
+        getChildAt: (i) => ({ get: (r) => TABLE.columns[i][r] }),
+    }),
+};
+window.__NBAPP_ASSETS__.loads["https://cdn.jsdelivr.net/npm/apache-arrow@latest/+esm"] = Promise.resolve(arrow);
+const model = { get: () => undefined };
+const json = zipColumns(JSON.parse(PAYLOAD));
+const decoded = await decodeArrowRows(model, new DataView(new ArrayBuffer(1)));
+console.log(JSON.stringify({ json, arrow: decoded }));
+"""
+
+
+def _zip(payload):
+    """Zip a column-oriented payload into records, like the grid's front end."""
+    rows = [{} for _ in range(payload["length"])]
+    for col in payload["columns"]:
+        values = col.get("values")
+        if "dictionary" in col:
+            values = [None if c < 0 else col["dictionary"][c] for c in col["codes"]]
+        for row, value in zip(rows, values, strict=True):
+            row[col["name"]] = value
+    return rows
+
+
+def _rows(text):
+    return _zip(json.loads(text))
+
+
+def test_grid_json_transport():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    grid = create_grid(df)
+    assert grid.transport == "json"
+    assert _rows(grid.row_data) == df.to_dict(orient="records")
+    assert grid.row_data_buffer == b""
+
+
+def test_grid_arrow_transport():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": ["x", None, "z"],
+            "ts": pd.date_range("2024-01-01", periods=3),
+            "mixed": [1, "two", 3.0],
+        }
+    )
+    grid = create_grid(df, transport="arrow", num_toppinned_rows=1)
+    assert grid.row_data == "[]"
+    assert len(_rows(grid.pinned_top_rows)) == 1
+
+    table = pa.ipc.open_stream(grid.row_data_buffer).read_all()
+    assert table.num_rows == 2
+    assert table.column_names == ["a", "b", "ts", "mixed"]
+    assert table.schema.field("ts").type == pa.timestamp("ms")
+    assert table.column("mixed").to_pylist() == ["two", "3.0"]
+
+
+def test_grid_arrow_transport_keeps_dates():
+    pa = pytest.importorskip("pyarrow")
+    grid = create_grid(pd.DataFrame({"day": [datetime.date(2024, 1, 1), None]}), transport="arrow")
+    table = pa.ipc.open_stream(grid.row_data_buffer).read_all()
+    assert table.schema.field("day").type == pa.date32()
+    assert table.column("day").to_pylist() == [datetime.date(2024, 1, 1), None]
+
+
+def test_grid_invalid_transport():
+    with pytest.raises(ValueError):
+        create_grid(pd.DataFrame({"a": [1]}), transport="xml")  # type: ignore[arg-type]
+
+
+def _sent_transactions(grid, monkeypatch):
+    sent = []
+    monkeypatch.setattr(grid, "send", lambda content, buffers=None: sent.append(content))
+    return sent
+
+
+def test_grid_delta_updates(monkeypatch):
+    df = pd.DataFrame({"id": [1, 2, 3], "px": [10.0, 20.0, 30.0]})
+    grid = create_grid(df, row_id="id")
+    sent = _sent_transactions(grid, monkeypatch)
+
+    grid.add_rows([{"id": 4, "px": 40.0}])
+    grid.update_rows(pd.DataFrame({"id": [2], "px": [21.0]}))
+    grid.remove_rows([1])
+
+    payloads = [{kind: _zip(rows) for kind, rows in json.loads(m["payload"]).items()} for m in sent]
+    assert payloads == [
+        {"add": [{"id": 4, "px": 40.0}]},
+        {"update": [{"id": 2, "px": 21.0}]},
+        {"remove": [{"id": 1}]},
+    ]
+    assert grid.df is not None
+    assert grid.df["id"].tolist() == [2, 3, 4]
+    assert grid.df["px"].tolist() == [21.0, 30.0, 40.0]
+
+    # A newly rendered view picks up deltas applied before it existed
+    grid._on_custom_msg(grid, {"type": "ready"}, [])
+    assert _rows(grid.row_data) == grid.df.to_dict(orient="records")
+
+
+def test_grid_delta_requires_row_id():
+    grid = create_grid(pd.DataFrame({"id": [1]}))
+    with pytest.raises(ValueError):
+        grid.remove_rows([1])
+    with pytest.raises(ValueError):
+        create_grid(pd.DataFrame({"id": [1]}), row_id="missing")
+
+
+def test_grid_update_unknown_row(monkeypatch):
+    grid = create_grid(pd.DataFrame({"id": [1], "px": [1.0]}), row_id="id")
+    _sent_transactions(grid, monkeypatch)
+    with pytest.raises(KeyError):
+        grid.update_rows([{"id": 99, "px": 2.0}])
+
+
+def test_grid_update_rows_upcasts(monkeypatch):
+    grid = create_grid(pd.DataFrame({"id": [1, 2], "px": [1.0, 2.0], "q": [1, 2]}), row_id="id")
+    sent = _sent_transactions(grid, monkeypatch)
+    grid.update_rows([{"id": 2, "px": 9.5, "q": 7.5}])
+    assert grid.df is not None
+    assert grid.df["q"].tolist() == [1.0, 7.5]
+    assert grid.df["px"].tolist() == [1.0, 9.5]
+    assert _zip(json.loads(sent[-1]["payload"])["update"]) == [{"id": 2, "px": 9.5, "q": 7.5}]
+
+    grid.update_rows([{"id": 1, "px": 3.0, "q": "x"}])
+    assert grid.df["q"].tolist() == ["x", 7.5]
+    assert grid.df["px"].tolist() == [3.0, 9.5]
+
+
+def test_grid_remove_pinned_row(monkeypatch):
+    grid = create_grid(pd.DataFrame({"id": [1, 2, 3]}), row_id="id", num_toppinned_rows=1)
+    sent = _sent_transactions(grid, monkeypatch)
+    with pytest.raises(ValueError, match="Pinned"):
+        grid.remove_rows([1, 2])
+    assert sent == []
+    assert grid.df is not None
+    assert grid.df["id"].tolist() == [1, 2, 3]
+    grid.remove_rows([2])
+    grid._on_custom_msg(grid, {"type": "ready"}, [])
+    assert _rows(grid.row_data) == [{"id": 3}]
+
+
+def test_grid_server_row_model(monkeypatch):
+    df = pd.DataFrame({"id": range(100), "v": [i % 7 for i in range(100)]})
+    grid = create_grid(df, row_model="server", row_id="id")
+    assert grid.row_data == "[]"
+    sent = _sent_transactions(grid, monkeypatch)
+
+    grid._on_custom_msg(
+        grid,
+        {
+            "type": "get_rows",
+            "request_id": "a:0",
+            "start_row": 0,
+            "end_row": 3,
+            "sort_model": [{"colId": "v", "sort": "desc"}, {"colId": "id", "sort": "asc"}],
+            "filter_model": {},
+        },
+        [],
+    )
+    (reply,) = sent
+    assert reply["request_id"] == "a:0"
+    assert reply["row_count"] == 100
+    assert _rows(reply["payload"]) == [{"id": 6, "v": 6}, {"id": 13, "v": 6}, {"id": 20, "v": 6}]
+
+    # Deltas only ask the browser to refetch its blocks
+    grid.remove_rows([0])
+    assert sent[-1] == {"type": "refresh"}
+
+
+def test_grid_server_row_model_no_tree():
+    with pytest.raises(ValueError):
+        create_grid(pd.DataFrame({"path": ["a"]}), is_tree=True, row_model="server")
+
+
+def test_grid_server_row_model_filters(monkeypatch):
+    df = pd.DataFrame({"id": range(10), "v": range(10)})
+    grid = create_grid(df, row_model="server")
+    sent = _sent_transactions(grid, monkeypatch)
+    grid._on_custom_msg(
+        grid,
+        {
+            "type": "get_rows",
+            "request_id": "a:1",
+            "start_row": 0,
+            "end_row": 100,
+            "sort_model": [{"colId": "v", "sort": "desc"}],
+            "filter_model": {"v": {"filterType": "number", "type": "lessThan", "filter": 3}},
+        },
+        [],
+    )
+    assert sent[0]["row_count"] == 3
+    assert [r["v"] for r in _rows(sent[0]["payload"])] == [2, 1, 0]
+
+
+def test_grid_does_not_copy_input():
+    np = pytest.importorskip("numpy")
+    values = np.arange(5, dtype=float)
+    df = pd.DataFrame({("a", 1): values, ("b", 2): values * 2})
+    grid = create_grid(df, showindex=True)
+
+    assert grid.df is not None
+    assert list(grid.df.columns) == ["index", "('a', 1)", "('b', 2)"]
+    assert np.shares_memory(grid.df["('a', 1)"].to_numpy(), df[("a", 1)].to_numpy())
+    # The caller's frame is left untouched
+    assert list(df.columns) == [("a", 1), ("b", 2)]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.Index(list("abc"), name="key"),
+        pd.RangeIndex(3),
+        pd.MultiIndex.from_tuples([("x", 1), ("x", 2), ("y", 1)], names=["grp", None]),
+    ],
+)
+def test_grid_showindex_matches_reset_index(index):
+    df = pd.DataFrame({"v": [1, 2, 3]}, index=index)
+    grid = create_grid(df, showindex=True)
+    pd.testing.assert_frame_equal(grid.df, df.reset_index())
+
+
+def test_grid_update_rows_leaves_input_untouched(monkeypatch):
+    df = pd.DataFrame({"id": [1, 2], "px": [1.0, 2.0]})
+    grid = create_grid(df, row_id="id")
+    _sent_transactions(grid, monkeypatch)
+    grid.update_rows([{"id": 2, "px": 5.0}])
+    assert df["px"].tolist() == [1.0, 2.0]
+    assert grid.df is not None
+    assert grid.df["px"].tolist() == [1.0, 5.0]
+
+
+@pytest.mark.parametrize("transport", ["json", "arrow"])
+def test_grid_streaming(monkeypatch, transport):
+    if transport == "arrow":
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"id": range(50)})
+    grid = create_grid(df, stream=True, chunk_size=20, transport=transport)
+    sent = []
+    monkeypatch.setattr(grid, "send", lambda content, buffers=None: sent.append((content, buffers)))
+
+    # First page goes with the widget, the remainder is pulled chunk by chunk
+    if transport == "json":
+        assert len(_rows(grid.row_data)) == 20
+
+    offset, streamed = 20, []
+    while True:
+        grid._on_custom_msg(grid, {"type": "get_chunk", "request_id": "v:1", "offset": offset}, [])
+        content, buffers = sent[-1]
+        if transport == "arrow":
+            import pyarrow as pa
+
+            streamed += pa.ipc.open_stream(buffers[0]).read_all().column("id").to_pylist()
+        else:
+            streamed += [r["id"] for r in _rows(content["payload"])]
+        offset = content["next_offset"]
+        if content["done"]:
+            break
+    assert streamed == list(range(20, 50))
+
+
+def test_grid_streaming_restart_after_delta(monkeypatch):
+    # A view streaming when rows change restarts from offset 0 with a new request id
+    grid = create_grid(pd.DataFrame({"id": range(50)}), stream=True, chunk_size=20, row_id="id")
+    sent = []
+    monkeypatch.setattr(grid, "send", lambda content, buffers=None: sent.append(content))
+    grid._on_custom_msg(grid, {"type": "get_chunk", "request_id": "v:1", "offset": 20}, [])
+    grid.add_rows([{"id": 50}, {"id": 51}])
+    grid.remove_rows([3, 25])
+    assert [content["type"] for content in sent] == ["chunk", "transaction", "transaction"]
+
+    offset, streamed = 0, []
+    while True:
+        grid._on_custom_msg(grid, {"type": "get_chunk", "request_id": "v:2", "offset": offset}, [])
+        streamed += [r["id"] for r in _rows(sent[-1]["payload"])]
+        offset = sent[-1]["next_offset"]
+        if sent[-1]["done"]:
+            break
+    assert streamed == [i for i in range(52) if i not in (3, 25)]
+
+
+def test_grid_streaming_first_page():
+    grid = create_grid(pd.DataFrame({"id": range(50)}), stream=True, chunk_size=1000)
+    assert len(_rows(grid.row_data)) == 20
+
+
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_grid_compression(compression):
+    import gzip
+    import zlib
+
+    inflate = gzip.decompress if compression == "gzip" else zlib.decompress
+    df = pd.DataFrame({"id": range(1000), "desk": ["Rates", "FX"] * 500})
+    grid = create_grid(df, compression=compression, compression_threshold=1000)
+    assert grid.row_data_compression == compression
+    assert grid.row_data == "[]"
+    assert _rows(inflate(grid.row_data_buffer).decode()) == _rows(create_grid(df).row_data)
+
+
+def test_grid_compression_threshold():
+    df = pd.DataFrame({"id": range(10)})
+    grid = create_grid(df, compression="gzip")
+    assert grid.row_data_compression == ""
+    assert grid.row_data_buffer == b""
+    assert [r["id"] for r in _rows(grid.row_data)] == list(range(10))
+
+    with pytest.raises(ValueError):
+        create_grid(df, compression="brotli")  # type: ignore[arg-type]
+    grid.compression = "brotli"  # Set on the widget: checked when rows are next encoded
+    with pytest.raises(ValueError):
+        grid._encode_rows(df)
+
+
+def test_grid_compressed_chunks(monkeypatch):
+    import gzip
+
+    grid = create_grid(pd.DataFrame({"id": range(50)}), stream=True, chunk_size=20, compression="gzip")
+    grid.compression_threshold = 0
+    sent = []
+    monkeypatch.setattr(grid, "send", lambda content, buffers=None: sent.append((content, buffers)))
+    grid._on_custom_msg(grid, {"type": "get_chunk", "request_id": "v:1", "offset": 20}, [])
+    content, buffers = sent[-1]
+    assert content["compression"] == "gzip"
+    assert "payload" not in content
+    assert [r["id"] for r in _rows(gzip.decompress(buffers[0]).decode())] == list(range(20, 40))
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_grid_transports_show_the_same_dates(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "day": [datetime.date(2024, 1, 1), None],
+            "at": pd.to_datetime(["2024-01-01 00:00:00", "2024-01-02 03:04:05"]),
+        }
+    )
+    table = pa.ipc.open_stream(dataframe_to_arrow_ipc(df)).read_all()
+    assert table.schema.field("day").type == pa.date32()
+    epoch = datetime.date(1970, 1, 1)
+    stand_in = {
+        "numRows": table.num_rows,
+        "fields": [
+            {"name": "day", "type": "date"},
+            {"name": "at", "type": "timestamp"},
+        ],
+        "columns": [
+            [None if d is None else (d - epoch).days * 86_400_000 for d in table.column("day").to_pylist()],
+            table.column("at").cast(pa.int64()).to_pylist(),
+        ],
+    }
+    script = tmp_path / "decode.mjs"
+    script.write_text(
+        "globalThis.window = globalThis;\n"
+        + f"const TABLE = {json.dumps(stand_in)};\nconst PAYLOAD = {json.dumps(dataframe_to_json(df))};\n"
+        + AGGridWidget._esm
+        + _DECODE_HARNESS
+    )
+    out = subprocess.run(["node", str(script)], capture_output=True, text=True, check=True)  # noqa: S603, S607
+    decoded = json.loads(out.stdout)
+    assert decoded["arrow"] == decoded["json"]
+    assert decoded["json"] == [
+        {"day": "2024-01-01", "at": "2024-01-01 00:00:00"},
+        {"day": None, "at": "2024-01-02 03:04:05"},
+    ]
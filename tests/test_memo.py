@@ -0,0 +1,83 @@
+import time
+
+import pandas as pd
+import pytest
+
+import nbappinator
+from nbappinator.memo import estimate_size
+
+
+def _app():
+    app = nbappinator.App(["Main"])
+    page = app.tab("Main")
+    page.select("source", options=["a", "b", "c"], default="a")
+    page.select("cols", options=["x", "y"], default=["x"], multiple=True)
+    return app
+
+
+def test_memoize_keyed_on_widget_values():
+    app = _app()
+    calls = []
+
+    @nbappinator.memoize("source", "cols")
+    def load(app, scale=1):
+        calls.append(app["source"])
+        return pd.DataFrame({"v": range(10)}) * scale
+
+    first = load(app)
+    app["source"] = "b"
+    load(app)
+    app["source"] = "a"
+    assert load(app) is first
+    load(app, scale=2)
+    app["cols"] = ["x", "y"]
+    load(app)
+
+    assert calls == ["a", "b", "a", "a"]
+    assert load.cache_info().hits == 1
+
+
+def test_memoize_lru_ttl_and_budget():
+    app = _app()
+
+    @nbappinator.memoize("source", maxsize=2, ttl=0.05)
+    def load(app):
+        return app["source"]
+
+    for source in ["a", "b", "c"]:
+        app["source"] = source
+        load(app)
+    assert load.cache_info().currsize == 2
+    time.sleep(0.06)
+    load(app)
+    assert load.cache_info().misses == 4
+
+    @nbappinator.memoize("source", max_bytes=1000, sizeof=len)
+    def frame(app):
+        return "x" * 600 if app["source"] == "c" else "x" * 2000
+
+    frame(app)
+    app["source"] = "a"
+    frame(app)  # Larger than the budget: not cached
+    assert frame.cache_info().currsize == 1
+    assert frame.cache_info().nbytes == 600
+
+
+def test_memoize_validation_and_sizes():
+    with pytest.raises(ValueError):
+        nbappinator.memoize("source", maxsize=0)
+    df = pd.DataFrame({"v": range(1000)})
+    assert estimate_size(df) >= 8000
+    assert estimate_size([df, df]) >= 16000
+
+
+def test_memoize_mixed_type_dict_keys():
+    app = _app()
+
+    @nbappinator.memoize("source")
+    def load(app, mapping):
+        return len(mapping)
+
+    assert load(app, {1: "x", "a": 2}) == 2
+    assert load(app, {"a": 2, 1: "x"}) == 2
+    assert load.cache_info().hits == 1
@@ -0,0 +1,125 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from nbappinator import create_graph_d3
+from nbappinator.networkgraph import graph_arrays
+
+
+@pytest.mark.parametrize("renderer", ["svg", "canvas", "webgl"])
+def test_renderer(renderer):
+    widget = create_graph_d3(nx.path_graph(3), renderer=renderer)
+    assert widget.renderer == renderer
+
+
+def test_renderer_default_and_invalid():
+    assert create_graph_d3(nx.path_graph(3)).renderer == "svg"
+    with pytest.raises(ValueError):
+        create_graph_d3(nx.path_graph(3), renderer="dom")  # type: ignore[arg-type]
+
+
+def _weighted_graph():
+    graph = nx.Graph()
+    graph.add_edge("a", "b", weight=0.5, type="road", since=2020)
+    graph.add_edge("b", "c", type="rail")
+    return graph
+
+
+def test_binary_transport():
+    widget = create_graph_d3(_weighted_graph(), transport="binary", positions={"a": (0, 0), "b": (1, 0), "c": (2, 1)})
+    assert widget.transport == "binary"
+    assert widget.nodes == [] and widget.links == []
+    assert widget.node_names.decode().split("\0") == ["a", "b", "c"]
+    assert np.frombuffer(widget.node_degrees, "<i4").tolist() == [1, 2, 1]
+    assert np.frombuffer(widget.node_positions, "<f4").reshape(-1, 2).shape == (3, 2)
+    assert np.frombuffer(widget.link_sources, "<i4").tolist() == [0, 1]
+    assert np.frombuffer(widget.link_targets, "<i4").tolist() == [1, 2]
+    weights = np.frombuffer(widget.link_weights, "<f4")
+    assert weights[0] == 0.5 and np.isnan(weights[1])
+
+
+def test_binary_link_attributes(monkeypatch):
+    widget = create_graph_d3(_weighted_graph(), transport="binary", link_attributes=["type", "weight"])
+    sent = []
+    monkeypatch.setattr(widget, "send", lambda content, buffers=None: sent.append(content))
+    widget._on_custom_msg(widget, {"type": "get_link", "index": 0}, [])
+    widget._on_custom_msg(widget, {"type": "get_link", "index": 5}, [])
+    assert sent == [
+        {"type": "link", "index": 0, "attributes": {"type": "road"}},  # weight is in link_weights
+        {"type": "link", "index": 5, "attributes": {}},
+    ]
+
+
+def test_json_link_attributes():
+    widget = create_graph_d3(_weighted_graph(), link_attributes=["type"])
+    assert widget.links[0] == {"source": "a", "target": "b", "type": "road"}
+
+
+def test_binary_transport_invalid():
+    with pytest.raises(ValueError):
+        create_graph_d3(nx.path_graph(3), transport="arrow")  # type: ignore[arg-type]
+    graph = nx.Graph()
+    graph.add_node("a\0b")
+    with pytest.raises(ValueError):
+        create_graph_d3(graph, transport="binary")
+
+
+def test_edge_list_dataframe():
+    edges = pd.DataFrame(
+        {"src": ["a", "c", "a"], "dst": ["b", "d", "c"], "weight": [1.0, 2.0, 3.0], "kind": list("xyz")}
+    )
+    widget = create_graph_d3(edges, source="src", target="dst")
+    graph = nx.from_pandas_edgelist(edges, "src", "dst", edge_attr=True)
+    expected = create_graph_d3(graph)
+    assert sorted(widget.nodes, key=lambda n: n["id"]) == sorted(expected.nodes, key=lambda n: n["id"])
+    assert widget.links == [
+        {"source": "a", "target": "b", "weight": 1.0, "kind": "x"},
+        {"source": "c", "target": "d", "weight": 2.0, "kind": "y"},
+        {"source": "a", "target": "c", "weight": 3.0, "kind": "z"},
+    ]
+
+
+def test_edge_list_dataframe_binary(monkeypatch):
+    edges = pd.DataFrame({"source": [1, 2], "target": [2, 3], "weight": [0.5, 1.5], "count": [7, 8]})
+    widget = create_graph_d3(edges, transport="binary", positions="auto")
+    assert widget.node_names.decode().split("\0") == ["1", "2", "3"]
+    assert np.frombuffer(widget.link_weights, "<f4").tolist() == [0.5, 1.5]
+    sent = []
+    monkeypatch.setattr(widget, "send", lambda content, buffers=None: sent.append(content))
+    widget._on_custom_msg(widget, {"type": "get_link", "index": 1}, [])
+    assert sent == [{"type": "link", "index": 1, "attributes": {"count": 8}}]
+    assert type(sent[0]["attributes"]["count"]) is int
+
+
+def test_edge_list_dataframe_invalid():
+    with pytest.raises(ValueError):
+        create_graph_d3(pd.DataFrame({"source": ["a"], "to": ["b"]}))
+    with pytest.raises(ValueError):
+        create_graph_d3(pd.DataFrame({"source": ["a", None], "target": ["b", "c"]}))
+
+
+def test_graph_arrays_degrees():
+    graph = nx.MultiDiGraph([(0, 1), (0, 1), (2, 2), (1, 3)])
+    arrays = graph_arrays(graph)
+    assert arrays.degrees.tolist() == [d for _, d in graph.degree()]
+    assert arrays.weights is None
+    assert len(arrays.link_data) == 4
+
+
+@pytest.mark.parametrize("graph_type", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph])
+def test_graph_arrays_edge_order(graph_type):
+    graph = graph_type()
+    graph.add_nodes_from([("t", 1), "x", 3, "isolated"])
+    graph.add_edge(3, ("t", 1), weight=1.0)
+    graph.add_edge("x", 3, weight=2.0)
+    graph.add_edge("x", "x")
+    graph.add_edge(("t", 1), "x", weight=4.0)
+    graph.add_edge(3, ("t", 1), weight=5.0)  # Parallel edge in multigraphs
+    arrays = graph_arrays(graph)
+    edges = zip(arrays.sources, arrays.targets, strict=True)
+    assert [(arrays.nodes[u], arrays.nodes[v]) for u, v in edges] == list(graph.edges())
+    expected = [np.nan if w is None else w for _, _, w in graph.edges(data="weight")]
+    np.testing.assert_array_equal(arrays.weights, expected)
+    assert arrays.degrees.tolist() == [d for _, d in graph.degree()]
+    assert graph_arrays(graph, with_weights=False).weights is None
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import threading
+import time
+
+import nbappinator
+from nbappinator.vuetify3 import OutputHandler, VuetifyOutputWidget
+
+
+def _sent(widget):
+    messages = []
+    widget.send = lambda content, buffers=None: messages.append(content)
+    return messages
+
+
+def test_append_sends_deltas():
+    w = VuetifyOutputWidget()
+    messages = _sent(w)
+    states = []
+    w.observe(lambda change: states.append(change), names=["content"])
+
+    w.append("hello ")
+    w.append("world\n")
+
+    assert messages == [{"type": "append", "text": "hello "}, {"type": "append", "text": "world\n"}]
+    assert states == []  # The content trait isn't resynced per append
+    assert w.text == "hello world\n"
+    assert w.content == "hello world\n"
+    assert w.get_state()["content"] == "hello world\n"  # Full state for new front ends
+
+
+def test_set_content_after_append():
+    w = VuetifyOutputWidget()
+    _sent(w)
+    states = []
+    w.observe(lambda change: states.append(change["new"]), names=["content"])
+
+    w.append("hello\n")
+    w.content = ""
+    assert states == [""]
+    assert w.text == w.content == ""
+
+    w.append("a\n")
+    w.content = "b\n"
+    w.append("c\n")
+    assert w.text == w.content == "b\nc\n"
+    w.clear()
+    assert w.text == w.content == ""
+    assert states == ["", "b\n", ""]
+
+
+def test_ring_buffer():
+    w = VuetifyOutputWidget(content="first\n", max_lines=3)
+    _sent(w)
+    for i in range(10):
+        w.append(f"line {i}\n")
+    w.append("partial")
+    assert w.text == "line 7\nline 8\nline 9\npartial"
+
+    w.max_lines = 1
+    assert w.text == "line 9\npartial"
+    w.clear()
+    assert w.text == ""
+
+
+def test_page_output_max_lines():
+    app = nbappinator.App(["Main"])
+    app.tab("Main").output("log", max_lines=50)
+    assert app._widgets["log"].max_lines == 50
+
+
+def test_capture_is_per_thread():
+    outputs = [VuetifyOutputWidget() for _ in range(4)]
+    for w in outputs:
+        _sent(w)
+    barrier = threading.Barrier(len(outputs))
+
+    def work(i, w):
+        with w:
+            barrier.wait()
+            for j in range(50):
+                print(f"{i}:{j}")
+
+    threads = [threading.Thread(target=work, args=(i, w)) for i, w in enumerate(outputs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for i, w in enumerate(outputs):
+        assert w.text == "".join(f"{i}:{j}\n" for j in range(50))
+
+
+def test_capture_is_per_task():
+    a, b = VuetifyOutputWidget(), VuetifyOutputWidget()
+    _sent(a)
+    _sent(b)
+
+    async def job(w, name):
+        with w:
+            for i in range(3):
+                print(name, i)
+                await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(job(a, "a"), job(b, "b"))
+
+    asyncio.run(main())
+    assert a.text == "a 0\na 1\na 2\n"
+    assert b.text == "b 0\nb 1\nb 2\n"
+
+
+def test_write_batches_until_flush_interval():
+    w = VuetifyOutputWidget(flush_interval=0.05)
+    messages = _sent(w)
+    handler = OutputHandler(w)
+    logger = logging.getLogger("nbapp-test-output")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for i in range(20):
+            logger.warning("step %d", i)
+        assert messages == []
+        deadline = time.monotonic() + 5
+        while not messages and time.monotonic() < deadline:  # Flushed by the timer thread
+            time.sleep(0.01)
+    finally:
+        logger.removeHandler(handler)
+
+    assert len(messages) == 1
+    assert w.text.splitlines() == [f"step {i}" for i in range(20)]
+
+
+def test_flush_sends_written_text_now():
+    w = VuetifyOutputWidget(flush_interval=60)
+    messages = _sent(w)
+    print("a", file=w)
+    print("b", file=w)
+    assert messages == []
+    w.flush()
+    assert messages == [{"type": "append", "text": "a\nb\n"}]
+    assert w._flush_timer is None
+    w.flush()  # Nothing pending
+    assert len(messages) == 1
@@ -0,0 +1,29 @@
+import re
+
+from nbappinator.vuetify3 import VuetifyButtonWidget, VuetifyTabsWidget
+from nbappinator.vuetify3.runtime import VUETIFY_RUNTIME_JS, get_runtime
+
+
+def test_widgets_share_runtime():
+    button, tabs = VuetifyButtonWidget(), VuetifyTabsWidget()
+    assert button._runtime is tabs._runtime is get_runtime()
+    assert button.get_state()["_runtime"] == f"IPY_MODEL_{get_runtime().model_id}"
+    # The loader is no longer shipped in each widget's _esm
+    assert len(button._esm) < len(VUETIFY_RUNTIME_JS) / 4
+
+
+def test_runtime_exports_widget_functions():
+    exports = re.search(r"export \{([^}]*)\}", VUETIFY_RUNTIME_JS)
+    assert exports is not None
+    exported = set(exports.group(1).replace(",", " ").split())
+    for widget in (VuetifyButtonWidget, VuetifyTabsWidget):
+        used = re.search(r"const \{ ([^}]*) \} = await loadVuetifyRuntime", widget._esm)
+        assert used is not None
+        assert {name.strip() for name in used.group(1).split(",")} <= exported
+
+
+def test_runtime_recreated_after_close():
+    runtime = get_runtime()
+    runtime.close()
+    assert get_runtime() is not runtime
+    assert VuetifyButtonWidget()._runtime is get_runtime()